@@ -0,0 +1,96 @@
+"""
+Memory benchmark for entities and devices.
+
+Creates a central with all device types provided by pydevccu and reports the memory
+used per entity. Run with: python -m benchmarks.memory
+"""
+from __future__ import annotations
+
+import asyncio
+import importlib.resources
+import os
+import sys
+import tracemalloc
+from typing import Any
+from unittest.mock import patch
+
+import orjson
+
+from hahomematic.const import Description
+from hahomematic.platforms.device import HmDevice
+from hahomematic.platforms.entity import CallbackEntity
+from tests import helper
+
+# pylint: disable=protected-access
+
+
+def get_all_pydevccu_devices() -> dict[str, str]:
+    """Return the address_device_translation for all device types of pydevccu."""
+    resource_path = os.path.join(
+        str(importlib.resources.files(package="pydevccu")), "device_descriptions"
+    )
+    address_device_translation: dict[str, str] = {}
+    for filename in sorted(os.listdir(resource_path)):
+        with open(os.path.join(resource_path, filename), encoding="utf-8") as fptr:
+            device_descriptions = orjson.loads(fptr.read())
+        for device_description in device_descriptions:
+            if not device_description.get(Description.PARENT):
+                address_device_translation[device_description[Description.ADDRESS]] = filename
+    return address_device_translation
+
+
+def get_object_size(obj: Any) -> int:
+    """Return the size of the object layout incl. __dict__ and callback lists."""
+    size = sys.getsizeof(obj)
+    if (obj_dict := getattr(obj, "__dict__", None)) is not None:
+        size += sys.getsizeof(obj_dict)
+    if isinstance(obj, CallbackEntity):
+        for callbacks in (obj._update_callbacks, obj._remove_callbacks):
+            if callbacks is not None:
+                size += sys.getsizeof(callbacks)
+    return size
+
+
+def get_entities(devices: tuple[HmDevice, ...]) -> list[CallbackEntity]:
+    """Return all entities and events of the devices."""
+    entities: list[CallbackEntity] = []
+    for device in devices:
+        entities.extend(device.get_all_entities())
+        entities.extend(device.generic_events.values())
+    return entities
+
+
+async def run_benchmark() -> dict[str, Any]:
+    """Create all devices and return the memory usage."""
+    factory = helper.Factory(client_session=None)
+    tracemalloc.start()
+    central, _ = await factory.get_default_central(
+        address_device_translation=get_all_pydevccu_devices(), do_mock_client=False
+    )
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    entities = get_entities(devices=central.devices)
+    entity_layout = sum(get_object_size(entity) for entity in entities)
+    device_layout = sum(get_object_size(device) for device in central.devices)
+    result = {
+        "devices": len(central.devices),
+        "entities": len(entities),
+        "entities_with_dict": sum(1 for entity in entities if hasattr(entity, "__dict__")),
+        "bytes_per_entity_layout": round(entity_layout / len(entities), 1),
+        "bytes_per_device_layout": round(device_layout / len(central.devices), 1),
+        "bytes_per_entity_allocated": round(allocated / len(entities), 1),
+    }
+    await central.stop()
+    await central.clear_caches()
+    patch.stopall()
+    return result
+
+
+def main() -> None:
+    """Run the memory benchmark and print the result as json."""
+    print(orjson.dumps(asyncio.run(run_benchmark()), option=orjson.OPT_INDENT_2).decode())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Replay benchmark for recorded events.
+
+Feeds an event trace, that has been recorded with hahomematic.performance.EVENT_RECORDER,
+into a central with a local client at recorded or accelerated speed,
+and reports the event throughput, the dispatch latency and the cpu profile as json.
+The devices of the trace are mapped to pydevccu devices with a json mapping file
+of the form {interface_id: {trace device address: pydevccu device address}}.
+Events of unmapped devices are skipped. Without mapping, the trace must use
+the addresses of the pydevccu devices.
+Run with: python -m benchmarks.replay TRACE [--speed 0] [--mapping mapping.json]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import cProfile
+import io
+import math
+import pstats
+import time
+from typing import Any
+from unittest.mock import patch
+
+import orjson
+
+from benchmarks.memory import get_all_pydevccu_devices
+from hahomematic.central import CentralUnit
+from hahomematic.performance import read_event_trace
+from hahomematic.support import get_device_address
+from tests import helper
+
+DEFAULT_PROFILE_ENTRIES = 25
+
+
+def map_events(
+    events: list[tuple[float, str, str, str, Any]],
+    address_mapping: dict[str, dict[str, str]] | None,
+) -> tuple[list[tuple[float, str, str, Any]], int]:
+    """
+    Map the events of the trace to the pydevccu devices.
+
+    Return the mapped events as (offset, channel_address, parameter, value)
+    and the number of skipped events.
+    """
+    mapped_events: list[tuple[float, str, str, Any]] = []
+    skipped = 0
+    for offset, interface_id, channel_address, parameter, value in events:
+        if address_mapping is not None:
+            device_address = get_device_address(address=channel_address)
+            if (
+                pydevccu_address := address_mapping.get(interface_id, {}).get(device_address)
+            ) is None:
+                skipped += 1
+                continue
+            channel_address = pydevccu_address + channel_address[len(device_address) :]
+        mapped_events.append((offset, channel_address, parameter, value))
+    return mapped_events, skipped
+
+
+async def replay_events(
+    central: CentralUnit,
+    interface_id: str,
+    events: list[tuple[float, str, str, Any]],
+    speed: float,
+) -> list[float]:
+    """
+    Replay the mapped events and return the dispatch latency of each event.
+
+    A speed of 1.0 replays at recorded speed, a speed of 0 as fast as possible.
+    The pydevccu devices are served by the interface of the local client.
+    """
+    latencies: list[float] = []
+    replay_started = time.perf_counter()
+    for offset, channel_address, parameter, value in events:
+        if speed > 0 and (delay := offset / speed - (time.perf_counter() - replay_started)) > 0:
+            await asyncio.sleep(delay)
+        started = time.perf_counter()
+        central.event(interface_id, channel_address, parameter, value)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def get_percentile(durations: list[float], percentile: float) -> float:
+    """Return the percentile of the sorted durations."""
+    return durations[max(math.ceil(percentile / 100 * len(durations)) - 1, 0)]
+
+
+async def run_benchmark(
+    trace_path: str,
+    speed: float = 0.0,
+    address_mapping: dict[str, dict[str, str]] | None = None,
+    profile_entries: int = DEFAULT_PROFILE_ENTRIES,
+) -> dict[str, Any]:
+    """Replay the trace file and return the result."""
+    events, skipped_events = map_events(
+        events=read_event_trace(trace_path), address_mapping=address_mapping
+    )
+    address_device_translation = get_all_pydevccu_devices()
+    if address_mapping is not None:
+        address_device_translation = {
+            pydevccu_address: address_device_translation[pydevccu_address]
+            for device_mapping in address_mapping.values()
+            for pydevccu_address in device_mapping.values()
+        }
+    factory = helper.Factory(client_session=None)
+    central, client = await factory.get_default_central(
+        address_device_translation=address_device_translation,
+        do_mock_client=False,
+    )
+    try:
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        profiler.enable()
+        latencies = await replay_events(
+            central=central, interface_id=client.interface_id, events=events, speed=speed
+        )
+        profiler.disable()
+        seconds = time.perf_counter() - started
+    finally:
+        await central.stop()
+        await central.clear_caches()
+        patch.stopall()
+
+    profile = io.StringIO()
+    pstats.Stats(profiler, stream=profile).sort_stats("cumulative").print_stats(profile_entries)
+    latencies.sort()
+    return {
+        "events": len(events),
+        "skipped_events": skipped_events,
+        "recorded_seconds": events[-1][0] if events else 0.0,
+        "speed": speed,
+        "seconds": round(seconds, 4),
+        "events_per_second": round(len(events) / seconds, 1) if seconds > 0 else 0.0,
+        "dispatch_latency": {
+            "p50": get_percentile(latencies, 50.0),
+            "p99": get_percentile(latencies, 99.0),
+            "max": latencies[-1],
+        }
+        if latencies
+        else {},
+        "profile": profile.getvalue().splitlines(),
+    }
+
+
+def main() -> None:
+    """Run the replay benchmark and print the result as json."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("trace", help="trace file recorded by the event recorder")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=0.0,
+        help="replay speed, 1.0 for recorded speed, 0 for as fast as possible",
+    )
+    parser.add_argument(
+        "--mapping", help="json file with the mapping of trace addresses to pydevccu devices"
+    )
+    parser.add_argument("--profile-entries", type=int, default=DEFAULT_PROFILE_ENTRIES)
+    args = parser.parse_args()
+
+    address_mapping: dict[str, dict[str, str]] | None = None
+    if args.mapping:
+        with open(args.mapping, "rb") as fptr:
+            address_mapping = orjson.loads(fptr.read())
+    result = asyncio.run(
+        run_benchmark(
+            trace_path=args.trace,
+            speed=args.speed,
+            address_mapping=address_mapping,
+            profile_entries=args.profile_entries,
+        )
+    )
+    print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+"""
+Scaling benchmark for large installations.
+
+Synthesizes installations by cloning the device types of pydevccu with unique addresses
+and reports startup time, peak RSS, entity creation throughput, cache save and load time
+and event dispatch throughput as json.
+Each installation size runs in its own process, so the peak RSS is not shared.
+Run with: python -m benchmarks.scaling [--sizes 100 1000 5000 10000] [--output result.json]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib.resources
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+from typing import Any
+from unittest.mock import PropertyMock, patch
+
+import orjson
+
+from hahomematic.central import CentralConfig, CentralUnit
+from hahomematic.client import InterfaceConfig, _ClientConfig
+from hahomematic.const import (
+    Description,
+    InterfaceName,
+    Parameter,
+    ParameterType,
+    ParamsetKey,
+    ProxyInitState,
+)
+from hahomematic.platforms.generic.entity import GenericEntity
+from hahomematic_support.client_local import ClientLocal, LocalRessources
+from tests import const, helper
+
+# pylint: disable=protected-access
+
+DEFAULT_SIZES: tuple[int, ...] = (100, 1000, 5000, 10000)
+DEFAULT_EVENTS = 50000
+SYNTHETIC_ADDRESS_PREFIX = "SYN"
+# events of these parameters start a reload of the paramset descriptions from the backend
+EXCLUDED_EVENT_PARAMETERS: tuple[str, ...] = (Parameter.CONFIG_PENDING,)
+
+
+class SyntheticInstallation:
+    """Installation with cloned pydevccu device types and unique addresses."""
+
+    def __init__(self, device_count: int) -> None:
+        """Init the synthetic installation."""
+        self.device_descriptions: list[dict[str, Any]] = []
+        # {address, {paramset_key, paramset_description}}
+        self.paramset_descriptions: dict[str, dict[str, Any]] = {}
+        templates = _load_templates()
+        for index in range(device_count):
+            device_address, raw_device, raw_paramsets = templates[index % len(templates)]
+            new_address = f"{SYNTHETIC_ADDRESS_PREFIX}{index:07d}".encode()
+            self.device_descriptions.extend(
+                orjson.loads(raw_device.replace(device_address, new_address))
+            )
+            self.paramset_descriptions.update(
+                orjson.loads(raw_paramsets.replace(device_address, new_address))
+            )
+
+
+class SyntheticClient(ClientLocal):
+    """Local client, that serves the descriptions of a synthetic installation."""
+
+    def __init__(self, client_config: _ClientConfig, installation: SyntheticInstallation) -> None:
+        """Init the synthetic client."""
+        super().__init__(
+            client_config=client_config,
+            local_resources=LocalRessources(
+                address_device_translation={}, ignore_devices_on_create=[]
+            ),
+        )
+        self._installation = installation
+
+    async def get_all_device_descriptions(self) -> Any:
+        """Return the device descriptions of the synthetic installation."""
+        return self._installation.device_descriptions
+
+    async def _get_paramset_description(self, address: str, paramset_key: str) -> Any:
+        """Return a paramset description of the synthetic installation."""
+        return self._installation.paramset_descriptions.get(address, {}).get(paramset_key)
+
+    async def proxy_init(self) -> ProxyInitState:
+        """Init the proxy, and announce the devices like the backend does with newDevices."""
+        await self.central.add_new_devices(
+            interface_id=self.interface_id,
+            device_descriptions=self._installation.device_descriptions,
+        )
+        return ProxyInitState.INIT_SUCCESS
+
+
+def _load_templates() -> list[tuple[bytes, bytes, bytes]]:
+    """Return the address and the raw descriptions of all device types of pydevccu."""
+    package_path = str(importlib.resources.files(package="pydevccu"))
+    templates: list[tuple[bytes, bytes, bytes]] = []
+    for filename in sorted(os.listdir(os.path.join(package_path, "device_descriptions"))):
+        with open(os.path.join(package_path, "device_descriptions", filename), "rb") as fptr:
+            raw_device = fptr.read()
+        with open(os.path.join(package_path, "paramset_descriptions", filename), "rb") as fptr:
+            raw_paramsets = fptr.read()
+        for device_description in orjson.loads(raw_device):
+            if not device_description.get(Description.PARENT):
+                templates.append(
+                    (device_description[Description.ADDRESS].encode(), raw_device, raw_paramsets)
+                )
+                break
+    return templates
+
+
+async def create_central(installation: SyntheticInstallation) -> CentralUnit:
+    """Create a central for the synthetic installation."""
+    factory = helper.Factory(client_session=None)
+    interface_config = InterfaceConfig(
+        central_name=const.CENTRAL_NAME,
+        interface=InterfaceName.BIDCOS_RF,
+        port=2002,
+    )
+    central = await factory.get_raw_central(interface_config=interface_config)
+    client = SyntheticClient(
+        client_config=_ClientConfig(
+            central=central,
+            interface_config=interface_config,
+            local_ip="127.0.0.1",
+        ),
+        installation=installation,
+    )
+    await client.init_client()
+    patch("hahomematic.central.CentralUnit._get_primary_client", return_value=client).start()
+    patch("hahomematic.client._ClientConfig.get_client", return_value=client).start()
+    patch(
+        "hahomematic.central.CentralUnit._identify_callback_ip", return_value="127.0.0.1"
+    ).start()
+    # start like a central with a backend, but without xml-rpc server and connection checker
+    central.config.start_direct = False
+    patch.object(
+        CentralConfig, "enable_server", new_callable=PropertyMock, return_value=False
+    ).start()
+    return central
+
+
+def get_event_values(entity: GenericEntity) -> tuple[Any, Any]:
+    """Return two distinct raw values of the entity to generate events."""
+    if entity.hmtype in (ParameterType.ACTION, ParameterType.BOOL):
+        return True, False
+    if entity.hmtype in (ParameterType.FLOAT, ParameterType.INTEGER) and entity.min != entity.max:
+        return entity.min, entity.max
+    if entity.hmtype == ParameterType.STRING:
+        return "a", "b"
+    return 0, 1
+
+
+def dispatch_events(central: CentralUnit, event_count: int) -> dict[str, Any]:
+    """Dispatch events to all entities with events and return the throughput."""
+    events: list[tuple[str, str, str, tuple[Any, Any]]] = [
+        (
+            entity.device.interface_id,
+            entity.channel_address,
+            entity.parameter,
+            get_event_values(entity=entity),
+        )
+        for device in central.devices
+        for entity in device.generic_entities.values()
+        if entity.paramset_key == ParamsetKey.VALUES
+        and entity.supports_events
+        and entity.parameter not in EXCLUDED_EVENT_PARAMETERS
+    ]
+    if not events:
+        return {"events": 0, "seconds": 0.0, "events_per_second": 0.0}
+    started = time.perf_counter()
+    for index in range(event_count):
+        interface_id, channel_address, parameter, values = events[index % len(events)]
+        central.event(interface_id, channel_address, parameter, values[(index // len(events)) % 2])
+    seconds = time.perf_counter() - started
+    return {
+        "events": event_count,
+        "seconds": round(seconds, 4),
+        "events_per_second": round(event_count / seconds, 1),
+    }
+
+
+async def run_benchmark(device_count: int, event_count: int = DEFAULT_EVENTS) -> dict[str, Any]:
+    """Run the benchmark for an installation with the number of devices."""
+    installation = SyntheticInstallation(device_count=device_count)
+    central = await create_central(installation=installation)
+    try:
+        started = time.perf_counter()
+        await central.start()
+        startup_seconds = time.perf_counter() - started
+
+        entity_count = len(central._entities)
+        started = time.perf_counter()
+        await central.device_descriptions.save()
+        await central.paramset_descriptions.save()
+        cache_save_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        await central.device_descriptions.load()
+        await central.paramset_descriptions.load()
+        cache_load_seconds = time.perf_counter() - started
+
+        return {
+            "devices": len(central.devices),
+            "entities": entity_count,
+            "startup_seconds": round(startup_seconds, 4),
+            "entities_per_second": round(entity_count / startup_seconds, 1),
+            "cache_save_seconds": round(cache_save_seconds, 4),
+            "cache_load_seconds": round(cache_load_seconds, 4),
+            "event_dispatch": dispatch_events(central=central, event_count=event_count),
+            "startup_report": central.startup_report,
+            # ru_maxrss is reported in kilobytes on linux
+            "peak_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+        }
+    finally:
+        await central.stop()
+        await central.clear_caches()
+        patch.stopall()
+
+
+def run_in_process(device_count: int, event_count: int) -> dict[str, Any]:
+    """Run the benchmark for one installation size in a separate process."""
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.scaling",
+            "--single",
+            str(device_count),
+            "--events",
+            str(event_count),
+        ],
+        capture_output=True,
+        check=True,
+    )
+    return orjson.loads(completed.stdout)  # type: ignore[no-any-return]
+
+
+def main() -> None:
+    """Run the scaling benchmark and print or write the result as json."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--events", type=int, default=DEFAULT_EVENTS)
+    parser.add_argument("--output", help="file to write the json result to")
+    parser.add_argument("--single", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single is not None:
+        result: dict[str, Any] = asyncio.run(
+            run_benchmark(device_count=args.single, event_count=args.events)
+        )
+        sys.stdout.buffer.write(orjson.dumps(result))
+        return
+
+    result = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "installations": [
+            run_in_process(device_count=size, event_count=args.events) for size in args.sizes
+        ],
+    }
+    output = orjson.dumps(result, option=orjson.OPT_INDENT_2)
+    if args.output:
+        with open(args.output, "wb") as fptr:
+            fptr.write(output)
+    else:
+        print(output.decode())
+
+
+if __name__ == "__main__":
+    main()
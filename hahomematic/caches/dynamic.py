@@ -1,12 +1,15 @@
 """Module for the dynamic caches."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Collection
 from datetime import datetime
 import logging
 from typing import Any, Final
 
 from hahomematic import central as hmcu
 from hahomematic.const import (
+    DEFAULT_MAX_CONCURRENT_REFRESHES,
     INIT_DATETIME,
     MAX_CACHE_AGE,
     NO_CACHE_ENTRY,
@@ -14,6 +17,7 @@ from hahomematic.const import (
     InterfaceName,
 )
 from hahomematic.platforms.device import HmDevice
+from hahomematic.platforms.generic.entity import GenericEntity
 from hahomematic.support import get_device_address, updated_within_seconds
 
 _LOGGER: Final = logging.getLogger(__name__)
@@ -38,16 +42,23 @@ class DeviceDetailsCache:
         if updated_within_seconds(last_update=self._last_updated, max_age=(MAX_CACHE_AGE / 2)):
             return
         self.clear()
-        _LOGGER.debug("load: Loading names for %s", self._central.name)
-        if client := self._central.primary_client:
-            await client.fetch_device_details()
-        _LOGGER.debug("load: Loading rooms for %s", self._central.name)
+        client = self._central.primary_client
+        _LOGGER.debug("load: Loading names, rooms and functions for %s", self._central.name)
+        if client and (device_metadata := await client.fetch_device_metadata()) is not None:
+            channel_rooms, functions = device_metadata
+        else:
+            _LOGGER.debug("load: Loading names for %s", self._central.name)
+            if client:
+                await client.fetch_device_details()
+            _LOGGER.debug("load: Loading rooms for %s", self._central.name)
+            channel_rooms = await self._get_all_rooms()
+            _LOGGER.debug("load: Loading functions for %s", self._central.name)
+            functions = await self._get_all_functions()
         self._channel_rooms.clear()
-        self._channel_rooms.update(await self._get_all_rooms())
+        self._channel_rooms.update(channel_rooms)
         self._identify_device_room()
-        _LOGGER.debug("load: Loading functions for %s", self._central.name)
         self._functions.clear()
-        self._functions.update(await self._get_all_functions())
+        self._functions.update(functions)
         self._last_updated = datetime.now()
 
     @property
@@ -136,38 +147,65 @@ class CentralDataCache:
     def __init__(self, central: hmcu.CentralUnit) -> None:
         """Init the central data cache."""
         self._central: Final = central
-        # { key, value}
-        self._value_cache: Final[dict[str, Any]] = {}
-        self._last_updated = INIT_DATETIME
+        # { interface, {key, value}}
+        self._value_cache: Final[dict[str, dict[str, Any]]] = {}
+        # { interface, last_updated}
+        self._last_updated: Final[dict[str, datetime]] = {}
 
     @property
     def is_empty(self) -> bool:
         """Return if cache is empty."""
-        if len(self._value_cache) == 0:
-            return True
-        if not updated_within_seconds(last_update=self._last_updated):
-            self.clear()
-            return True
-        return False
+        return all(
+            self._is_interface_empty(interface=interface) for interface in tuple(self._value_cache)
+        )
 
-    async def load(self) -> None:
-        """Fetch data from backend."""
-        if updated_within_seconds(last_update=self._last_updated, max_age=(MAX_CACHE_AGE / 2)):
-            return
-        self.clear()
-        _LOGGER.debug("load: device data for %s", self._central.name)
+    async def load(self, interface_ids: Collection[str] | None = None) -> None:
+        """
+        Fetch data from backend.
+
+        If interface_ids are given, only the data of these interfaces is reloaded.
+        """
         for client in self._central.clients:
+            if interface_ids is not None and client.interface_id not in interface_ids:
+                continue
+            if updated_within_seconds(
+                last_update=self._last_updated.get(client.interface, INIT_DATETIME),
+                max_age=(MAX_CACHE_AGE / 2),
+            ):
+                continue
+            self._clear_interface(interface=client.interface)
+            _LOGGER.debug("load: device data for %s, %s", self._central.name, client.interface_id)
             await client.fetch_all_device_data()
 
-    async def refresh_entity_data(self, paramset_key: str | None = None) -> None:
-        """Refresh entity data."""
-        for entity in self._central.get_readable_generic_entities(paramset_key=paramset_key):
-            await entity.load_entity_value(call_source=CallSource.HM_INIT)
+    async def refresh_entity_data(
+        self, paramset_key: str | None = None, interface_ids: Collection[str] | None = None
+    ) -> None:
+        """
+        Refresh entity data with concurrent entities.
 
-    def add_data(self, all_device_data: dict[str, Any]) -> None:
-        """Add data to cache."""
-        self._value_cache.update(all_device_data)
-        self._last_updated = datetime.now()
+        If interface_ids are given, only the entities of these interfaces are refreshed.
+        Entities, that have been updated since the last init of their interface, are skipped.
+        """
+        semaphore = asyncio.Semaphore(DEFAULT_MAX_CONCURRENT_REFRESHES)
+
+        async def load_entity_value(entity: GenericEntity) -> None:
+            async with semaphore:
+                await entity.load_entity_value(call_source=CallSource.HM_INIT)
+
+        entities = self._central.get_readable_generic_entities(paramset_key=paramset_key)
+        if interface_ids is not None:
+            entities = [
+                entity
+                for entity in entities
+                if entity.device.interface_id in interface_ids
+                and entity.last_update <= entity.device.client.last_initialized
+            ]
+        await asyncio.gather(*(load_entity_value(entity=entity) for entity in entities))
+
+    def add_data(self, interface: str, all_device_data: dict[str, Any]) -> None:
+        """Add data of an interface to cache."""
+        self._value_cache.setdefault(interface, {}).update(all_device_data)
+        self._last_updated[interface] = datetime.now()
 
     def get_data(
         self,
@@ -176,12 +214,28 @@ class CentralDataCache:
         parameter: str,
     ) -> Any:
         """Get data from cache."""
-        if not self.is_empty:
+        if not self._is_interface_empty(interface=interface):
             key = f"{interface}.{channel_address.replace(':','%3A')}.{parameter}"
-            return self._value_cache.get(key, NO_CACHE_ENTRY)
+            return self._value_cache[interface].get(key, NO_CACHE_ENTRY)
         return NO_CACHE_ENTRY
 
     def clear(self) -> None:
         """Clear the cache."""
         self._value_cache.clear()
-        self._last_updated = INIT_DATETIME
+        self._last_updated.clear()
+
+    def _clear_interface(self, interface: str) -> None:
+        """Clear the cache of an interface."""
+        self._value_cache.pop(interface, None)
+        self._last_updated.pop(interface, None)
+
+    def _is_interface_empty(self, interface: str) -> bool:
+        """Return if the cache of an interface is empty, and clear outdated data."""
+        if not self._value_cache.get(interface):
+            return True
+        if not updated_within_seconds(
+            last_update=self._last_updated.get(interface, INIT_DATETIME)
+        ):
+            self._clear_interface(interface=interface)
+            return True
+        return False
@@ -11,7 +11,6 @@ import orjson
 
 from hahomematic import central as hmcu
 from hahomematic.const import (
-    DEFAULT_ENCODING,
     FILE_DEVICES,
     FILE_PARAMSETS,
     INIT_DATETIME,
@@ -20,6 +19,7 @@ from hahomematic.const import (
     Operations,
     ParamsetKey,
 )
+from hahomematic.performance import CACHE_FILE_BYTES_LOADED
 from hahomematic.platforms.device import HmDevice
 from hahomematic.support import (
     Channel,
@@ -80,10 +80,12 @@ class BasePersistentCache(ABC):
                 return DataOperationResult.NO_LOAD
             with open(
                 file=os.path.join(self._cache_dir, self._filename),
-                encoding=DEFAULT_ENCODING,
+                mode="rb",
             ) as fptr:
-                self._persistant_cache.clear()
-                self._persistant_cache.update(orjson.loads(fptr.read()))
+                data = fptr.read()
+            CACHE_FILE_BYTES_LOADED.inc(self._filename, amount=len(data))
+            self._persistant_cache.clear()
+            self._persistant_cache.update(orjson.loads(data))
             return DataOperationResult.LOAD_SUCCESS
 
         return await self._central.async_add_executor_job(_load)
@@ -134,6 +136,32 @@ class DeviceDescriptionCache(BasePersistentCache):
             interface_id=interface_id, device_description=device_description
         )
 
+    def update_device_description(
+        self, interface_id: str, device_description: dict[str, Any]
+    ) -> bool:
+        """
+        Update the device_description in cache, and return if it has changed.
+
+        The channels of a known device are kept. Unknown device_descriptions are added.
+        """
+        address = device_description[Description.ADDRESS]
+        if (
+            known_description := self.get_device(interface_id=interface_id, device_address=address)
+        ) == device_description:
+            return False
+        if not known_description:
+            self.add_device_description(
+                interface_id=interface_id, device_description=device_description
+            )
+            return True
+        raw_device_descriptions = self._raw_device_descriptions[interface_id]
+        for index, raw_device in enumerate(raw_device_descriptions):
+            if raw_device[Description.ADDRESS] == address:
+                raw_device_descriptions[index] = device_description
+                break
+        self._device_descriptions[interface_id][address] = device_description
+        return True
+
     def get_raw_device_descriptions(self, interface_id: str) -> list[dict[str, Any]]:
         """Find raw device in cache."""
         return self._raw_device_descriptions.get(interface_id, [])
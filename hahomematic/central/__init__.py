@@ -6,12 +6,14 @@ This is the python representation of a CCU.
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine
+from collections.abc import Awaitable, Callable, Collection, Coroutine, Iterable, Mapping
 from concurrent.futures._base import CancelledError
 from datetime import datetime
 import logging
+import random
 import socket
 import threading
+import time
 from typing import Any, Final, TypeVar, cast
 
 from aiohttp import ClientSession
@@ -24,10 +26,14 @@ from hahomematic.caches.persistent import DeviceDescriptionCache, ParamsetDescri
 from hahomematic.caches.visibility import ParameterVisibilityCache
 from hahomematic.central import xml_rpc_server as xmlrpc
 from hahomematic.central.decorators import callback_event, callback_system_event
+from hahomematic.central.refresh_scheduler import RefreshScheduler
 from hahomematic.client.json_rpc import JsonRpcAioHttpClient
 from hahomematic.client.xml_rpc import XmlRpcProxy
 from hahomematic.config import PING_PONG_MISMATCH_COUNT
 from hahomematic.const import (
+    DEFAULT_DEVICE_DEFINITIONS_ARCHIVE,
+    DEFAULT_MAX_CONCURRENT_JSON_RPC_REQUESTS,
+    DEFAULT_MAX_CONCURRENT_WRITES,
     DEFAULT_TLS,
     DEFAULT_VERIFY_TLS,
     EVENT_AVAILABLE,
@@ -35,6 +41,7 @@ from hahomematic.const import (
     EVENT_INSTANCE_NAME,
     EVENT_INTERFACE_ID,
     EVENT_TYPE,
+    SYSVAR_ADDRESS,
     Description,
     DeviceFirmwareState,
     EntityUsage,
@@ -45,6 +52,7 @@ from hahomematic.const import (
     Parameter,
     ParamsetKey,
     ProxyInitState,
+    RefreshJob,
     SystemEvent,
     SystemInformation,
 )
@@ -54,11 +62,19 @@ from hahomematic.exceptions import (
     NoClients,
     NoConnection,
 )
-from hahomematic.performance import measure_execution_time
+from hahomematic.performance import (
+    EVENT_DISPATCH_SECONDS,
+    EVENT_TRACER,
+    EVENTS_RECEIVED,
+    LoopLagMonitor,
+    StartupTimeline,
+    get_callback_name,
+    measure_execution_time,
+)
 from hahomematic.platforms import create_entities_and_append_to_device
 from hahomematic.platforms.custom.entity import CustomEntity
-from hahomematic.platforms.device import HmDevice
-from hahomematic.platforms.entity import BaseEntity
+from hahomematic.platforms.device import HmDevice, export_device_definitions
+from hahomematic.platforms.entity import BaseEntity, CallParameterCollector
 from hahomematic.platforms.event import GenericEvent
 from hahomematic.platforms.generic.entity import GenericEntity, WrapperEntity
 from hahomematic.platforms.hub import Hub
@@ -66,6 +82,7 @@ from hahomematic.platforms.hub.button import HmProgramButton
 from hahomematic.platforms.hub.entity import GenericHubEntity, GenericSystemVariable
 from hahomematic.platforms.update import HmUpdate
 from hahomematic.support import (
+    cancel_task,
     check_or_create_directory,
     check_password,
     get_device_address,
@@ -77,6 +94,13 @@ _LOGGER: Final = logging.getLogger(__name__)
 _R = TypeVar("_R")
 _T = TypeVar("_T")
 
+# Interval divisor of the connection checker, if an interface has an issue.
+_ISSUE_INTERVAL_DIVISOR: Final = 3
+# Relative jitter of the connection checker interval.
+_INTERVAL_JITTER: Final = 0.1
+# Max number of connection checks, that skip the probe of an interface with recent events.
+_MAX_SKIPPED_PROBES: Final = 8
+
 # {instance_name, central}
 CENTRAL_INSTANCES: Final[dict[str, CentralUnit]] = {}
 ConnectionProblemIssuer = JsonRpcAioHttpClient | XmlRpcProxy
@@ -168,8 +192,15 @@ class CentralUnit:
 
         CENTRAL_INSTANCES[self._name] = self
         self._connection_checker: Final = ConnectionChecker(self)
+        # optional monitor of the event loop lag, started on demand
+        self.loop_lag_monitor: Final = LoopLagMonitor(name=self._name)
+        # optional scheduler of the background refresh, started with the connection checker
+        self.refresh_scheduler: Final = RefreshScheduler(
+            central=self, intervals=central_config.refresh_intervals or {}
+        )
         self._hub: Hub = Hub(central=self)
         self._version: str | None = None
+        self._startup_report: dict[str, Any] | None = None
 
     @property
     def available(self) -> bool:
@@ -194,8 +225,6 @@ class CentralUnit:
     @property
     def _has_active_threads(self) -> bool:
         """Return if active sub threads are alive."""
-        if self._connection_checker.is_alive():
-            return True
         if (
             self._xml_rpc_server
             and self._xml_rpc_server.no_central_registered
@@ -240,6 +269,11 @@ class CentralUnit:
         """Return the name of the backend."""
         return self._name
 
+    @property
+    def startup_report(self) -> dict[str, Any] | None:
+        """Return the report of the last startup of the clients."""
+        return self._startup_report
+
     @property
     def supports_ping_pong(self) -> bool:
         """Return the backend supports ping pong."""
@@ -270,23 +304,32 @@ class CentralUnit:
         if self._started:
             _LOGGER.debug("START: Central %s already started", self._name)
             return
-        await self.parameter_visibility.load()
+        timeline = self._create_startup_timeline()
+        with timeline.phase("load_parameter_visibility"):
+            await self.parameter_visibility.load()
         if self.config.start_direct:
-            if await self._create_clients():
-                for client in self._clients.values():
-                    await self._refresh_device_descriptions(client=client)
+            with timeline.phase("create_clients"):
+                clients_created = await self._create_clients()
+            if clients_created:
+                with timeline.phase("refresh_device_descriptions"):
+                    for client in self._clients.values():
+                        await self._refresh_device_descriptions(client=client)
         else:
-            await self._start_clients()
+            await self._start_clients(timeline=timeline)
             if self.config.enable_server:
                 self._start_connection_checker()
+                self.refresh_scheduler.start()
         self._started = True
+        self._publish_startup_report(timeline=timeline)
 
     async def stop(self) -> None:
         """Stop processing of the central unit."""
         if not self._started:
             _LOGGER.debug("STOP: Central %s not started", self._name)
             return
-        self._stop_connection_checker()
+        await self._stop_connection_checker()
+        await self.refresh_scheduler.stop()
+        await self.loop_lag_monitor.stop()
         await self._stop_clients()
         if self.json_rpc_client.is_activated:
             await self.json_rpc_client.logout()
@@ -315,15 +358,14 @@ class CentralUnit:
     async def restart_clients(self) -> None:
         """Restart clients."""
         await self._stop_clients()
-        await self._start_clients()
+        timeline = self._create_startup_timeline()
+        await self._start_clients(timeline=timeline)
+        self._publish_startup_report(timeline=timeline)
 
     async def refresh_firmware_data(self, device_address: str | None = None) -> None:
         """Refresh device firmware data."""
         if device_address and (device := self.get_device(address=device_address)):
-            await self._refresh_device_descriptions(
-                client=device.client, device_address=device_address
-            )
-            device.refresh_firmware_data()
+            await self._refresh_firmware_data_of_devices(devices=[device])
         else:
             for client in self._clients.values():
                 await self._refresh_device_descriptions(client=client)
@@ -334,36 +376,91 @@ class CentralUnit:
         self, device_firmware_states: tuple[DeviceFirmwareState, ...]
     ) -> None:
         """Refresh device firmware data for processing devices."""
-        for device in [
-            device_in_state
-            for device_in_state in self._devices.values()
-            if device_in_state.firmware_update_state in device_firmware_states
-        ]:
-            await self.refresh_firmware_data(device_address=device.device_address)
-
-    async def _refresh_device_descriptions(
-        self, client: hmcl.Client, device_address: str | None = None
-    ) -> None:
-        """Refresh device descriptions."""
-        if (
-            device_descriptions := await client.get_device_descriptions(
-                device_address=device_address
+        await self._refresh_firmware_data_of_devices(
+            devices=[
+                device_in_state
+                for device_in_state in self._devices.values()
+                if device_in_state.firmware_update_state in device_firmware_states
+            ]
+        )
+
+    async def _refresh_firmware_data_of_devices(self, devices: Collection[HmDevice]) -> None:
+        """
+        Refresh the firmware data of known devices.
+
+        The device descriptions are fetched with one batch per interface,
+        and the device description cache is saved once, if a description has changed.
+        """
+        if not devices:
+            return
+        # {interface_id, [device_address]}
+        device_addresses: dict[str, list[str]] = {}
+        for device in devices:
+            device_addresses.setdefault(device.interface_id, []).append(device.device_address)
+        interface_ids = [
+            interface_id for interface_id in device_addresses if interface_id in self._clients
+        ]
+        results = await asyncio.gather(
+            *(
+                self._clients[interface_id].get_device_descriptions_batch(
+                    device_addresses=device_addresses[interface_id]
+                )
+                for interface_id in interface_ids
             )
-            if device_address
-            else await client.get_all_device_descriptions()
-        ):
+        )
+        async with self._sema_add_devices:
+            has_changes = False
+            for interface_id, device_descriptions in zip(interface_ids, results, strict=True):
+                for device_description in device_descriptions:
+                    has_changes |= self.device_descriptions.update_device_description(
+                        interface_id=interface_id, device_description=device_description
+                    )
+            if has_changes:
+                await self.device_descriptions.save()
+        for device in devices:
+            device.refresh_firmware_data()
+
+    async def _refresh_device_descriptions(self, client: hmcl.Client) -> None:
+        """Refresh device descriptions."""
+        if device_descriptions := await client.get_all_device_descriptions():
             await self._add_new_devices(
                 interface_id=client.interface_id,
                 device_descriptions=device_descriptions,
             )
 
-    async def _start_clients(self) -> None:
+    async def _start_clients(self, timeline: StartupTimeline) -> None:
         """Start clients ."""
-        if await self._create_clients():
-            await self._load_caches()
-            await self._create_devices()
-            await self._init_hub()
-            await self._init_clients()
+        with timeline.phase("create_clients"):
+            clients_created = await self._create_clients()
+        if clients_created:
+            with timeline.phase("load_caches"):
+                await self._load_caches()
+            with timeline.phase("create_devices"):
+                await self._create_devices()
+            with timeline.phase("init_hub"):
+                await self._init_hub()
+            with timeline.phase("init_clients"):
+                await self._init_clients()
+
+    def _create_startup_timeline(self) -> StartupTimeline:
+        """Create the timeline for a startup of the clients."""
+        return StartupTimeline(
+            name=self._name,
+            interface_ids=tuple(
+                interface_config.interface_id for interface_config in self.config.interface_configs
+            ),
+            get_created_counts=lambda: (len(self._devices), len(self._entities)),
+        )
+
+    def _publish_startup_report(self, timeline: StartupTimeline) -> None:
+        """Store the startup report and fire it as system event."""
+        self._startup_report = report = timeline.get_report()
+        _LOGGER.debug(
+            "PUBLISH_STARTUP_REPORT: Started clients of %s in %.3fs",
+            self._name,
+            report["seconds"],
+        )
+        self.fire_system_event_callback(system_event=SystemEvent.STARTUP_REPORT, report=report)
 
     async def _stop_clients(self) -> None:
         """Stop clients."""
@@ -510,9 +607,9 @@ class CentralUnit:
         )
         self._connection_checker.start()
 
-    def _stop_connection_checker(self) -> None:
-        """Start the connection checker."""
-        self._connection_checker.stop()
+    async def _stop_connection_checker(self) -> None:
+        """Stop the connection checker."""
+        await self._connection_checker.stop()
         _LOGGER.debug(
             "STOP_CONNECTION_CHECKER: Stopped connection_checker for %s",
             self._name,
@@ -639,8 +736,14 @@ class CentralUnit:
             _LOGGER.warning("LOAD_CACHES failed: Unable to load caches for %s", self._name)
             await self.clear_caches()
 
-    async def _create_devices(self) -> None:
-        """Trigger creation of the objects that expose the functionality."""
+    async def _create_devices(
+        self, new_device_addresses: Mapping[str, Collection[str]] | None = None
+    ) -> None:
+        """
+        Trigger creation of the objects that expose the functionality.
+
+        If new_device_addresses are given, only these devices are created.
+        """
         if not self._clients:
             raise HaHomematicException(
                 f"CREATE_DEVICES failed: No clients initialized. Not starting central {self._name}."
@@ -655,8 +758,10 @@ class CentralUnit:
                     interface_id,
                 )
                 continue
-            for device_address in self.device_descriptions.get_addresses(
-                interface_id=interface_id
+            for device_address in (
+                self.device_descriptions.get_addresses(interface_id=interface_id)
+                if new_device_addresses is None
+                else new_device_addresses.get(interface_id, ())
             ):
                 # Do we check for duplicates here? For now, we do.
                 device: HmDevice | None = None
@@ -744,7 +849,12 @@ class CentralUnit:
     async def _add_new_devices(
         self, interface_id: str, device_descriptions: list[dict[str, Any]]
     ) -> None:
-        """Add new devices to central unit."""
+        """
+        Add new devices to central unit, and update the descriptions of known devices.
+
+        Unchanged device descriptions are skipped. Paramset descriptions are only fetched
+        for new and changed channels, and only new devices are created.
+        """
         _LOGGER.debug(
             "ADD_NEW_DEVICES: interface_id = %s, device_descriptions = %s",
             interface_id,
@@ -759,17 +869,30 @@ class CentralUnit:
             return
 
         async with self._sema_add_devices:
-            # We need this list to avoid adding duplicates.
-            known_addresses = [
-                dev_desc[Description.ADDRESS]
-                for dev_desc in self.device_descriptions.get_raw_device_descriptions(interface_id)
-            ]
             client = self._clients[interface_id]
+            has_changed_descriptions = False
+            has_changed_paramsets = False
+            new_device_addresses: set[str] = set()
+            updated_devices: set[HmDevice] = set()
             for dev_desc in device_descriptions:
                 try:
-                    self.device_descriptions.add_device_description(interface_id, dev_desc)
-                    if dev_desc[Description.ADDRESS] not in known_addresses:
+                    address = dev_desc[Description.ADDRESS]
+                    known_dev_desc = self.device_descriptions.get_device(
+                        interface_id=interface_id, device_address=address
+                    )
+                    if not self.device_descriptions.update_device_description(
+                        interface_id=interface_id, device_description=dev_desc
+                    ):
+                        continue
+                    has_changed_descriptions = True
+                    if _has_changed_paramsets(known_dev_desc=known_dev_desc, dev_desc=dev_desc):
                         await client.fetch_paramset_descriptions(dev_desc)
+                        has_changed_paramsets = True
+                    device_address = get_device_address(address)
+                    if device := self._devices.get(device_address):
+                        updated_devices.add(device)
+                    else:
+                        new_device_addresses.add(device_address)
                 except Exception as err:  # pragma: no cover
                     _LOGGER.error(
                         "ADD_NEW_DEVICES failed: %s [%s]",
@@ -777,11 +900,23 @@ class CentralUnit:
                         reduce_args(args=err.args),
                     )
 
+            if not has_changed_descriptions:
+                _LOGGER.debug(
+                    "ADD_NEW_DEVICES: No changed device descriptions for interface_id %s",
+                    interface_id,
+                )
+                return
             await self.device_descriptions.save()
-            await self.paramset_descriptions.save()
-            await self.device_details.load()
-            await self.data_cache.load()
-            await self._create_devices()
+            if has_changed_paramsets:
+                await self.paramset_descriptions.save()
+            for device in updated_devices:
+                device.refresh_firmware_data()
+            if new_device_addresses:
+                await self.device_details.load()
+                await self.data_cache.load()
+                await self._create_devices(
+                    new_device_addresses={interface_id: new_device_addresses}
+                )
 
     @callback_event
     def event(self, interface_id: str, channel_address: str, parameter: str, value: Any) -> None:
@@ -797,15 +932,39 @@ class CentralUnit:
             return
 
         self.last_events[interface_id] = datetime.now()
+        EVENTS_RECEIVED.inc(interface_id)
         # No need to check the response of a XmlRPC-PING
         if parameter == Parameter.PONG:
             if value == interface_id:
                 self._reduce_ping_count(interface_id=interface_id)
             return
+        if channel_address == SYSVAR_ADDRESS:
+            self._hub.sysvar_event(name=parameter, value=value)
+            return
+        if parameter == Parameter.DUTY_CYCLE_LEVEL and isinstance(value, int | float):
+            self._loop.call_soon_threadsafe(
+                self.get_client(interface_id=interface_id).command_scheduler.set_duty_cycle_level,
+                float(value),
+            )
         if (channel_address, parameter) in self._entity_event_subscriptions:
+            started = time.perf_counter()
+            tracing = EVENT_TRACER.enabled
+            if tracing:
+                EVENT_TRACER.record_received()
             try:
-                for callback in self._entity_event_subscriptions[(channel_address, parameter)]:
-                    callback(value)
+                callbacks = self._entity_event_subscriptions[(channel_address, parameter)]
+                if tracing:
+                    EVENT_TRACER.record(stage="routing", started=started)
+                for callback in callbacks:
+                    if tracing:
+                        callback_started = time.perf_counter()
+                        callback(value)
+                        EVENT_TRACER.record(
+                            stage=f"entity_event:{get_callback_name(callback)}",
+                            started=callback_started,
+                        )
+                    else:
+                        callback(value)
             except RuntimeError as rte:  # pragma: no cover
                 _LOGGER.debug(
                     "EVENT: RuntimeError [%s]. Failed to call callback for: %s, %s, %s",
@@ -822,6 +981,7 @@ class CentralUnit:
                     parameter,
                     reduce_args(args=ex.args),
                 )
+            EVENT_DISPATCH_SECONDS.observe(interface_id, value=time.perf_counter() - started)
 
     @callback_system_event(system_event=SystemEvent.LIST_DEVICES)
     def list_devices(self, interface_id: str) -> list[dict[str, Any]]:
@@ -974,12 +1134,43 @@ class CentralUnit:
             _LOGGER.debug(message)
             raise HaHomematicException(message) from err
 
+    async def export_device_definitions(
+        self, device_addresses: Collection[str] | None = None
+    ) -> str:
+        """
+        Export the definitions of all or the given devices into one zip archive.
+
+        Each device type is exported once. Returns the path of the archive.
+        """
+        archive_path = f"{self.config.storage_folder}/{DEFAULT_DEVICE_DEFINITIONS_ARCHIVE}"
+        device_types = await export_device_definitions(
+            central=self,
+            devices=[
+                device
+                for device in self._devices.values()
+                if device_addresses is None or device.device_address in device_addresses
+            ],
+            archive_path=archive_path,
+        )
+        _LOGGER.debug(
+            "EXPORT_DEVICE_DEFINITIONS: Exported %i device types of %s to %s",
+            device_types,
+            self._name,
+            archive_path,
+        )
+        return archive_path
+
     async def execute_program(self, pid: str) -> bool:
         """Execute a program on CCU / Homegear."""
         if client := self.primary_client:
             return await client.execute_program(pid=pid)
         return False
 
+    @property
+    def last_sysvar_event(self) -> datetime:
+        """Return the time of the last system variable pushed by the backend."""
+        return self._hub.last_sysvar_event
+
     async def fetch_sysvar_data(self, include_internal: bool = True) -> None:
         """Fetch sysvar data for the hub."""
         await self._hub.fetch_sysvar_data(include_internal=include_internal)
@@ -988,12 +1179,29 @@ class CentralUnit:
         """Fetch program data for the hub."""
         await self._hub.fetch_program_data(include_internal=include_internal)
 
+    async def refresh_sysvar_data(self) -> None:
+        """Refresh sysvar data for the hub with the include_internal of the last fetch."""
+        await self._hub.refresh_sysvar_data()
+
+    async def refresh_program_data(self) -> None:
+        """Refresh program data for the hub with the include_internal of the last fetch."""
+        await self._hub.refresh_program_data()
+
     @measure_execution_time
-    async def load_and_refresh_entity_data(self, paramset_key: str | None = None) -> None:
-        """Refresh entity data."""
-        if paramset_key != ParamsetKey.MASTER and self.data_cache.is_empty:
-            await self.data_cache.load()
-        await self.data_cache.refresh_entity_data(paramset_key=paramset_key)
+    async def load_and_refresh_entity_data(
+        self, paramset_key: str | None = None, interface_ids: Collection[str] | None = None
+    ) -> None:
+        """
+        Refresh entity data.
+
+        If interface_ids are given, the refresh is limited to the entities of these interfaces,
+        that have not been updated since the last init of their interface.
+        """
+        if paramset_key != ParamsetKey.MASTER:
+            await self.data_cache.load(interface_ids=interface_ids)
+        await self.data_cache.refresh_entity_data(
+            paramset_key=paramset_key, interface_ids=interface_ids
+        )
 
     async def get_system_variable(self, name: str) -> Any | None:
         """Get system variable from CCU / Homegear."""
@@ -1042,6 +1250,31 @@ class CentralUnit:
             return device.generic_entities.get((channel_address, parameter))
         return None
 
+    async def send_values(
+        self,
+        entity_values: Iterable[tuple[GenericEntity, Any]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_WRITES,
+    ) -> dict[str, bool]:
+        """
+        Send the values of generic entities across devices and interfaces as one batch.
+
+        The values are grouped by client and channel, and the channels are sent concurrently.
+        Custom entities can be added to a batch by using a CallParameterCollector as collector.
+        Return the result per unique_identifier of the entities.
+        """
+        collector = CallParameterCollector()
+        entities: list[GenericEntity] = []
+        for entity, value in entity_values:
+            await entity.send_value(value=value, collector=collector)
+            entities.append(entity)
+        results = await collector.send_data_concurrently(max_concurrency=max_concurrency)
+        return {
+            entity.unique_identifier: results.get(
+                (entity.channel_address, entity.parameter), False
+            )
+            for entity in entities
+        }
+
     def get_wrapper_entity(self, channel_address: str, parameter: str) -> WrapperEntity | None:
         """Return the hm wrapper_entity."""
         if device := self.get_device(address=channel_address):
@@ -1181,36 +1414,52 @@ class CentralUnit:
         return f"central name: {self.name}"
 
 
-class ConnectionChecker(threading.Thread):
-    """Periodically check Connection to CCU / Homegear."""
+class ConnectionChecker:
+    """
+    Periodically check connection to CCU / Homegear.
+
+    The interfaces are checked concurrently within an asyncio task.
+    The probe of an interface is skipped, if it has delivered events recently.
+    """
 
     def __init__(self, central: CentralUnit) -> None:
         """Init the connection checker."""
-        threading.Thread.__init__(self, name=f"ConnectionChecker for {central.name}")
         self._central: Final = central
-        self._active = True
-        self._central_is_connected = True
+        self._last_probes: Final[dict[str, datetime]] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """Return if the connection checker is running."""
+        return self._task is not None and not self._task.done()
 
-    def run(self) -> None:
-        """Run the ConnectionChecker thread."""
+    def start(self) -> None:
+        """Start the connection checker."""
+        if self.is_running:
+            return
         _LOGGER.debug(
-            "run: Init connection checker to server %s",
+            "start: Init connection checker to server %s",
             self._central.name,
         )
+        self._task = asyncio.create_task(
+            self._check_connection(), name=f"ConnectionChecker for {self._central.name}"
+        )
 
-        self._central.run_coroutine(self._check_connection())
-
-    def stop(self) -> None:
-        """To stop the ConnectionChecker."""
-        self._active = False
+    async def stop(self) -> None:
+        """Stop the connection checker."""
+        if (task := self._task) is None:
+            return
+        self._task = None
+        await cancel_task(task)
 
     async def _check_connection(self) -> None:
         """Periodically check connection to backend."""
-        while self._active:
+        while True:
             _LOGGER.debug(
                 "check_connection: Checking connection to server %s",
                 self._central.name,
             )
+            has_issue = False
             try:
                 if not self._central.has_clients:
                     _LOGGER.warning(
@@ -1220,36 +1469,84 @@ class ConnectionChecker(threading.Thread):
                     )
                     await self._central.restart_clients()
                 else:
-                    reconnects: list[Any] = []
-                    for interface_id in self._central.interface_ids:
-                        # check:
-                        #  - client is available
-                        #  - client is connected
-                        #  - interface callback is alive
-                        client = self._central.get_client(interface_id=interface_id)
-                        if (
-                            client.available is False
-                            or not await client.is_connected()
-                            or not client.is_callback_alive()
-                        ):
-                            reconnects.append(client.reconnect())
-                    if reconnects:
-                        await asyncio.gather(*reconnects)
-                        if self._central.available:
-                            await self._central.load_and_refresh_entity_data()
+                    clients = self._central.clients
+                    results = await asyncio.gather(
+                        *(self._check_client(client=client) for client in clients)
+                    )
+                    has_issue = any(results)
+                    # refresh only the entities of the reconnected interfaces
+                    if reconnected_interface_ids := tuple(
+                        client.interface_id
+                        for client, reconnected in zip(clients, results, strict=True)
+                        if reconnected and client.available
+                    ):
+                        await self._central.load_and_refresh_entity_data(
+                            interface_ids=reconnected_interface_ids
+                        )
             except NoConnection as nex:
+                has_issue = True
                 _LOGGER.error(
                     "CHECK_CONNECTION failed: no connection: %s", reduce_args(args=nex.args)
                 )
-                continue
             except Exception as err:
                 _LOGGER.error(
                     "CHECK_CONNECTION failed: %s [%s]",
                     type(err).__name__,
                     reduce_args(args=err.args),
                 )
-            if self._active:
-                await asyncio.sleep(config.CONNECTION_CHECKER_INTERVAL)
+            await asyncio.sleep(_get_connection_checker_interval(has_issue=has_issue))
+
+    async def _check_client(self, client: hmcl.Client) -> bool:
+        """Check the connection of the client, and reconnect if required."""
+        # check:
+        #  - client is available
+        #  - interface has delivered events recently, or client is connected
+        #  - interface callback is alive
+        if (
+            client.available is False
+            or not (
+                self._has_recent_events(interface_id=client.interface_id)
+                or await self._probe(client=client)
+            )
+            or not client.is_callback_alive()
+        ):
+            await client.reconnect()
+            return True
+        return False
+
+    async def _probe(self, client: hmcl.Client) -> bool:
+        """Probe the connection of the client."""
+        self._last_probes[client.interface_id] = datetime.now()
+        return await client.is_connected()
+
+    def _has_recent_events(self, interface_id: str) -> bool:
+        """Return if the interface has delivered events since the last check."""
+        now = datetime.now()
+        if (last_probe := self._last_probes.get(interface_id)) is None or (
+            now - last_probe
+        ).total_seconds() > config.CONNECTION_CHECKER_INTERVAL * _MAX_SKIPPED_PROBES:
+            return False
+        if (last_event := self._central.last_events.get(interface_id)) is None:
+            return False
+        return (now - last_event).total_seconds() < config.CONNECTION_CHECKER_INTERVAL
+
+
+def _has_changed_paramsets(known_dev_desc: dict[str, Any], dev_desc: dict[str, Any]) -> bool:
+    """Return if the paramset descriptions of a device description must be fetched."""
+    return not known_dev_desc or any(
+        known_dev_desc.get(key) != dev_desc.get(key)
+        for key in (Description.PARAMSETS, Description.TYPE, Description.VERSION)
+    )
+
+
+def _get_connection_checker_interval(has_issue: bool) -> float:
+    """Return the jittered interval until the next connection check."""
+    interval = (
+        config.CONNECTION_CHECKER_INTERVAL / _ISSUE_INTERVAL_DIVISOR
+        if has_issue
+        else config.CONNECTION_CHECKER_INTERVAL
+    )
+    return interval * random.uniform(1 - _INTERVAL_JITTER, 1 + _INTERVAL_JITTER)
 
 
 class CentralConfig:
@@ -1273,6 +1570,8 @@ class CentralConfig:
         json_port: int | None = None,
         un_ignore_list: list[str] | None = None,
         start_direct: bool = False,
+        max_concurrent_json_rpc_requests: int = DEFAULT_MAX_CONCURRENT_JSON_RPC_REQUESTS,
+        refresh_intervals: Mapping[RefreshJob, float] | None = None,
     ) -> None:
         """Init the client config."""
         self.connection_state: Final = CentralConnectionState()
@@ -1292,6 +1591,9 @@ class CentralConfig:
         self.json_port: Final = json_port
         self.un_ignore_list: Final = un_ignore_list
         self.start_direct = start_direct
+        self.max_concurrent_json_rpc_requests: Final = max_concurrent_json_rpc_requests
+        # {job, interval in seconds}, e.g. DEFAULT_REFRESH_INTERVALS
+        self.refresh_intervals: Final = refresh_intervals
 
     @property
     def central_url(self) -> str:
@@ -1353,6 +1655,7 @@ class CentralConfig:
             client_session=self.client_session,
             tls=self.tls,
             verify_tls=self.verify_tls,
+            max_concurrent_requests=self.max_concurrent_json_rpc_requests,
         )
 
 
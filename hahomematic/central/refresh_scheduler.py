@@ -0,0 +1,151 @@
+"""Scheduled background refresh of the central."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping
+from datetime import datetime
+import logging
+import random
+import time
+from typing import Final
+
+from hahomematic import central as hmcu
+from hahomematic.const import DeviceFirmwareState, ParamsetKey, RefreshJob
+from hahomematic.performance import REFRESH_JOB_RUNS, REFRESH_JOB_SECONDS
+from hahomematic.support import cancel_task, reduce_args
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+# Firmware states of devices, that are refreshed by the firmware job.
+_FIRMWARE_REFRESH_STATES: Final = (
+    DeviceFirmwareState.DELIVER_FIRMWARE_IMAGE,
+    DeviceFirmwareState.LIVE_DELIVER_FIRMWARE_IMAGE,
+    DeviceFirmwareState.READY_FOR_UPDATE,
+    DeviceFirmwareState.DO_UPDATE_PENDING,
+    DeviceFirmwareState.PERFORMING_UPDATE,
+)
+# Relative jitter of the job intervals.
+_INTERVAL_JITTER: Final = 0.1
+# Factor of the sysvar interval, that is used while the backend pushes system variables.
+_PUSHED_SYSVARS_INTERVAL_FACTOR: Final = 10
+
+
+class RefreshScheduler:
+    """
+    Periodically refresh system variables, programs, firmware data and MASTER paramsets.
+
+    Each job runs in its own asyncio task, so a job never overlaps with itself.
+    The first run of a job is delayed by a random part of its interval,
+    and the intervals are jittered, so the refresh load on the backend is spread.
+    Only one job runs at a time. A job is skipped, while its interfaces are unavailable.
+    """
+
+    def __init__(self, central: hmcu.CentralUnit, intervals: Mapping[RefreshJob, float]) -> None:
+        """Init the refresh scheduler."""
+        self._central: Final = central
+        # a job with an interval of 0 is disabled
+        self._intervals: Final = {job: interval for job, interval in intervals.items() if interval}
+        self._last_runs: Final[dict[RefreshJob, float]] = {}
+        self._sema_jobs: Final = asyncio.Semaphore()
+        self._tasks: Final[dict[RefreshJob, asyncio.Task[None]]] = {}
+
+    @property
+    def is_running(self) -> bool:
+        """Return if the refresh scheduler is running."""
+        return any(not task.done() for task in self._tasks.values())
+
+    @property
+    def jobs(self) -> tuple[RefreshJob, ...]:
+        """Return the enabled jobs."""
+        return tuple(self._intervals)
+
+    def start(self) -> None:
+        """Start the refresh jobs."""
+        if self.is_running:
+            return
+        _LOGGER.debug(
+            "START: Starting refresh jobs %s for %s",
+            ", ".join(self._intervals),
+            self._central.name,
+        )
+        for job, interval in self._intervals.items():
+            self._tasks[job] = asyncio.create_task(
+                self._run_periodically(job=job, interval=interval),
+                name=f"RefreshJob {job} for {self._central.name}",
+            )
+
+    async def stop(self) -> None:
+        """Stop the refresh jobs."""
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            await cancel_task(task)
+
+    async def run_job(self, job: RefreshJob) -> bool:
+        """Run the job, and return if it has been executed."""
+        if not self._is_available(job=job):
+            _LOGGER.debug(
+                "RUN_JOB: Skipping %s. Interfaces of %s are unavailable",
+                job,
+                self._central.name,
+            )
+            REFRESH_JOB_RUNS.inc(job, "skipped")
+            return False
+        async with self._sema_jobs:
+            started = time.perf_counter()
+            try:
+                await self._get_job_function(job=job)()
+            except Exception as ex:
+                REFRESH_JOB_RUNS.inc(job, "failed")
+                _LOGGER.warning(
+                    "RUN_JOB failed: %s of %s: %s [%s]",
+                    job,
+                    self._central.name,
+                    type(ex).__name__,
+                    reduce_args(args=ex.args),
+                )
+                return False
+            finally:
+                REFRESH_JOB_SECONDS.observe(job, value=time.perf_counter() - started)
+        self._last_runs[job] = time.monotonic()
+        REFRESH_JOB_RUNS.inc(job, "success")
+        return True
+
+    async def _run_periodically(self, job: RefreshJob, interval: float) -> None:
+        """Run the job periodically."""
+        await asyncio.sleep(random.uniform(0, interval))
+        while True:
+            if self._is_due(job=job, interval=interval):
+                await self.run_job(job=job)
+            await asyncio.sleep(
+                interval * random.uniform(1 - _INTERVAL_JITTER, 1 + _INTERVAL_JITTER)
+            )
+
+    def _is_due(self, job: RefreshJob, interval: float) -> bool:
+        """Return if the job is due."""
+        if job != RefreshJob.SYSVARS or (last_run := self._last_runs.get(job)) is None:
+            return True
+        # pushed system variables are only swept for consistency
+        if (datetime.now() - self._central.last_sysvar_event).total_seconds() < interval:
+            return time.monotonic() - last_run >= interval * _PUSHED_SYSVARS_INTERVAL_FACTOR
+        return True
+
+    def _is_available(self, job: RefreshJob) -> bool:
+        """Return if the interfaces of the job are available."""
+        if job in (RefreshJob.PROGRAMS, RefreshJob.SYSVARS):
+            return (client := self._central.primary_client) is not None and client.available
+        return self._central.has_clients and self._central.available
+
+    def _get_job_function(self, job: RefreshJob) -> Callable[[], Awaitable[None]]:
+        """Return the function of the job."""
+        if job == RefreshJob.FIRMWARE:
+            return lambda: self._central.refresh_firmware_data_by_state(
+                device_firmware_states=_FIRMWARE_REFRESH_STATES
+            )
+        if job == RefreshJob.MASTER:
+            return lambda: self._central.load_and_refresh_entity_data(
+                paramset_key=ParamsetKey.MASTER
+            )
+        if job == RefreshJob.PROGRAMS:
+            return self._central.refresh_program_data
+        return self._central.refresh_sysvar_data
@@ -14,6 +14,8 @@ from xmlrpc.server import SimpleXMLRPCRequestHandler, SimpleXMLRPCServer
 from hahomematic import central as hmcu
 from hahomematic.central.decorators import callback_system_event
 from hahomematic.const import IP_ANY_V4, PORT_ANY, SystemEvent
+from hahomematic.performance import EVENT_RECORDER, EVENT_TRACER
+from hahomematic.platforms.entity import entity_update_batch
 from hahomematic.support import find_free_port
 
 _LOGGER: Final = logging.getLogger(__name__)
@@ -29,13 +31,24 @@ class RPCFunctions:
 
     def event(self, interface_id: str, channel_address: str, parameter: str, value: Any) -> None:
         """If a device emits some sort event, we will handle it here."""
-        if central := self._xml_rpc_server.get_central(interface_id):
-            central.event(
-                interface_id=interface_id,
-                channel_address=channel_address,
-                parameter=parameter,
-                value=value,
-            )
+        trace_token = EVENT_TRACER.start_trace()
+        try:
+            if EVENT_RECORDER.enabled:
+                EVENT_RECORDER.record(
+                    interface_id=interface_id,
+                    channel_address=channel_address,
+                    parameter=parameter,
+                    value=value,
+                )
+            if central := self._xml_rpc_server.get_central(interface_id):
+                central.event(
+                    interface_id=interface_id,
+                    channel_address=channel_address,
+                    parameter=parameter,
+                    value=value,
+                )
+        finally:
+            EVENT_TRACER.end_trace(token=trace_token)
 
     @callback_system_event(system_event=SystemEvent.ERROR)
     def error(self, interface_id: str, error_code: str, msg: str) -> None:
@@ -138,8 +151,18 @@ class HaHomematicXMLRPCServer(SimpleXMLRPCServer):
 
     This implementation adds an additional method:
     system_listMethods(self, interface_id: str.
+    The events of a system.multicall are handled as one entity update batch.
     """
 
+    def system_multicall(self, call_list: list[dict[str, Any]]) -> list[Any]:
+        """
+        Handle a list of calls within one entity update batch.
+
+        Custom entities are notified once, even if several of their data entities are updated.
+        """
+        with entity_update_batch():
+            return SimpleXMLRPCServer.system_multicall(self, call_list)
+
     def system_listMethods(self, interface_id: str | None = None) -> list[str]:
         """
         Return a list of the methods supported by the server.
@@ -3,13 +3,15 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 import asyncio
+from collections.abc import Collection
 from datetime import datetime
 import logging
 from typing import Any, Final, cast
 
 from hahomematic import central as hmcu
+from hahomematic.client.scheduler import CommandScheduler
 from hahomematic.client.xml_rpc import XmlRpcProxy
-from hahomematic.config import CALLBACK_WARN_INTERVAL, RECONNECT_WAIT
+from hahomematic.config import CALLBACK_WARN_INTERVAL, COMMAND_CONCURRENCY, RECONNECT_WAIT
 from hahomematic.const import (
     EVENT_AVAILABLE,
     EVENT_SECONDS_SINCE_LAST_EVENT,
@@ -18,6 +20,7 @@ from hahomematic.const import (
     VIRTUAL_REMOTE_TYPES,
     Backend,
     CallSource,
+    CommandPriority,
     Description,
     ForcedDeviceAvailability,
     InterfaceEventType,
@@ -29,8 +32,8 @@ from hahomematic.const import (
     SystemInformation,
     SystemVariableData,
 )
-from hahomematic.exceptions import BaseHomematicException, NoConnection
-from hahomematic.performance import measure_execution_time
+from hahomematic.exceptions import BaseHomematicException, NoConnection, UnsupportedException
+from hahomematic.performance import RECONNECTS, measure_execution_time
 from hahomematic.platforms.device import HmDevice
 from hahomematic.support import build_headers, build_xml_rpc_uri, get_channel_no, reduce_args
 
@@ -38,9 +41,11 @@ _LOGGER: Final = logging.getLogger(__name__)
 
 _ADDRESS: Final = "address"
 _CHANNELS: Final = "channels"
+_FUNCTIONS: Final = "functions"
 _ID: Final = "id"
 _INTERFACE: Final = "interface"
 _NAME: Final = "name"
+_ROOMS: Final = "rooms"
 
 
 class Client(ABC):
@@ -60,6 +65,10 @@ class Client(ABC):
         self._connection_error_count: int = 0
         self._is_callback_alive: bool = True
         self.last_updated: datetime = INIT_DATETIME
+        self.last_initialized: datetime = INIT_DATETIME
+        self._command_scheduler: Final = CommandScheduler(
+            interface_id=client_config.interface_id, max_concurrency=COMMAND_CONCURRENCY
+        )
 
         self._proxy: XmlRpcProxy
         self._proxy_read: XmlRpcProxy
@@ -80,6 +89,11 @@ class Client(ABC):
         """Return the availability of the client."""
         return self._available
 
+    @property
+    def command_scheduler(self) -> CommandScheduler:
+        """Return the command scheduler of the client."""
+        return self._command_scheduler
+
     @property
     @abstractmethod
     def model(self) -> str:
@@ -108,7 +122,7 @@ class Client(ABC):
             )
             self.last_updated = INIT_DATETIME
             return ProxyInitState.INIT_FAILED
-        self.last_updated = datetime.now()
+        self.last_updated = self.last_initialized = datetime.now()
         return ProxyInitState.INIT_SUCCESS
 
     async def proxy_de_init(self) -> ProxyInitState:
@@ -172,6 +186,7 @@ class Client(ABC):
             await asyncio.sleep(RECONNECT_WAIT)
 
             await self.proxy_re_init()
+            RECONNECTS.inc(self.interface_id)
             _LOGGER.info(
                 "RECONNECT: re-connected client %s",
                 self.interface_id,
@@ -192,6 +207,16 @@ class Client(ABC):
     async def fetch_device_details(self) -> None:
         """Fetch names from backend."""
 
+    async def fetch_device_metadata(
+        self,
+    ) -> tuple[dict[str, set[str]], dict[str, set[str]]] | None:
+        """
+        Fetch names, rooms and functions of all devices and channels with one call.
+
+        Return the rooms and functions by address, or None if not supported by the backend.
+        """
+        return None
+
     async def is_connected(self) -> bool:
         """
         Perform actions required for connectivity check.
@@ -315,6 +340,51 @@ class Client(ABC):
             )
         return None
 
+    async def get_device_descriptions_batch(
+        self, device_addresses: Collection[str]
+    ) -> list[dict[str, Any]]:
+        """
+        Get the device descriptions of the device addresses from CCU / Homegear.
+
+        The descriptions are fetched with one system.multicall, or concurrently,
+        if the backend doesn't support system.multicall.
+        """
+        if not device_addresses:
+            return []
+        try:
+            results = await self._proxy_read.system.multicall(
+                [
+                    {"methodName": "getDeviceDescription", "params": [device_address]}
+                    for device_address in device_addresses
+                ]
+            )
+            # successful calls return a list with the result, failed calls a fault dict
+            return [result[0] for result in results if isinstance(result, list) and result]
+        except UnsupportedException:
+            _LOGGER.debug(
+                "GET_DEVICE_DESCRIPTIONS_BATCH: system.multicall is not supported by %s",
+                self.interface_id,
+            )
+        except BaseHomematicException as ex:
+            _LOGGER.warning(
+                "GET_DEVICE_DESCRIPTIONS_BATCH failed: %s [%s]",
+                ex.name,
+                reduce_args(args=ex.args),
+            )
+            return []
+        results = await asyncio.gather(
+            *(
+                self.get_device_descriptions(device_address=device_address)
+                for device_address in device_addresses
+            )
+        )
+        return [
+            device_description
+            for device_descriptions in results
+            if device_descriptions
+            for device_description in device_descriptions
+        ]
+
     async def set_install_mode(
         self,
         on: bool = True,
@@ -362,10 +432,20 @@ class Client(ABC):
                 paramset_key,
                 call_source,
             )
+            priority = (
+                CommandPriority.BACKGROUND
+                if call_source in (CallSource.HA_INIT, CallSource.HM_INIT)
+                else CommandPriority.EVENT
+            )
             if paramset_key == ParamsetKey.VALUES:
-                return await self._proxy_read.getValue(channel_address, parameter)
+                return await self._command_scheduler.run(
+                    priority, self._proxy_read.getValue, channel_address, parameter
+                )
             paramset = (
-                await self._proxy_read.getParamset(channel_address, ParamsetKey.MASTER) or {}
+                await self._command_scheduler.run(
+                    priority, self._proxy_read.getParamset, channel_address, ParamsetKey.MASTER
+                )
+                or {}
             )
             return paramset.get(parameter)
         except BaseHomematicException as ex:
@@ -390,9 +470,22 @@ class Client(ABC):
         try:
             _LOGGER.debug("SET_VALUE: %s, %s, %s", channel_address, parameter, value)
             if rx_mode:
-                await self._proxy.setValue(channel_address, parameter, value, rx_mode)
+                await self._command_scheduler.run(
+                    CommandPriority.INTERACTIVE,
+                    self._proxy.setValue,
+                    channel_address,
+                    parameter,
+                    value,
+                    rx_mode,
+                )
             else:
-                await self._proxy.setValue(channel_address, parameter, value)
+                await self._command_scheduler.run(
+                    CommandPriority.INTERACTIVE,
+                    self._proxy.setValue,
+                    channel_address,
+                    parameter,
+                    value,
+                )
         except BaseHomematicException as ex:
             _LOGGER.warning(
                 "SET_VALUE failed with %s [%s]: %s, %s, %s",
@@ -441,7 +534,9 @@ class Client(ABC):
                 address,
                 paramset_key,
             )
-            return await self._proxy_read.getParamset(address, paramset_key)  # type: ignore[no-any-return]
+            return await self._command_scheduler.run(
+                CommandPriority.EVENT, self._proxy_read.getParamset, address, paramset_key
+            )
         except BaseHomematicException as ex:
             _LOGGER.debug(
                 "GET_PARAMSET failed with %s [%s]: %s, %s",
@@ -468,9 +563,22 @@ class Client(ABC):
         try:
             _LOGGER.debug("PUT_PARAMSET: %s, %s, %s", address, paramset_key, value)
             if rx_mode:
-                await self._proxy.putParamset(address, paramset_key, value, rx_mode)
+                await self._command_scheduler.run(
+                    CommandPriority.INTERACTIVE,
+                    self._proxy.putParamset,
+                    address,
+                    paramset_key,
+                    value,
+                    rx_mode,
+                )
             else:
-                await self._proxy.putParamset(address, paramset_key, value)
+                await self._command_scheduler.run(
+                    CommandPriority.INTERACTIVE,
+                    self._proxy.putParamset,
+                    address,
+                    paramset_key,
+                    value,
+                )
         except BaseHomematicException as ex:
             _LOGGER.warning(
                 "PUT_PARAMSET failed: %s [%s] %s, %s, %s",
@@ -556,7 +664,12 @@ class Client(ABC):
     ) -> dict[str, Any] | None:
         """Get paramset description from CCU."""
         try:
-            return await self._proxy_read.getParamsetDescription(address, paramset_key)  # type: ignore[no-any-return]
+            return await self._command_scheduler.run(
+                CommandPriority.BACKGROUND,
+                self._proxy_read.getParamsetDescription,
+                address,
+                paramset_key,
+            )
         except BaseHomematicException as ex:
             _LOGGER.debug(
                 "GET_PARAMSET_DESCRIPTIONS failed with %s [%s] for %s address %s",
@@ -570,14 +683,17 @@ class Client(ABC):
     async def get_all_paramset_descriptions(
         self, device_descriptions: list[dict[str, Any]]
     ) -> dict[str, dict[str, Any]]:
-        """Get all paramset descriptions for provided device descriptions."""
+        """Get all paramset descriptions for provided device descriptions concurrently."""
         all_paramsets: dict[str, dict[str, Any]] = {}
-        for device_description in device_descriptions:
-            all_paramsets.update(
-                await self.get_paramset_descriptions(
+        for paramsets in await asyncio.gather(
+            *(
+                self.get_paramset_descriptions(
                     device_description=device_description, only_relevant=False
                 )
+                for device_description in device_descriptions
             )
+        ):
+            all_paramsets.update(paramsets)
         return all_paramsets
 
     async def update_device_firmware(self, device_address: str) -> bool:
@@ -664,25 +780,45 @@ class ClientCCU(Client):
         """Get all names via JSON-RPS and store in data.NAMES."""
         if json_result := await self._json_rpc_client.get_device_details():
             for device in json_result:
-                device_address = device[_ADDRESS]
-                self.central.device_details.add_name(address=device_address, name=device[_NAME])
-                self.central.device_details.add_device_channel_id(
-                    address=device_address, channel_id=device[_ID]
-                )
-                for channel in device.get(_CHANNELS, []):
-                    channel_address = channel[_ADDRESS]
-                    self.central.device_details.add_name(
-                        address=channel_address, name=channel[_NAME]
-                    )
-                    self.central.device_details.add_device_channel_id(
-                        address=channel_address, channel_id=channel[_ID]
-                    )
-                self.central.device_details.add_interface(
-                    address=device_address, interface=device[_INTERFACE]
-                )
+                self._add_device_details(device=device)
         else:
             _LOGGER.debug("FETCH_DEVICE_DETAILS: Unable to fetch device details via JSON-RPC")
 
+    @measure_execution_time
+    async def fetch_device_metadata(
+        self,
+    ) -> tuple[dict[str, set[str]], dict[str, set[str]]] | None:
+        """Get all names, rooms and functions via one JSON-RPC RegaScript."""
+        if (device_metadata := await self._json_rpc_client.get_device_metadata()) is None:
+            return None
+        rooms: dict[str, set[str]] = {}
+        functions: dict[str, set[str]] = {}
+        for device in device_metadata:
+            self._add_device_details(device=device)
+            for channel in device[_CHANNELS]:
+                if channel[_ROOMS]:
+                    rooms[channel[_ADDRESS]] = set(channel[_ROOMS])
+                if channel[_FUNCTIONS]:
+                    functions[channel[_ADDRESS]] = set(channel[_FUNCTIONS])
+        return rooms, functions
+
+    def _add_device_details(self, device: dict[str, Any]) -> None:
+        """Add the names, channel ids and interface of a device to the device details."""
+        device_address = device[_ADDRESS]
+        self.central.device_details.add_name(address=device_address, name=device[_NAME])
+        self.central.device_details.add_device_channel_id(
+            address=device_address, channel_id=device[_ID]
+        )
+        for channel in device.get(_CHANNELS, []):
+            channel_address = channel[_ADDRESS]
+            self.central.device_details.add_name(address=channel_address, name=channel[_NAME])
+            self.central.device_details.add_device_channel_id(
+                address=channel_address, channel_id=channel[_ID]
+            )
+        self.central.device_details.add_interface(
+            address=device_address, interface=device[_INTERFACE]
+        )
+
     @measure_execution_time
     async def fetch_all_device_data(self) -> None:
         """Fetch all device data from CCU."""
@@ -692,7 +828,9 @@ class ClientCCU(Client):
             _LOGGER.debug(
                 "FETCH_ALL_DEVICE_DATA: Fetched all device data for interface %s", self.interface
             )
-            self.central.data_cache.add_data(all_device_data=all_device_data)
+            self.central.data_cache.add_data(
+                interface=self.interface, all_device_data=all_device_data
+            )
         else:
             _LOGGER.debug(
                 "FETCH_ALL_DEVICE_DATA: Unable to get all device data via JSON-RPC RegaScript for interface %s",
@@ -1,6 +1,7 @@
 """Implementation of an async json-rpc client."""
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 from enum import StrEnum
 from json import JSONDecodeError
@@ -8,7 +9,9 @@ import logging
 import os
 from pathlib import Path
 import re
+import time
 from typing import Any, Final
+from urllib.parse import unquote
 
 from aiohttp import ClientConnectorCertificateError, ClientError, ClientResponse, ClientSession
 import orjson
@@ -18,8 +21,10 @@ from hahomematic.const import (
     CONF_PASSWORD,
     CONF_USERNAME,
     DEFAULT_ENCODING,
+    DEFAULT_MAX_CONCURRENT_JSON_RPC_REQUESTS,
     PATH_JSON_RPC,
     REGA_SCRIPT_FETCH_ALL_DEVICE_DATA,
+    REGA_SCRIPT_FETCH_DEVICE_METADATA,
     REGA_SCRIPT_GET_SERIAL,
     REGA_SCRIPT_PATH,
     REGA_SCRIPT_SET_SYSTEM_VARIABLE,
@@ -37,11 +42,14 @@ from hahomematic.exceptions import (
     NoConnection,
     UnsupportedException,
 )
+from hahomematic.performance import JSON_RPC_CALL_SECONDS
 from hahomematic.support import get_tls_context, parse_sys_var, reduce_args
 
 _LOGGER: Final = logging.getLogger(__name__)
 
 _CHANNEL_IDS: Final = "channelIds"
+_CHANNELS: Final = "channels"
+_FUNCTIONS: Final = "functions"
 _HAS_EXT_MARKER: Final = "hasExtMarker"
 _ID: Final = "id"
 _IS_ACTIVE: Final = "isActive"
@@ -54,6 +62,7 @@ _INTERFACE: Final = "interface"
 _P_ERROR: Final = "error"
 _P_MESSAGE: Final = "message"
 _P_RESULT: Final = "result"
+_ROOMS: Final = "rooms"
 _SESSION_ID: Final = "_session_id_"
 _SERIAL: Final = "serial"
 _TYPE: Final = "type"
@@ -97,6 +106,7 @@ class JsonRpcAioHttpClient:
         client_session: ClientSession | None = None,
         tls: bool = False,
         verify_tls: bool = False,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_JSON_RPC_REQUESTS,
     ) -> None:
         """Session setup."""
         self._client_session: Final = client_session
@@ -109,7 +119,11 @@ class JsonRpcAioHttpClient:
         self._script_cache: Final[dict[str, str]] = {}
         self._last_session_id_refresh: datetime | None = None
         self._session_id: str | None = None
+        self._session_lock: Final = asyncio.Lock()
+        self._sema_requests: Final = asyncio.Semaphore(max(max_concurrent_requests, 1))
         self._supported_methods: tuple[str, ...] | None = None
+        # {sysvar_id, (raw sysvar data, system variable data)}
+        self._sysvar_cache: Final[dict[str, tuple[tuple[Any, ...], SystemVariableData]]] = {}
 
     @property
     def is_activated(self) -> bool:
@@ -117,25 +131,36 @@ class JsonRpcAioHttpClient:
         return self._session_id is not None
 
     async def _login_or_renew(self) -> bool:
-        """Renew JSON-RPC session or perform login."""
-        if not self.is_activated:
-            self._session_id = await self._do_login()
-            self._last_session_id_refresh = datetime.now()
+        """
+        Renew JSON-RPC session or perform login.
+
+        Concurrent callers share a single login or renew of the session.
+        """
+        if self.is_activated and self._updated_within_seconds:
+            return True
+        async with self._session_lock:
+            if not self.is_activated:
+                self._session_id = await self._do_login()
+                self._last_session_id_refresh = datetime.now()
+                return self._session_id is not None
+            if self._session_id:
+                self._session_id = await self._do_renew_login(self._session_id)
             return self._session_id is not None
-        if self._session_id:
-            self._session_id = await self._do_renew_login(self._session_id)
-        return self._session_id is not None
 
     async def _do_renew_login(self, session_id: str) -> str | None:
         """Renew JSON-RPC session or perform login."""
         if self._updated_within_seconds:
             return session_id
         method = JsonRpcMethod.SESSION_RENEW
-        response = await self._do_post(
-            session_id=session_id,
-            method=method,
-            extra_params={_SESSION_ID: session_id},
-        )
+        try:
+            response = await self._do_post(
+                session_id=session_id,
+                method=method,
+                extra_params={_SESSION_ID: session_id},
+            )
+        except AuthFailure:
+            _LOGGER.debug("DO_RENEW_LOGIN: Session [%s] expired. Login again", session_id)
+            return await self._do_login()
 
         if response[_P_RESULT] and response[_P_RESULT] is True:
             self._last_session_id_refresh = datetime.now()
@@ -178,6 +203,7 @@ class JsonRpcAioHttpClient:
 
         if result := response[_P_RESULT]:
             session_id = result
+            self._last_session_id_refresh = datetime.now()
 
         return session_id
 
@@ -201,8 +227,9 @@ class JsonRpcAioHttpClient:
         if self._supported_methods is None:
             await self._check_supported_methods()
 
-        response = await self._do_post(
+        response = await self._do_session_post(
             session_id=session_id,
+            keep_session=keep_session,
             method=method,
             extra_params=extra_params,
             use_default_params=use_default_params,
@@ -245,8 +272,9 @@ class JsonRpcAioHttpClient:
                 script = script.replace(f"##{variable}##", value)
 
         method = JsonRpcMethod.REGA_RUN_SCRIPT
-        response = await self._do_post(
+        response = await self._do_session_post(
             session_id=session_id,
+            keep_session=keep_session,
             method=method,
             extra_params={"script": script},
         )
@@ -272,6 +300,35 @@ class JsonRpcAioHttpClient:
             return script
         return None
 
+    async def _do_session_post(
+        self,
+        session_id: str,
+        keep_session: bool,
+        method: JsonRpcMethod,
+        extra_params: dict[str, str] | None = None,
+        use_default_params: bool = True,
+    ) -> dict[str, Any] | Any:
+        """Post with the session, and retry once with a new shared session if it expired."""
+        try:
+            return await self._do_post(
+                session_id=session_id,
+                method=method,
+                extra_params=extra_params,
+                use_default_params=use_default_params,
+            )
+        except AuthFailure:
+            if not keep_session or not await self._login_or_renew():
+                raise
+            if (new_session_id := self._session_id) is None or new_session_id == session_id:
+                raise
+            _LOGGER.debug("DO_SESSION_POST: Retrying method %s with a new session", method)
+            return await self._do_post(
+                session_id=new_session_id,
+                method=method,
+                extra_params=extra_params,
+                use_default_params=use_default_params,
+            )
+
     async def _do_post(
         self,
         session_id: bool | str,
@@ -289,67 +346,73 @@ class JsonRpcAioHttpClient:
 
         params = _get_params(session_id, extra_params, use_default_params)
 
-        try:
-            payload = orjson.dumps({"method": method, "params": params, "jsonrpc": "1.1", "id": 0})
-
-            headers = {
-                "Content-Type": "application/json",
-                "Content-Length": str(len(payload)),
-            }
-
-            if (
-                response := await self._client_session.post(
-                    self._url,
-                    data=payload,
-                    headers=headers,
-                    timeout=config.TIMEOUT,
-                    ssl=self._tls_context,
+        async with self._sema_requests:
+            try:
+                payload = orjson.dumps(
+                    {"method": method, "params": params, "jsonrpc": "1.1", "id": 0}
                 )
-            ) is None:
-                raise ClientException("POST method failed with no response")
 
-            if response.status == 200:
-                json_response = await self._get_json_reponse(response=response)
+                headers = {
+                    "Content-Type": "application/json",
+                    "Content-Length": str(len(payload)),
+                }
+
+                started = time.perf_counter()
+                try:
+                    response = await self._client_session.post(
+                        self._url,
+                        data=payload,
+                        headers=headers,
+                        timeout=config.TIMEOUT,
+                        ssl=self._tls_context,
+                    )
+                finally:
+                    JSON_RPC_CALL_SECONDS.observe(str(method), value=time.perf_counter() - started)
+                if response is None:
+                    raise ClientException("POST method failed with no response")
+
+                if response.status == 200:
+                    json_response = await self._get_json_reponse(response=response)
+
+                    if error := json_response[_P_ERROR]:
+                        error_message = error[_P_MESSAGE]
+                        message = f"POST method '{method}' failed: {error_message}"
+                        if error_message.startswith("access denied"):
+                            _LOGGER.debug(message)
+                            raise AuthFailure(message)
+                        if "internal error" in error_message:
+                            message = f"An internal error happened within your backend (Fix or ignore it): {message}"
+                            _LOGGER.debug(message)
+                            raise InternalBackendException(message)
+                        _LOGGER.debug(message)
+                        raise ClientException(message)
+
+                    return json_response
 
+                message = f"Status: {response.status}"
+                json_response = await self._get_json_reponse(response=response)
                 if error := json_response[_P_ERROR]:
                     error_message = error[_P_MESSAGE]
-                    message = f"POST method '{method}' failed: {error_message}"
-                    if error_message.startswith("access denied"):
-                        _LOGGER.debug(message)
-                        raise AuthFailure(message)
-                    if "internal error" in error_message:
-                        message = f"An internal error happened within your backend (Fix or ignore it): {message}"
-                        _LOGGER.debug(message)
-                        raise InternalBackendException(message)
-                    _LOGGER.debug(message)
-                    raise ClientException(message)
-
-                return json_response
-
-            message = f"Status: {response.status}"
-            json_response = await self._get_json_reponse(response=response)
-            if error := json_response[_P_ERROR]:
-                error_message = error[_P_MESSAGE]
-                message = f"{message}: {error_message}"
-            raise ClientException(message)
-        except BaseHomematicException:
-            await self.logout()
-            raise
-        except ClientConnectorCertificateError as cccerr:
-            self.clear_session()
-            message = f"ClientConnectorCertificateError[{cccerr}]"
-            if self._tls is False and cccerr.ssl is True:
-                message = (
-                    f"{message}. Possible reason: 'Automatic forwarding to HTTPS' is enabled in backend, "
-                    f"but this integration is not configured to use TLS"
-                )
-            raise ClientException(message) from cccerr
-        except (ClientError, OSError) as err:
-            self.clear_session()
-            raise NoConnection(err) from err
-        except (TypeError, Exception) as ex:
-            self.clear_session()
-            raise ClientException(ex) from ex
+                    message = f"{message}: {error_message}"
+                raise ClientException(message)
+            except AuthFailure:
+                # only an auth failure invalidates the session, that is shared by all requests
+                self._invalidate_session(session_id=session_id)
+                raise
+            except BaseHomematicException:
+                raise
+            except ClientConnectorCertificateError as cccerr:
+                message = f"ClientConnectorCertificateError[{cccerr}]"
+                if self._tls is False and cccerr.ssl is True:
+                    message = (
+                        f"{message}. Possible reason: 'Automatic forwarding to HTTPS' is enabled in backend, "
+                        f"but this integration is not configured to use TLS"
+                    )
+                raise ClientException(message) from cccerr
+            except (ClientError, OSError) as err:
+                raise NoConnection(err) from err
+            except (TypeError, Exception) as ex:
+                raise ClientException(ex) from ex
 
     async def _get_json_reponse(self, response: ClientResponse) -> dict[str, Any] | Any:
         """Return the json object from response."""
@@ -463,6 +526,12 @@ class JsonRpcAioHttpClient:
         """Clear the current session."""
         self._session_id = None
 
+    def _invalidate_session(self, session_id: bool | str) -> None:
+        """Clear the current session, if it is the given one."""
+        if session_id and session_id == self._session_id:
+            _LOGGER.debug("INVALIDATE_SESSION: Session [%s] is no longer valid", session_id)
+            self.clear_session()
+
     async def delete_system_variable(self, name: str) -> bool:
         """Delete a system variable from CCU / Homegear."""
         iid = "DELETE_SYSTEM_VARIABLE"
@@ -530,11 +599,25 @@ class JsonRpcAioHttpClient:
                     name = var[_NAME]
                     org_data_type = var[_TYPE]
                     raw_value = var[_VALUE]
+                    extended_sysvar = ext_markers.get(var_id, False)
+                    # unchanged sysvars are not parsed again
+                    raw_data = (
+                        name,
+                        org_data_type,
+                        raw_value,
+                        var[_UNIT],
+                        var.get(_VALUE_LIST),
+                        var.get(_MAX_VALUE),
+                        var.get(_MIN_VALUE),
+                        extended_sysvar,
+                    )
+                    if (cached := self._sysvar_cache.get(var_id)) and cached[0] == raw_data:
+                        variables.append(cached[1])
+                        continue
                     if org_data_type == SysvarType.NUMBER:
                         data_type = SysvarType.FLOAT if "." in raw_value else SysvarType.INTEGER
                     else:
                         data_type = org_data_type
-                    extended_sysvar = ext_markers.get(var_id, False)
                     unit = var[_UNIT]
                     value_list: list[str] | None = None
                     if val_list := var.get(_VALUE_LIST):
@@ -547,18 +630,18 @@ class JsonRpcAioHttpClient:
                         min_value = None
                         if raw_min_value := var.get(_MIN_VALUE):
                             min_value = parse_sys_var(data_type=data_type, raw_value=raw_min_value)
-                        variables.append(
-                            SystemVariableData(
-                                name=name,
-                                data_type=data_type,
-                                unit=unit,
-                                value=value,
-                                value_list=value_list,
-                                max_value=max_value,
-                                min_value=min_value,
-                                extended_sysvar=extended_sysvar,
-                            )
+                        sysvar_data = SystemVariableData(
+                            name=name,
+                            data_type=data_type,
+                            unit=unit,
+                            value=value,
+                            value_list=value_list,
+                            max_value=max_value,
+                            min_value=min_value,
+                            extended_sysvar=extended_sysvar,
                         )
+                        self._sysvar_cache[var_id] = (raw_data, sysvar_data)
+                        variables.append(sysvar_data)
                     except ValueError as verr:
                         _LOGGER.warning(
                             "GET_ALL_SYSTEM_VARIABLES failed: "
@@ -566,6 +649,8 @@ class JsonRpcAioHttpClient:
                             reduce_args(args=verr.args),
                             name,
                         )
+                for var_id in self._sysvar_cache.keys() - {var[_ID] for var in json_result}:
+                    del self._sysvar_cache[var_id]
             self._connection_state.remove_issue(issuer=self, iid=iid)
         except BaseHomematicException as ex:
             self._handle_exception_log(iid=iid, exception=ex)
@@ -671,6 +756,38 @@ class JsonRpcAioHttpClient:
 
         return device_details
 
+    async def get_device_metadata(self) -> list[dict[str, Any]] | None:
+        """
+        Get the device details incl. rooms and functions of the channels with one script.
+
+        Return None, if the script failed.
+        """
+        iid = "GET_DEVICE_METADATA"
+        try:
+            response = await self._post_script(script_name=REGA_SCRIPT_FETCH_DEVICE_METADATA)
+
+            _LOGGER.debug("GET_DEVICE_METADATA: Getting the device metadata")
+            if response[_P_ERROR] or not isinstance(json_result := response[_P_RESULT], list):
+                return None
+            for device in json_result:
+                device[_NAME] = unquote(device[_NAME])
+                for channel in device[_CHANNELS]:
+                    channel[_NAME] = unquote(channel[_NAME])
+                    channel[_ROOMS] = [unquote(room) for room in channel[_ROOMS]]
+                    channel[_FUNCTIONS] = [unquote(function) for function in channel[_FUNCTIONS]]
+            self._connection_state.remove_issue(issuer=self, iid=iid)
+        except (BaseHomematicException, JSONDecodeError) as ex:
+            self._handle_exception_log(
+                iid=iid,
+                exception=ex,
+                level=logging.WARNING,
+                extra_msg="Falling back to single calls.",
+                multiple_logs=False,
+            )
+            return None
+
+        return json_result
+
     async def get_all_device_data(self, interface: str) -> dict[str, Any]:
         """Get the all device data of the backend."""
         iid = f"GET_ALL_DEVICE_DATA for {interface}"
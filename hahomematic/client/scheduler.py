@@ -0,0 +1,193 @@
+"""Prioritized command scheduler for the backend communication of an interface."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import heapq
+from itertools import count
+import logging
+import time
+from typing import Any, Final, TypeVar
+
+from hahomematic.const import CommandPriority
+from hahomematic.performance import COMMAND_QUEUE_DEPTH
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# Duty cycle level (in %), from which background commands are throttled.
+_DUTY_CYCLE_THROTTLE_LEVEL: Final = 60.0
+# Rate of background commands (per second) at the throttle level and at the limit.
+_MAX_BACKGROUND_RATE: Final = 10.0
+_MIN_BACKGROUND_RATE: Final = 0.5
+_TOKEN_BUCKET_CAPACITY: Final = 5.0
+
+
+class CommandScheduler:
+    """
+    Schedule the commands of an interface by priority.
+
+    The number of concurrent commands is limited. One slot is reserved
+    for interactive commands, so they don't wait for a flood of background commands.
+    Background commands are throttled by a token bucket,
+    if the reported duty cycle level of the interface is high.
+    """
+
+    __slots__ = (
+        "_duty_cycle_level",
+        "_interface_id",
+        "_max_concurrency",
+        "_running",
+        "_sequence",
+        "_token_bucket",
+        "_waiters",
+    )
+
+    def __init__(self, interface_id: str, max_concurrency: int) -> None:
+        """Init the command scheduler."""
+        self._interface_id: Final = interface_id
+        self._max_concurrency: Final = max(max_concurrency, 1)
+        self._running: int = 0
+        self._sequence: Final = count()
+        self._waiters: Final[list[tuple[int, int, asyncio.Future[None]]]] = []
+        self._duty_cycle_level: float | None = None
+        self._token_bucket: _TokenBucket | None = None
+
+    @property
+    def duty_cycle_level(self) -> float | None:
+        """Return the last reported duty cycle level."""
+        return self._duty_cycle_level
+
+    @property
+    def is_throttled(self) -> bool:
+        """Return if background commands are throttled."""
+        return self._token_bucket is not None
+
+    @property
+    def pending_commands(self) -> int:
+        """Return the number of commands, that wait for a free slot."""
+        return sum(1 for _, _, waiter in self._waiters if not waiter.done())
+
+    @property
+    def running_commands(self) -> int:
+        """Return the number of running commands."""
+        return self._running
+
+    def set_duty_cycle_level(self, level: float) -> None:
+        """Set the duty cycle level (in %) reported by the backend."""
+        self._duty_cycle_level = level
+        if level < _DUTY_CYCLE_THROTTLE_LEVEL:
+            if self._token_bucket is not None:
+                _LOGGER.debug(
+                    "SET_DUTY_CYCLE_LEVEL: stop throttling of %s at %s%%",
+                    self._interface_id,
+                    level,
+                )
+            self._token_bucket = None
+            return
+        rate = max(
+            _MIN_BACKGROUND_RATE,
+            _MAX_BACKGROUND_RATE * (100.0 - level) / (100.0 - _DUTY_CYCLE_THROTTLE_LEVEL),
+        )
+        if self._token_bucket is None:
+            _LOGGER.debug(
+                "SET_DUTY_CYCLE_LEVEL: throttle background commands of %s at %s%%",
+                self._interface_id,
+                level,
+            )
+            self._token_bucket = _TokenBucket(rate=rate, capacity=_TOKEN_BUCKET_CAPACITY)
+        else:
+            self._token_bucket.set_rate(rate=rate)
+
+    async def run(
+        self,
+        priority: CommandPriority,
+        func: Callable[..., Awaitable[_T]],
+        *args: Any,
+    ) -> _T:
+        """Run the command with the given priority."""
+        if priority == CommandPriority.BACKGROUND and (token_bucket := self._token_bucket):
+            await token_bucket.acquire()
+        await self._acquire(priority=priority)
+        try:
+            return await func(*args)
+        finally:
+            self._release()
+
+    def _slot_limit(self, priority: int) -> int:
+        """Return the number of slots, that can be used by commands with the priority."""
+        if priority == CommandPriority.INTERACTIVE or self._max_concurrency == 1:
+            return self._max_concurrency
+        return self._max_concurrency - 1
+
+    async def _acquire(self, priority: CommandPriority) -> None:
+        """Wait for a free slot."""
+        if (not self._waiters or self._waiters[0][0] > priority) and self._running < (
+            self._slot_limit(priority=priority)
+        ):
+            self._running += 1
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), waiter))
+        COMMAND_QUEUE_DEPTH.set(self._interface_id, value=len(self._waiters))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # the slot was granted, but is not used
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        """Release a slot and wake up the waiters, that can use a free slot."""
+        self._running -= 1
+        while self._waiters:
+            priority, _, waiter = self._waiters[0]
+            if waiter.done():
+                heapq.heappop(self._waiters)
+                continue
+            if self._running >= self._slot_limit(priority=priority):
+                return
+            heapq.heappop(self._waiters)
+            COMMAND_QUEUE_DEPTH.set(self._interface_id, value=len(self._waiters))
+            self._running += 1
+            waiter.set_result(None)
+
+
+class _TokenBucket:
+    """Token bucket to limit the rate of commands."""
+
+    __slots__ = (
+        "_capacity",
+        "_rate",
+        "_tokens",
+        "_updated",
+    )
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Init the token bucket."""
+        self._capacity: Final = capacity
+        self._rate: float = rate
+        self._tokens: float = capacity
+        self._updated: float = time.monotonic()
+
+    def set_rate(self, rate: float) -> None:
+        """Set the rate of tokens per second."""
+        self._refill()
+        self._rate = rate
+
+    async def acquire(self) -> None:
+        """Wait for a token."""
+        while True:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self._rate)
+
+    def _refill(self) -> None:
+        """Refill the tokens since the last update."""
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
@@ -8,6 +8,7 @@ from enum import Enum, IntEnum, StrEnum
 import errno
 import logging
 from ssl import SSLError
+import time
 from typing import Any, Final, TypeVar
 import xmlrpc.client
 
@@ -19,6 +20,7 @@ from hahomematic.exceptions import (
     NoConnection,
     UnsupportedException,
 )
+from hahomematic.performance import XML_RPC_CALL_SECONDS
 from hahomematic.support import get_tls_context, reduce_args
 
 _LOGGER: Final = logging.getLogger(__name__)
@@ -130,12 +132,18 @@ class XmlRpcProxy(xmlrpc.client.ServerProxy):
             ):
                 args = _cleanup_args(*args)
                 _LOGGER.debug("__ASYNC_REQUEST: %s", args)
-                async with asyncio.timeout(_ASYNC_REQUEST_TIMEOUT):
-                    result = await self._async_add_proxy_executor_job(
-                        # pylint: disable=protected-access
-                        parent._ServerProxy__request,  # type: ignore[attr-defined]
-                        self,
-                        *args,
+                started = time.perf_counter()
+                try:
+                    async with asyncio.timeout(_ASYNC_REQUEST_TIMEOUT):
+                        result = await self._async_add_proxy_executor_job(
+                            # pylint: disable=protected-access
+                            parent._ServerProxy__request,  # type: ignore[attr-defined]
+                            self,
+                            *args,
+                        )
+                finally:
+                    XML_RPC_CALL_SECONDS.observe(
+                        self.interface_id, str(method), value=time.perf_counter() - started
                     )
                 _LOGGER.debug("__ASYNC_REQUEST: result: %s", result)
                 self._connection_state.remove_issue(issuer=self, iid=self.interface_id)
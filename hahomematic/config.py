@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from hahomematic.const import (
+    DEFAULT_COMMAND_CONCURRENCY,
     DEFAULT_CONNECTION_CHECKER_INTERVAL,
     DEFAULT_JSON_SESSION_AGE,
     DEFAULT_PING_PONG_MISMATCH_COUNT,
@@ -10,6 +11,7 @@ from hahomematic.const import (
 )
 
 CALLBACK_WARN_INTERVAL = DEFAULT_CONNECTION_CHECKER_INTERVAL * 40
+COMMAND_CONCURRENCY = DEFAULT_COMMAND_CONCURRENCY
 CONNECTION_CHECKER_INTERVAL = DEFAULT_CONNECTION_CHECKER_INTERVAL
 JSON_SESSION_AGE = DEFAULT_JSON_SESSION_AGE
 PING_PONG_MISMATCH_COUNT = DEFAULT_PING_PONG_MISMATCH_COUNT
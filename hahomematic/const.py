@@ -6,9 +6,13 @@ from datetime import datetime
 from enum import Enum, IntEnum, StrEnum
 from typing import Final
 
+DEFAULT_COMMAND_CONCURRENCY: Final = 2  # concurrent commands per interface
 DEFAULT_CONNECTION_CHECKER_INTERVAL: Final = 15  # check if connection is available via rpc ping
 DEFAULT_ENCODING: Final = "UTF-8"
 DEFAULT_JSON_SESSION_AGE: Final = 90
+DEFAULT_MAX_CONCURRENT_JSON_RPC_REQUESTS: Final = 5  # in-flight requests to the json-rpc api
+DEFAULT_MAX_CONCURRENT_REFRESHES: Final = 10  # concurrent entity loads of a data refresh
+DEFAULT_MAX_CONCURRENT_WRITES: Final = 10  # concurrent channels of a batch write
 DEFAULT_PING_PONG_MISMATCH_COUNT: Final = 10
 DEFAULT_RECONNECT_WAIT: Final = 120  # wait with reconnect after a first ping was successful
 DEFAULT_TIMEOUT: Final = 60  # default timeout for a connection
@@ -16,11 +20,13 @@ DEFAULT_TLS: Final = False
 DEFAULT_VERIFY_TLS: Final = False
 
 REGA_SCRIPT_FETCH_ALL_DEVICE_DATA: Final = "fetch_all_device_data.fn"
+REGA_SCRIPT_FETCH_DEVICE_METADATA: Final = "fetch_device_metadata.fn"
 REGA_SCRIPT_GET_SERIAL: Final = "get_serial.fn"
 REGA_SCRIPT_PATH: Final = "../rega_scripts"
 REGA_SCRIPT_SET_SYSTEM_VARIABLE: Final = "set_system_variable.fn"
 REGA_SCRIPT_SYSTEM_VARIABLES_EXT_MARKER: Final = "get_system_variables_ext_marker.fn"
 
+DEFAULT_DEVICE_DEFINITIONS_ARCHIVE: Final = "export_device_definitions.zip"
 DEFAULT_DEVICE_DESCRIPTIONS_DIR: Final = "export_device_descriptions"
 DEFAULT_PARAMSET_DESCRIPTIONS_DIR: Final = "export_paramset_descriptions"
 
@@ -95,6 +101,14 @@ class CallSource(StrEnum):
     MANUAL_OR_SCHEDULED: Final = "manual_or_scheduled"
 
 
+class CommandPriority(IntEnum):
+    """Enum with priorities of backend commands. Lower values are executed first."""
+
+    INTERACTIVE: Final = 0
+    EVENT: Final = 1
+    BACKGROUND: Final = 2
+
+
 class DataOperationResult(Enum):
     """Enum with data operation results."""
 
@@ -129,6 +143,7 @@ class Description(StrEnum):
     TYPE = "TYPE"
     UNIT = "UNIT"
     VALUE_LIST = "VALUE_LIST"
+    VERSION = "VERSION"
 
 
 class DeviceFirmwareState(StrEnum):
@@ -210,6 +225,7 @@ class Parameter(StrEnum):
     CURRENT_ILLUMINATION = "CURRENT_ILLUMINATION"
     DEVICE_OPERATION_MODE = "DEVICE_OPERATION_MODE"
     DIRECTION = "DIRECTION"
+    DUTY_CYCLE_LEVEL = "DUTY_CYCLE_LEVEL"
     ERROR = "ERROR"
     ERROR_JAMMED = "ERROR_JAMMED"
     LED_STATUS = "LED_STATUS"
@@ -284,6 +300,24 @@ class ProductGroup(StrEnum):
     VIRTUAL: Final = "VirtualDevices"
 
 
+class RefreshJob(StrEnum):
+    """Enum with the jobs of the refresh scheduler."""
+
+    FIRMWARE: Final = "firmware"
+    MASTER: Final = "master"
+    PROGRAMS: Final = "programs"
+    SYSVARS: Final = "sysvars"
+
+
+# {job, interval in seconds}
+DEFAULT_REFRESH_INTERVALS: Final[dict[RefreshJob, float]] = {
+    RefreshJob.FIRMWARE: 300,  # devices with a running firmware update
+    RefreshJob.MASTER: 86400,
+    RefreshJob.PROGRAMS: 3600,
+    RefreshJob.SYSVARS: 30,
+}
+
+
 class InterfaceName(StrEnum):
     """Enum with homematic interface names."""
 
@@ -322,6 +356,7 @@ class SystemEvent(StrEnum):
     NEW_DEVICES = "newDevices"
     REPLACE_DEVICE = "replaceDevice"
     RE_ADDED_DEVICE = "readdedDevice"
+    STARTUP_REPORT = "startupReport"
     UPDATE_DEVICE = "updateDevice"
 
 
@@ -3,13 +3,233 @@
 from __future__ import annotations
 
 import argparse
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
 import sys
-from typing import Any
-from xmlrpc.client import ServerProxy
+import threading
+from typing import Any, Final, TextIO, TypeVar, cast
+from xmlrpc.client import Fault, ServerProxy
+
+import orjson
 
 from hahomematic.const import ParamsetKey
 from hahomematic.support import build_headers, build_xml_rpc_uri, get_tls_context
 
+DEFAULT_MULTICALL_SIZE: Final = 50
+
+_GET_PARAMSET: Final = "getParamset"
+_GET_VALUE: Final = "getValue"
+_PUT_PARAMSET: Final = "putParamset"
+_SET_VALUE: Final = "setValue"
+# {method, keys required by the call}
+_REQUIRED_KEYS: Final[dict[str, tuple[str, ...]]] = {
+    _GET_PARAMSET: ("address", "paramset_key"),
+    _GET_VALUE: ("address", "parameter"),
+    _PUT_PARAMSET: ("address", "paramset_key", "parameter", "value"),
+    _SET_VALUE: ("address", "parameter", "value"),
+}
+
+_T = TypeVar("_T")
+
+
+def convert_value(value: str, value_type: str | None) -> Any:
+    """Convert the value of the commandline to the type."""
+    if value_type == "int":
+        return int(value)
+    if value_type == "float":
+        return float(value)
+    if value_type == "bool":
+        return bool(int(value))
+    return value
+
+
+def parse_operation(line: str, paramset_key: str, value_type: str | None) -> dict[str, Any] | None:
+    """
+    Parse an operation of the batch input.
+
+    A line is either a json object with method, address, parameter, paramset_key and value,
+    or "ADDRESS PARAMETER [VALUE]". Empty lines and comments return None.
+    """
+    if not (line := line.strip()) or line.startswith("#"):
+        return None
+    if line.startswith("{"):
+        operation: dict[str, Any] = orjson.loads(line)
+        operation.setdefault("paramset_key", paramset_key)
+    else:
+        address, parameter, *value = line.split(maxsplit=2)
+        operation = {"address": address, "parameter": parameter, "paramset_key": paramset_key}
+        if value:
+            operation["value"] = convert_value(value=value[0], value_type=value_type)
+    if "method" not in operation:
+        is_values = operation["paramset_key"] == ParamsetKey.VALUES
+        if "value" in operation:
+            operation["method"] = _SET_VALUE if is_values else _PUT_PARAMSET
+        else:
+            operation["method"] = _GET_VALUE if is_values else _GET_PARAMSET
+    if (required_keys := _REQUIRED_KEYS.get(operation["method"])) is None:
+        raise ValueError(f"Unsupported method {operation['method']}")
+    if missing_keys := [key for key in required_keys if key not in operation]:
+        raise ValueError(f"Missing {', '.join(missing_keys)} for {operation['method']}")
+    return operation
+
+
+def _get_call(operation: dict[str, Any]) -> tuple[str, list[Any]]:
+    """Return the method name and the params of the operation."""
+    method = operation["method"]
+    if method == _GET_VALUE:
+        return method, [operation["address"], operation["parameter"]]
+    if method == _SET_VALUE:
+        return method, [operation["address"], operation["parameter"], operation["value"]]
+    if method == _GET_PARAMSET:
+        return method, [operation["address"], operation["paramset_key"]]
+    return method, [
+        operation["address"],
+        operation["paramset_key"],
+        {operation["parameter"]: operation["value"]},
+    ]
+
+
+def _get_result(operation: dict[str, Any], result: Any) -> dict[str, Any]:
+    """Return the output of an operation."""
+    output: dict[str, Any] = {
+        key: operation[key] for key in ("method", "address", "parameter") if key in operation
+    }
+    if isinstance(result, dict) and "faultCode" in result:
+        output["error"] = result.get("faultString")
+    elif operation["method"] == _GET_PARAMSET and operation.get("parameter"):
+        output["result"] = result[0].get(operation["parameter"])
+    else:
+        output["result"] = result[0]
+    return output
+
+
+def run_operations(proxy: ServerProxy, operations: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Run the operations with one system.multicall, and return the outputs.
+
+    If system.multicall is not supported, the operations are run one by one.
+    """
+    calls = [_get_call(operation=operation) for operation in operations]
+    results: list[Any]
+    try:
+        results = cast(
+            list[Any],
+            proxy.system.multicall(
+                [{"methodName": method, "params": params} for method, params in calls]
+            ),
+        )
+    except Fault:
+        results = []
+        for method, params in calls:
+            try:
+                results.append([getattr(proxy, method)(*params)])
+            except Fault as fex:
+                results.append({"faultCode": fex.faultCode, "faultString": fex.faultString})
+    return [
+        _get_result(operation=operation, result=result)
+        for operation, result in zip(operations, results, strict=True)
+    ]
+
+
+def run_batch(
+    lines: Iterable[str],
+    create_proxy: Callable[[], ServerProxy],
+    output: TextIO,
+    paramset_key: str = ParamsetKey.VALUES,
+    value_type: str | None = None,
+    multicall_size: int = DEFAULT_MULTICALL_SIZE,
+    concurrency: int = 1,
+) -> int:
+    """
+    Run the operations of the lines, and stream the outputs as json lines.
+
+    The operations are grouped into system.multicalls, that are run concurrently.
+    Only a bounded number of chunks is read ahead, so the outputs are streamed,
+    while the lines are read. Lines, that can't be parsed, are output as error.
+    Each thread uses one persistent connection. Returns the number of failed operations.
+    """
+    local = threading.local()
+
+    def run_chunk(items: list[dict[str, Any] | _InvalidLine]) -> list[dict[str, Any]]:
+        operations = [item for item in items if not isinstance(item, _InvalidLine)]
+        results: Iterator[dict[str, Any]] = iter(())
+        if operations:
+            if (proxy := getattr(local, "proxy", None)) is None:
+                proxy = local.proxy = create_proxy()
+            try:
+                results = iter(run_operations(proxy=proxy, operations=operations))
+            except Exception as ex:
+                error = f"{type(ex).__name__}: {ex}"
+                results = iter(
+                    [
+                        {
+                            key: operation[key]
+                            for key in ("method", "address", "parameter")
+                            if key in operation
+                        }
+                        | {"error": error}
+                        for operation in operations
+                    ]
+                )
+        return [
+            {"line": item.line, "error": item.error}
+            if isinstance(item, _InvalidLine)
+            else next(results)
+            for item in items
+        ]
+
+    def write_outputs(outputs: list[dict[str, Any]]) -> int:
+        for result in outputs:
+            output.write(orjson.dumps(result, default=str).decode() + "\n")
+        output.flush()
+        return sum("error" in result for result in outputs)
+
+    items = _parse_lines(lines=lines, paramset_key=paramset_key, value_type=value_type)
+    failed = 0
+    window = max(concurrency, 1) * 2
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+        pending: deque[Future[list[dict[str, Any]]]] = deque()
+        for chunk in _get_chunks(items, size=multicall_size):
+            pending.append(executor.submit(run_chunk, chunk))
+            # write the finished outputs in order, and wait, if the window is full
+            while pending and (pending[0].done() or len(pending) >= window):
+                failed += write_outputs(outputs=pending.popleft().result())
+        while pending:
+            failed += write_outputs(outputs=pending.popleft().result())
+    return failed
+
+
+@dataclass(frozen=True, slots=True)
+class _InvalidLine:
+    """A line of the batch input, that can't be parsed."""
+
+    line: str
+    error: str
+
+
+def _parse_lines(
+    lines: Iterable[str], paramset_key: str, value_type: str | None
+) -> Iterator[dict[str, Any] | _InvalidLine]:
+    """Return the operations of the lines, and the lines, that can't be parsed."""
+    for line in lines:
+        try:
+            if operation := parse_operation(
+                line=line, paramset_key=paramset_key, value_type=value_type
+            ):
+                yield operation
+        except Exception as ex:
+            yield _InvalidLine(line=line.strip(), error=f"{type(ex).__name__}: {ex}")
+
+
+def _get_chunks(operations: Iterable[_T], size: int) -> Iterator[list[_T]]:
+    """Return the operations in chunks of the size."""
+    iterator = iter(operations)
+    while chunk := list(islice(iterator, max(size, 1))):
+        yield chunk
+
 
 def main() -> None:
     """Start the cli."""
@@ -68,7 +288,6 @@ def main() -> None:
     parser.add_argument(
         "--address",
         "-a",
-        required=True,
         type=str,
         help="Address of HomeMatic device, including channel",
     )
@@ -80,7 +299,6 @@ def main() -> None:
     )
     parser.add_argument(
         "--parameter",
-        required=True,
         help="Parameter of HomeMatic device",
     )
     parser.add_argument(
@@ -93,7 +311,28 @@ def main() -> None:
         choices=["int", "float", "bool"],
         help="Type of value when setting a value. Using str if not provided",
     )
+    parser.add_argument(
+        "--batch",
+        "-b",
+        type=str,
+        help="File with operations as json lines or 'ADDRESS PARAMETER [VALUE]', - for stdin",
+    )
+    parser.add_argument(
+        "--multicall-size",
+        type=int,
+        default=DEFAULT_MULTICALL_SIZE,
+        help=f"Operations per system.multicall in batch mode. Default: {DEFAULT_MULTICALL_SIZE}",
+    )
+    parser.add_argument(
+        "--concurrency",
+        "-c",
+        type=int,
+        default=1,
+        help="Concurrent connections in batch mode. Default: 1",
+    )
     args = parser.parse_args()
+    if args.batch is None and (args.address is None or args.parameter is None):
+        parser.error("--address and --parameter are required without --batch")
 
     url = build_xml_rpc_uri(
         host=args.host,
@@ -105,6 +344,20 @@ def main() -> None:
     context = None
     if args.tls:
         context = get_tls_context(verify_tls=args.verify)
+
+    if args.batch is not None:
+        with sys.stdin if args.batch == "-" else open(args.batch, encoding="utf-8") as lines:
+            failed = run_batch(
+                lines=lines,
+                create_proxy=lambda: ServerProxy(url, context=context, headers=headers),
+                output=sys.stdout,
+                paramset_key=args.paramset_key,
+                value_type=args.type,
+                multicall_size=args.multicall_size,
+                concurrency=args.concurrency,
+            )
+        sys.exit(1 if failed else 0)
+
     proxy = ServerProxy(url, context=context, headers=headers)
 
     try:
@@ -116,15 +369,7 @@ def main() -> None:
                 pass
             sys.exit(0)
         elif args.paramset_key == ParamsetKey.VALUES and args.value:
-            value: Any
-            if args.type == "int":
-                value = int(args.value)
-            elif args.type == "float":
-                value = float(args.value)
-            elif args.type == "bool":
-                value = bool(int(args.value))
-            else:
-                value = args.value
+            value = convert_value(value=args.value, value_type=args.type)
             proxy.setValue(args.address, args.parameter, value)
             sys.exit(0)
         elif args.paramset_key == ParamsetKey.MASTER and args.value is None:
@@ -136,14 +381,7 @@ def main() -> None:
                     pass
             sys.exit(0)
         elif args.paramset_key == ParamsetKey.MASTER and args.value:
-            if args.type == "int":
-                value = int(args.value)
-            elif args.type == "float":
-                value = float(args.value)
-            elif args.type == "bool":
-                value = bool(int(args.value))
-            else:
-                value = args.value
+            value = convert_value(value=args.value, value_type=args.type)
             proxy.putParamset(args.address, args.paramset_key, {args.parameter: value})
             sys.exit(0)
     except Exception:
@@ -1,30 +1,808 @@
-"""Decorators used within hahomematic."""
+"""Decorators and metrics used within hahomematic."""
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Callable, Collection, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
 from datetime import datetime
 from functools import wraps
 import logging
-from typing import Any, Final, TypeVar
+import math
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import Any, BinaryIO, Final, TypeVar
+
+import orjson
+
+from hahomematic.const import FILE_DEVICES, FILE_PARAMSETS
+from hahomematic.exceptions import HaHomematicException
+from hahomematic.support import cancel_task
 
 _LOGGER: Final = logging.getLogger(__name__)
 _CallableT = TypeVar("_CallableT", bound=Callable[..., Any])
 
+DEFAULT_LATENCY_BUCKETS: Final[tuple[float, ...]] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class _Metric:
+    """Base class for metrics."""
+
+    __slots__ = (
+        "documentation",
+        "label_names",
+        "name",
+        "_lock",
+        "_values",
+    )
+
+    metric_type: str = ""
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...]) -> None:
+        """Init the metric."""
+        self.name: Final = name
+        self.documentation: Final = documentation
+        self.label_names: Final = label_names
+        self._lock: Final = threading.Lock()
+        self._values: Final[dict[tuple[str, ...], Any]] = {}
+
+    def clear(self) -> None:
+        """Clear the recorded values."""
+        with self._lock:
+            self._values.clear()
+
+    def get_samples(self) -> list[dict[str, Any]]:
+        """Return the recorded samples."""
+        with self._lock:
+            return [
+                {"labels": dict(zip(self.label_names, label_values, strict=True)), "value": value}
+                for label_values, value in self._values.items()
+            ]
+
+    def render_samples(self) -> list[str]:
+        """Render the recorded samples in the prometheus text format."""
+        return [
+            f"{self.name}{_render_labels(sample['labels'])} {_render_value(sample['value'])}"
+            for sample in self.get_samples()
+        ]
+
+
+class Counter(_Metric):
+    """Counter, that only increases."""
+
+    __slots__ = ()
+
+    metric_type = "counter"
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        """Increase the counter."""
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def get(self, *label_values: str) -> float:
+        """Return the value of the counter."""
+        return float(self._values.get(label_values, 0.0))
+
+
+class Gauge(_Metric):
+    """Gauge, that can be set to any value."""
+
+    __slots__ = ()
+
+    metric_type = "gauge"
+
+    def set(self, *label_values: str, value: float) -> None:
+        """Set the gauge."""
+        with self._lock:
+            self._values[label_values] = value
+
+    def get(self, *label_values: str) -> float:
+        """Return the value of the gauge."""
+        return float(self._values.get(label_values, 0.0))
+
+
+class Histogram(_Metric):
+    """Histogram of observed values with fixed buckets."""
+
+    __slots__ = ("buckets",)
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...],
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        """Init the histogram."""
+        super().__init__(name=name, documentation=documentation, label_names=label_names)
+        self.buckets: Final = tuple(sorted(buckets))
+
+    def observe(self, *label_values: str, value: float) -> None:
+        """Observe a value."""
+        with self._lock:
+            if (data := self._values.get(label_values)) is None:
+                # bucket counts, one more for +Inf, followed by sum
+                data = self._values[label_values] = [0] * (len(self.buckets) + 1) + [0.0]
+            data[bisect_left(self.buckets, value)] += 1
+            data[-1] += value
+
+    def get_samples(self) -> list[dict[str, Any]]:
+        """Return the recorded samples with cumulative bucket counts."""
+        samples: list[dict[str, Any]] = []
+        with self._lock:
+            for label_values, data in self._values.items():
+                cumulative = 0
+                buckets: dict[str, int] = {}
+                for upper_bound, bucket_count in zip(
+                    (*self.buckets, math.inf), data[:-1], strict=True
+                ):
+                    cumulative += bucket_count
+                    buckets[_render_value(upper_bound)] = cumulative
+                samples.append(
+                    {
+                        "labels": dict(zip(self.label_names, label_values, strict=True)),
+                        "buckets": buckets,
+                        "count": cumulative,
+                        "sum": data[-1],
+                    }
+                )
+        return samples
+
+    def render_samples(self) -> list[str]:
+        """Render the recorded samples in the prometheus text format."""
+        lines: list[str] = []
+        for sample in self.get_samples():
+            labels = sample["labels"]
+            for upper_bound, bucket_count in sample["buckets"].items():
+                lines.append(
+                    f"{self.name}_bucket{_render_labels({**labels, 'le': upper_bound})} "
+                    f"{bucket_count}"
+                )
+            lines.append(f"{self.name}_sum{_render_labels(labels)} {_render_value(sample['sum'])}")
+            lines.append(f"{self.name}_count{_render_labels(labels)} {sample['count']}")
+        return lines
+
+
+class MetricsRegistry:
+    """Registry of metrics with snapshot and prometheus text rendering."""
+
+    def __init__(self) -> None:
+        """Init the metrics registry."""
+        self._metrics: Final[dict[str, _Metric]] = {}
+
+    def counter(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> Counter:
+        """Return the counter with the name, and create it if required."""
+        return self._get_or_create(Counter, name, documentation, label_names)  # type: ignore[return-value]
+
+    def gauge(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> Gauge:
+        """Return the gauge with the name, and create it if required."""
+        return self._get_or_create(Gauge, name, documentation, label_names)  # type: ignore[return-value]
+
+    def histogram(
+        self, name: str, documentation: str, label_names: tuple[str, ...] = ()
+    ) -> Histogram:
+        """Return the histogram with the name, and create it if required."""
+        return self._get_or_create(Histogram, name, documentation, label_names)  # type: ignore[return-value]
+
+    def clear(self) -> None:
+        """Clear the recorded values of all metrics."""
+        for metric in self._metrics.values():
+            metric.clear()
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return a snapshot of all metrics."""
+        return {
+            name: {
+                "type": metric.metric_type,
+                "help": metric.documentation,
+                "samples": metric.get_samples(),
+            }
+            for name, metric in self._metrics.items()
+        }
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the prometheus text format."""
+        lines: list[str] = []
+        for name, metric in self._metrics.items():
+            lines.append(f"# HELP {name} {_escape(metric.documentation, quote=False)}")
+            lines.append(f"# TYPE {name} {metric.metric_type}")
+            lines.extend(metric.render_samples())
+        return "\n".join(lines) + "\n"
+
+    def _get_or_create(
+        self,
+        metric_class: type[_Metric],
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...],
+    ) -> _Metric:
+        """Return the metric with the name, and create it if required."""
+        if (metric := self._metrics.get(name)) is None:
+            metric = self._metrics[name] = metric_class(
+                name=name, documentation=documentation, label_names=label_names
+            )
+        elif type(metric) is not metric_class or metric.label_names != label_names:
+            raise HaHomematicException(
+                f"METRICS: metric {name} is already registered with another type or labels"
+            )
+        return metric
+
+
+def _escape(value: str, quote: bool = True) -> str:
+    """Escape a label value or help text for the prometheus text format."""
+    value = value.replace("\\", "\\\\").replace("\n", "\\n")
+    return value.replace('"', '\\"') if quote else value
+
+
+def _render_labels(labels: dict[str, str]) -> str:
+    """Render labels for the prometheus text format."""
+    if not labels:
+        return ""
+    return (
+        "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items()) + "}"
+    )
+
+
+def _render_value(value: float) -> str:
+    """Render a value for the prometheus text format."""
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value))
+
+
+METRICS: Final = MetricsRegistry()
+
+CACHE_FILE_BYTES_LOADED: Final = METRICS.counter(
+    "hahomematic_cache_file_bytes_loaded_total", "Bytes loaded from cache files.", ("file",)
+)
+CACHE_REQUESTS: Final = METRICS.counter(
+    "hahomematic_cache_requests_total", "Requests to value caches.", ("cache", "result")
+)
+COMMAND_QUEUE_DEPTH: Final = METRICS.gauge(
+    "hahomematic_command_queue_depth",
+    "Commands waiting for a free slot of the command scheduler.",
+    ("interface_id",),
+)
+EVENT_DISPATCH_SECONDS: Final = METRICS.histogram(
+    "hahomematic_event_dispatch_seconds",
+    "Duration of the dispatch of an event to the entity callbacks.",
+    ("interface_id",),
+)
+EVENTS_RECEIVED: Final = METRICS.counter(
+    "hahomematic_events_received_total", "Events received from the backend.", ("interface_id",)
+)
+EXECUTION_SECONDS: Final = METRICS.histogram(
+    "hahomematic_execution_seconds",
+    "Duration of functions decorated with measure_execution_time.",
+    ("function",),
+)
+JSON_RPC_CALL_SECONDS: Final = METRICS.histogram(
+    "hahomematic_json_rpc_call_seconds", "Duration of JSON-RPC calls.", ("method",)
+)
+LOOP_BLOCKED_TOTAL: Final = METRICS.counter(
+    "hahomematic_loop_blocked_total",
+    "Blocking calls on the event loop by hahomematic call site.",
+    ("name", "call_site"),
+)
+LOOP_LAG_SECONDS: Final = METRICS.histogram(
+    "hahomematic_loop_lag_seconds", "Scheduling delay of the event loop.", ("name",)
+)
+RECONNECTS: Final = METRICS.counter(
+    "hahomematic_reconnects_total", "Reconnects of clients.", ("interface_id",)
+)
+REFRESH_JOB_RUNS: Final = METRICS.counter(
+    "hahomematic_refresh_job_runs_total", "Runs of refresh jobs by result.", ("job", "result")
+)
+REFRESH_JOB_SECONDS: Final = METRICS.histogram(
+    "hahomematic_refresh_job_seconds", "Duration of refresh jobs.", ("job",)
+)
+XML_RPC_CALL_SECONDS: Final = METRICS.histogram(
+    "hahomematic_xml_rpc_call_seconds", "Duration of XML-RPC calls.", ("interface_id", "method")
+)
+
+DEFAULT_TRACE_SAMPLES: Final = 1000
+
+# perf_counter time, when the currently traced event has been received.
+_EVENT_TRACE_STARTED: Final[ContextVar[float | None]] = ContextVar(
+    "event_trace_started", default=None
+)
+
+
+class EventTracer:
+    """
+    Trace the stages of events from the backend to the entity callbacks.
+
+    The durations of the last samples are kept per stage.
+    Tracing is disabled by default.
+    """
+
+    __slots__ = (
+        "enabled",
+        "_max_samples",
+        "_samples",
+    )
+
+    def __init__(self) -> None:
+        """Init the event tracer."""
+        self.enabled: bool = False
+        self._max_samples: int = DEFAULT_TRACE_SAMPLES
+        self._samples: Final[dict[str, deque[float]]] = {}
+
+    def enable(self, max_samples: int = DEFAULT_TRACE_SAMPLES) -> None:
+        """Enable tracing with the number of samples, that are kept per stage."""
+        if max_samples != self._max_samples:
+            self._samples.clear()
+        self._max_samples = max_samples
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Disable tracing."""
+        self.enabled = False
+
+    def clear(self) -> None:
+        """Clear the recorded samples."""
+        self._samples.clear()
+
+    def start_trace(self) -> Token[float | None] | None:
+        """Start the trace of a received event."""
+        if not self.enabled:
+            return None
+        return _EVENT_TRACE_STARTED.set(time.perf_counter())
+
+    def end_trace(self, token: Token[float | None] | None) -> None:
+        """End the trace of a received event."""
+        if token is None:
+            return
+        if (started := _EVENT_TRACE_STARTED.get()) is not None:
+            self.record(stage="total", started=started)
+        _EVENT_TRACE_STARTED.reset(token)
+
+    def record_received(self) -> None:
+        """Record the time from receiving the event until the central handles it."""
+        if (started := _EVENT_TRACE_STARTED.get()) is not None:
+            self.record(stage="receive", started=started)
+
+    def record(self, stage: str, started: float) -> None:
+        """Record the duration of the stage, that started at the perf_counter time."""
+        duration = time.perf_counter() - started
+        if (samples := self._samples.get(stage)) is None:
+            samples = self._samples.setdefault(stage, deque(maxlen=self._max_samples))
+        samples.append(duration)
+
+    def get_statistics(
+        self, percentiles: tuple[float, ...] = (50.0, 90.0, 99.0)
+    ) -> dict[str, dict[str, float]]:
+        """Return the count, max and percentiles (in seconds) per stage."""
+        statistics: dict[str, dict[str, float]] = {}
+        for stage, samples in tuple(self._samples.items()):
+            if not (durations := sorted(samples)):
+                continue
+            stage_statistics: dict[str, float] = {
+                "count": len(durations),
+                "max": durations[-1],
+            }
+            for percentile in percentiles:
+                index = max(math.ceil(percentile / 100 * len(durations)) - 1, 0)
+                stage_statistics[f"p{percentile:g}"] = durations[index]
+            statistics[stage] = stage_statistics
+        return statistics
+
+
+EVENT_TRACER: Final = EventTracer()
+
+
+def get_callback_name(callback: Callable) -> str:
+    """Return a name of the callback, that includes the class of bound methods."""
+    if (instance := getattr(callback, "__self__", None)) is not None:
+        return f"{type(instance).__name__}.{getattr(callback, '__name__', '')}"
+    return str(getattr(callback, "__qualname__", repr(callback)))
+
+
+class EventRecorder:
+    """
+    Record the events received from the backend into a trace file.
+
+    Each line of the trace file is a json array of
+    [seconds since start, interface_id, channel_address, parameter, value].
+    Recording is disabled by default.
+    """
+
+    __slots__ = (
+        "_event_count",
+        "_file",
+        "_lock",
+        "_started",
+    )
+
+    def __init__(self) -> None:
+        """Init the event recorder."""
+        self._event_count: int = 0
+        self._file: BinaryIO | None = None
+        self._lock: Final = threading.Lock()
+        self._started: float = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        """Return if events are recorded."""
+        return self._file is not None
+
+    def start(self, path: str) -> None:
+        """Start recording events into the trace file."""
+        with self._lock:
+            if self._file is not None:
+                raise HaHomematicException("EVENT_RECORDER: Recording is already started")
+            self._file = open(path, "wb")  # pylint: disable=consider-using-with
+            self._event_count = 0
+            self._started = time.perf_counter()
+
+    def stop(self) -> int:
+        """Stop recording and return the number of recorded events."""
+        with self._lock:
+            if (file := self._file) is not None:
+                self._file = None
+                file.close()
+            return self._event_count
+
+    def record(self, interface_id: str, channel_address: str, parameter: str, value: Any) -> None:
+        """Record an event."""
+        line = orjson.dumps(
+            (
+                round(time.perf_counter() - self._started, 6),
+                interface_id,
+                channel_address,
+                parameter,
+                value,
+            ),
+            # values like xml-rpc DateTime are not serializable by orjson
+            default=str,
+        )
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line + b"\n")
+            self._event_count += 1
+
+
+EVENT_RECORDER: Final = EventRecorder()
+
+
+def read_event_trace(path: str) -> list[tuple[float, str, str, str, Any]]:
+    """Read the events of a trace file, that has been written by the event recorder."""
+    with open(path, "rb") as fptr:
+        return [tuple(orjson.loads(line)) for line in fptr if line.strip()]
+
+
+DEFAULT_LOOP_LAG_INTERVAL: Final = 0.1
+DEFAULT_LOOP_BLOCKING_THRESHOLD: Final = 0.2
+DEFAULT_LOOP_BLOCKING_REPORTS: Final = 50
+
+_HAHOMEMATIC_PATH: Final = os.path.dirname(os.path.abspath(__file__)) + os.sep
+_PACKAGE_ROOT: Final = os.path.dirname(os.path.dirname(_HAHOMEMATIC_PATH))
+_PERFORMANCE_FILE: Final = os.path.abspath(__file__)
+
+
+@dataclass(frozen=True, slots=True)
+class BlockingReport:
+    """Report of a call, that blocks the event loop."""
+
+    detected_at: datetime
+    blocked_seconds: float
+    call_site: str | None
+    stack: tuple[str, ...]
+
+
+class LoopLagMonitor:
+    """
+    Monitor the scheduling delay of the event loop.
+
+    A sampling task measures the lag of the event loop.
+    A watchdog thread captures the stack of the event loop thread,
+    if the loop is blocked longer than the blocking threshold,
+    and attributes the blocking time to the innermost hahomematic call site.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        interval: float = DEFAULT_LOOP_LAG_INTERVAL,
+        blocking_threshold: float = DEFAULT_LOOP_BLOCKING_THRESHOLD,
+        max_reports: int = DEFAULT_LOOP_BLOCKING_REPORTS,
+    ) -> None:
+        """Init the loop lag monitor."""
+        self._name: Final = name
+        self._interval: Final = interval
+        self._blocking_threshold: Final = blocking_threshold
+        self._reports: Final[deque[BlockingReport]] = deque(maxlen=max_reports)
+        self._heartbeat: float = 0.0
+        self._reported_heartbeat: float = 0.0
+        self._loop_thread_id: int | None = None
+        self._max_lag: float = 0.0
+        self._stop_event: Final = threading.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """Return if the monitor is running."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def max_lag(self) -> float:
+        """Return the max measured lag in seconds."""
+        return self._max_lag
+
+    @property
+    def reports(self) -> tuple[BlockingReport, ...]:
+        """Return the reports of blocking calls."""
+        return tuple(self._reports)
+
+    def start(self) -> None:
+        """Start the monitor. Must be called from within the event loop."""
+        if self.is_running:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.perf_counter()
+        self._stop_event.clear()
+        self._task = asyncio.create_task(
+            self._sample_lag(), name=f"LoopLagMonitor for {self._name}"
+        )
+        self._watchdog = threading.Thread(
+            target=self._watch, name=f"LoopLagWatchdog for {self._name}", daemon=True
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        """Stop the monitor."""
+        self._stop_event.set()
+        if (task := self._task) is not None:
+            self._task = None
+            await cancel_task(task)
+        if (watchdog := self._watchdog) is not None:
+            self._watchdog = None
+            await asyncio.get_running_loop().run_in_executor(None, watchdog.join)
+
+    async def _sample_lag(self) -> None:
+        """Periodically measure the scheduling delay of the event loop."""
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self._interval)
+            self._heartbeat = now = time.perf_counter()
+            lag = max(now - started - self._interval, 0.0)
+            self._max_lag = max(self._max_lag, lag)
+            LOOP_LAG_SECONDS.observe(self._name, value=lag)
+
+    def _watch(self) -> None:
+        """Capture the stack of the event loop thread, if the loop is blocked."""
+        while not self._stop_event.wait(self._blocking_threshold / 2):
+            heartbeat = self._heartbeat
+            blocked_seconds = time.perf_counter() - heartbeat - self._interval
+            if blocked_seconds < self._blocking_threshold or heartbeat == self._reported_heartbeat:
+                continue
+            if (frame := sys._current_frames().get(self._loop_thread_id or 0)) is None:
+                continue
+            # report each blocking only once
+            self._reported_heartbeat = heartbeat
+            self._add_report(blocked_seconds=blocked_seconds, stack=traceback.extract_stack(frame))
+
+    def _add_report(self, blocked_seconds: float, stack: traceback.StackSummary) -> None:
+        """Add a report of a blocking call."""
+        call_site: str | None = None
+        for frame_summary in reversed(stack):
+            if (
+                frame_summary.filename.startswith(_HAHOMEMATIC_PATH)
+                and frame_summary.filename != _PERFORMANCE_FILE
+            ):
+                call_site = (
+                    f"{os.path.relpath(frame_summary.filename, _PACKAGE_ROOT)}"
+                    f":{frame_summary.lineno} in {frame_summary.name}"
+                )
+                break
+        self._reports.append(
+            BlockingReport(
+                detected_at=datetime.now(),
+                blocked_seconds=blocked_seconds,
+                call_site=call_site,
+                stack=tuple(stack.format()),
+            )
+        )
+        LOOP_BLOCKED_TOTAL.inc(self._name, call_site or "unknown")
+        _LOGGER.warning(
+            "LOOP_LAG_MONITOR: Event loop of %s blocked for at least %.3fs at %s",
+            self._name,
+            blocked_seconds,
+            call_site or "unknown call site",
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class StartupPhase:
+    """Wall time and work of a phase of the startup."""
+
+    name: str
+    seconds: float
+    xml_rpc_calls: dict[str, int]
+    json_rpc_calls: dict[str, int]
+    cache_bytes_loaded: int
+    devices_created: int
+    entities_created: int
+
+    @property
+    def devices_per_second(self) -> float:
+        """Return the devices created per second."""
+        return self.devices_created / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def entities_per_second(self) -> float:
+        """Return the entities created per second."""
+        return self.entities_created / self.seconds if self.seconds > 0 else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the phase as dict."""
+        return {
+            "name": self.name,
+            "seconds": self.seconds,
+            "xml_rpc_calls": self.xml_rpc_calls,
+            "json_rpc_calls": self.json_rpc_calls,
+            "cache_bytes_loaded": self.cache_bytes_loaded,
+            "devices_created": self.devices_created,
+            "entities_created": self.entities_created,
+            "devices_per_second": self.devices_per_second,
+            "entities_per_second": self.entities_per_second,
+        }
+
+
+class StartupTimeline:
+    """
+    Timeline of the startup phases of a central.
+
+    The RPC calls and loaded cache bytes of a phase are taken from the metrics,
+    the created devices and entities from the provided counter function.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        interface_ids: Collection[str],
+        get_created_counts: Callable[[], tuple[int, int]],
+    ) -> None:
+        """Init the startup timeline."""
+        self._name: Final = name
+        self._interface_ids: Final = frozenset(interface_ids)
+        self._cache_files: Final = frozenset(
+            (f"{name}_{FILE_DEVICES}", f"{name}_{FILE_PARAMSETS}")
+        )
+        self._get_created_counts: Final = get_created_counts
+        self._phases: Final[list[StartupPhase]] = []
+        self._started_at: Final = datetime.now()
+        self._started: Final = time.perf_counter()
+
+    @property
+    def phases(self) -> tuple[StartupPhase, ...]:
+        """Return the recorded phases."""
+        return tuple(self._phases)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Record the wall time and the work of a startup phase."""
+        xml_rpc_calls = self._get_xml_rpc_calls()
+        json_rpc_calls = _get_calls_by_method(histogram=JSON_RPC_CALL_SECONDS)
+        cache_bytes_loaded = self._get_cache_bytes_loaded()
+        devices, entities = self._get_created_counts()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            created_devices, created_entities = self._get_created_counts()
+            self._phases.append(
+                StartupPhase(
+                    name=name,
+                    seconds=seconds,
+                    xml_rpc_calls=_diff_calls(
+                        before=xml_rpc_calls, after=self._get_xml_rpc_calls()
+                    ),
+                    json_rpc_calls=_diff_calls(
+                        before=json_rpc_calls,
+                        after=_get_calls_by_method(histogram=JSON_RPC_CALL_SECONDS),
+                    ),
+                    cache_bytes_loaded=self._get_cache_bytes_loaded() - cache_bytes_loaded,
+                    devices_created=created_devices - devices,
+                    entities_created=created_entities - entities,
+                )
+            )
+
+    def get_report(self) -> dict[str, Any]:
+        """Return the startup report."""
+        seconds = time.perf_counter() - self._started
+        devices, entities = self._get_created_counts()
+        return {
+            "name": self._name,
+            "started_at": self._started_at.isoformat(),
+            "seconds": seconds,
+            "devices": devices,
+            "entities": entities,
+            "devices_per_second": devices / seconds if seconds > 0 else 0.0,
+            "entities_per_second": entities / seconds if seconds > 0 else 0.0,
+            "phases": [phase.as_dict() for phase in self._phases],
+        }
+
+    def _get_xml_rpc_calls(self) -> dict[str, int]:
+        """Return the XML-RPC calls of the central by method."""
+        return _get_calls_by_method(
+            histogram=XML_RPC_CALL_SECONDS,
+            label_filter=lambda labels: labels["interface_id"] in self._interface_ids,
+        )
+
+    def _get_cache_bytes_loaded(self) -> int:
+        """Return the bytes loaded from the cache files of the central."""
+        return int(
+            sum(
+                sample["value"]
+                for sample in CACHE_FILE_BYTES_LOADED.get_samples()
+                if sample["labels"]["file"] in self._cache_files
+            )
+        )
+
+
+def _get_calls_by_method(
+    histogram: Histogram, label_filter: Callable[[dict[str, str]], bool] | None = None
+) -> dict[str, int]:
+    """Return the number of calls by method of a call duration histogram."""
+    calls: dict[str, int] = {}
+    for sample in histogram.get_samples():
+        labels = sample["labels"]
+        if label_filter is None or label_filter(labels):
+            calls[labels["method"]] = calls.get(labels["method"], 0) + sample["count"]
+    return calls
+
+
+def _diff_calls(before: dict[str, int], after: dict[str, int]) -> dict[str, int]:
+    """Return the calls by method, that have been made in between."""
+    return {
+        method: count - before.get(method, 0)
+        for method, count in sorted(after.items())
+        if count > before.get(method, 0)
+    }
+
 
 def measure_execution_time(func: _CallableT) -> _CallableT:
     """Decorate function to measure the function execution time."""
 
     is_enabled = _LOGGER.isEnabledFor(level=logging.DEBUG)
+    function_name = func.__qualname__
 
     @wraps(func)
     async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
         """Wrap method."""
+        started = time.perf_counter()
         if is_enabled:
             start = datetime.now()
         try:
             return await func(*args, **kwargs)
         finally:
+            EXECUTION_SECONDS.observe(function_name, value=time.perf_counter() - started)
             if is_enabled:
                 delta = (datetime.now() - start).total_seconds()
                 _LOGGER.info(
@@ -37,11 +815,13 @@ def measure_execution_time(func: _CallableT) -> _CallableT:
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
         """Wrap method."""
+        started = time.perf_counter()
         if is_enabled:
             start = datetime.now()
         try:
             return func(*args, **kwargs)
         finally:
+            EXECUTION_SECONDS.observe(function_name, value=time.perf_counter() - started)
             if is_enabled:
                 delta = (datetime.now() - start).total_seconds()
                 _LOGGER.info(
@@ -6,7 +6,11 @@ import logging
 from typing import Final
 
 from hahomematic.platforms import device as hmd
-from hahomematic.platforms.custom.definition import entity_definition_exists, get_entity_configs
+from hahomematic.platforms.custom.definition import (
+    build_entity_config_index,
+    entity_definition_exists,
+    get_entity_configs,
+)
 from hahomematic.platforms.custom.support import CustomConfig
 
 _LOGGER: Final = logging.getLogger(__name__)
@@ -39,6 +43,7 @@ def _importlibs() -> None:
 
     This ensures that the platform.DEVICES are loaded into ALL_DEVICES,
     and platform.BLACKLISTED_DEVICES are loaded into ALL_BLACKLISTED_DEVICES.
+    Afterwards the device type index of the entity configs is built.
     """
     importlib.import_module("hahomematic.platforms.custom.climate")
     importlib.import_module("hahomematic.platforms.custom.cover")
@@ -46,6 +51,7 @@ def _importlibs() -> None:
     importlib.import_module("hahomematic.platforms.custom.lock")
     importlib.import_module("hahomematic.platforms.custom.siren")
     importlib.import_module("hahomematic.platforms.custom.switch")
+    build_entity_config_index()
 
 
 _importlibs()
@@ -120,6 +120,14 @@ class PresetMode(StrEnum):
 class BaseClimateEntity(CustomEntity):
     """Base HomeMatic climate entity."""
 
+    __slots__ = (
+        "_e_humidity",
+        "_e_setpoint",
+        "_e_temperature",
+        "_e_temperature_maximum",
+        "_e_temperature_minimum",
+    )
+
     _platform = HmPlatform.CLIMATE
 
     def _init_entity_fields(self) -> None:
@@ -277,10 +285,22 @@ class BaseClimateEntity(CustomEntity):
 class CeSimpleRfThermostat(BaseClimateEntity):
     """Simple classic HomeMatic thermostat HM-CC-TC."""
 
+    __slots__ = ()
+
 
 class CeRfThermostat(BaseClimateEntity):
     """Classic HomeMatic thermostat like HM-CC-RT-DN."""
 
+    __slots__ = (
+        "_e_boost_mode",
+        "_e_auto_mode",
+        "_e_manu_mode",
+        "_e_comfort_mode",
+        "_e_lowering_mode",
+        "_e_control_mode",
+        "_e_valve_state",
+    )
+
     def _init_entity_fields(self) -> None:
         """Init the entity fields."""
         super()._init_entity_fields()
@@ -396,6 +416,17 @@ class CeRfThermostat(BaseClimateEntity):
 class CeIpThermostat(BaseClimateEntity):
     """HomematicIP thermostat like HmIP-eTRV-B."""
 
+    __slots__ = (
+        "_e_active_profile",
+        "_e_boost_mode",
+        "_e_control_mode",
+        "_e_heating_mode",
+        "_e_party_mode",
+        "_e_set_point_mode",
+        "_e_level",
+        "_e_state",
+    )
+
     def _init_entity_fields(self) -> None:
         """Init the entity fields."""
         super()._init_entity_fields()
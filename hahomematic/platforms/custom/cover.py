@@ -99,6 +99,13 @@ class GarageDoorState(StrEnum):
 class CeCover(CustomEntity):
     """Class for HomeMatic cover entities."""
 
+    __slots__ = (
+        "_e_direction",
+        "_e_level",
+        "_e_stop",
+        "_e_channel_level",
+    )
+
     _platform = HmPlatform.COVER
     _closed_state: float = _CLOSED
     _open_state: float = _OPEN
@@ -205,6 +212,8 @@ class CeCover(CustomEntity):
 class CeWindowDrive(CeCover):
     """Class for Homematic window drive."""
 
+    __slots__ = ()
+
     _closed_state: float = _WD_CLOSED
     _open_state: float = _OPEN
 
@@ -240,6 +249,12 @@ class CeWindowDrive(CeCover):
 class CeBlind(CeCover):
     """Class for HomeMatic blind entities."""
 
+    __slots__ = (
+        "_e_channel_level_2",
+        "_e_level_2",
+        "_e_combined",
+    )
+
     def _init_entity_fields(self) -> None:
         """Init the entity fields."""
         super()._init_entity_fields()
@@ -355,6 +370,8 @@ class CeBlind(CeCover):
 class CeIpBlind(CeBlind):
     """Class for HomematicIP blind entities."""
 
+    __slots__ = ("_e_channel_operation_mode",)
+
     def _init_entity_fields(self) -> None:
         """Init the entity fields."""
         super()._init_entity_fields()
@@ -412,6 +429,12 @@ class CeIpBlind(CeBlind):
 class CeGarage(CustomEntity):
     """Class for HomeMatic garage entities."""
 
+    __slots__ = (
+        "_e_door_state",
+        "_e_door_command",
+        "_e_section",
+    )
+
     _platform = HmPlatform.COVER
 
     def _init_entity_fields(self) -> None:
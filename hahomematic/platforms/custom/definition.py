@@ -1,8 +1,10 @@
 """The module contains device descriptions for custom entities."""
 from __future__ import annotations
 
-from copy import deepcopy
+from collections.abc import Mapping
+from functools import cache
 import logging
+from types import MappingProxyType
 from typing import Any, Final, cast
 
 import voluptuous as vol
@@ -602,8 +604,8 @@ def _create_entities(
     device: hmd.HmDevice,
     custom_entity_class: type,
     device_enum: EntityDefinition,
-    device_def: dict[str, vol.Any],
-    entity_def: dict[int, tuple[str, ...]],
+    device_def: Mapping[str, vol.Any],
+    entity_def: Mapping[int, tuple[str, ...]],
     channel_no: int | None = None,
     extended: ExtendedConfig | None = None,
 ) -> tuple[hmce.CustomEntity, ...]:
@@ -646,47 +648,55 @@ def _get_device_definition(device_enum: EntityDefinition) -> dict[str, vol.Any]:
     return cast(dict[str, vol.Any], entity_definition[ED_DEVICE_DEFINITIONS][device_enum])
 
 
-def _get_device_group(device_enum: EntityDefinition, base_channel_no: int) -> dict[str, vol.Any]:
-    """Return the device group."""
+@cache
+def _get_device_group(device_enum: EntityDefinition, base_channel_no: int) -> Mapping[str, Any]:
+    """
+    Return the device group rebased to base_channel_no.
+
+    The rebased groups are cached and frozen, so they can be shared by all custom entities.
+    """
     device = _get_device_definition(device_enum)
     group = cast(dict[str, vol.Any], device[ED_DEVICE_GROUP])
-    if group and base_channel_no == 0:
-        return group
+    rebased_group: dict[str, Any] = dict(group)
 
-    # Create a deep copy of the group due to channel rebase
-    group = deepcopy(group)
     # Add base_channel_no to the primary_channel to get the real primary_channel number
-    primary_channel = group[ED_PRIMARY_CHANNEL]
-    group[ED_PRIMARY_CHANNEL] = primary_channel + base_channel_no
+    rebased_group[ED_PRIMARY_CHANNEL] = group[ED_PRIMARY_CHANNEL] + base_channel_no
 
     # Add base_channel_no to the secondary_channels
     # to get the real secondary_channel numbers
     if secondary_channel := group.get(ED_SECONDARY_CHANNELS):
-        group[ED_SECONDARY_CHANNELS] = [x + base_channel_no for x in secondary_channel]
+        rebased_group[ED_SECONDARY_CHANNELS] = tuple(
+            x + base_channel_no for x in secondary_channel
+        )
 
-    group[ED_VISIBLE_FIELDS] = _rebase_entity_dict(
+    for field_dict_name in (ED_REPEATABLE_FIELDS, ED_VISIBLE_REPEATABLE_FIELDS):
+        if fields := group.get(field_dict_name):
+            rebased_group[field_dict_name] = MappingProxyType(dict(fields))
+
+    rebased_group[ED_VISIBLE_FIELDS] = _rebase_entity_dict(
         entity_dict=ED_VISIBLE_FIELDS, group=group, base_channel_no=base_channel_no
     )
-    group[ED_FIELDS] = _rebase_entity_dict(
+    rebased_group[ED_FIELDS] = _rebase_entity_dict(
         entity_dict=ED_FIELDS, group=group, base_channel_no=base_channel_no
     )
-    return group
+    return MappingProxyType(rebased_group)
 
 
 def _rebase_entity_dict(
-    entity_dict: str, group: dict[str, vol.Any], base_channel_no: int
-) -> dict[int, vol.Any]:
+    entity_dict: str, group: Mapping[str, vol.Any], base_channel_no: int
+) -> Mapping[int, Mapping[str, str]]:
     """Rebase entity_dict with base_channel_no."""
-    new_fields = {}
+    new_fields: dict[int, Mapping[str, str]] = {}
     if fields := group.get(entity_dict):
         for channel_no, field in fields.items():
-            new_fields[channel_no + base_channel_no] = field
-    return new_fields
+            new_fields[channel_no + base_channel_no] = MappingProxyType(dict(field))
+    return MappingProxyType(new_fields)
 
 
+@cache
 def _get_device_entities(
     device_enum: EntityDefinition, base_channel_no: int
-) -> dict[int, tuple[str, ...]]:
+) -> Mapping[int, tuple[str, ...]]:
     """Return the device entities."""
     additional_entities = (
         entity_definition[ED_DEVICE_DEFINITIONS]
@@ -697,58 +707,160 @@ def _get_device_entities(
     if additional_entities:
         for channel_no, field in additional_entities.items():
             new_entities[channel_no + base_channel_no] = field
-    return new_entities
+    return MappingProxyType(new_entities)
+
+
+class _EntityConfigIndex:
+    """
+    Index of the custom entity configs by device type.
+
+    The index is built from ALL_DEVICES and ALL_BLACKLISTED_DEVICES,
+    and the resolved results are memoized per device type.
+    It is rebuilt, if platforms are registered after the index has been built.
+    """
+
+    def __init__(self) -> None:
+        """Init the index."""
+        self._indexed_sizes: tuple[int, int] = (-1, -1)
+        # per platform: lowered device type -> (position, custom configs)
+        self._platforms: list[dict[str, tuple[int, CustomConfig | tuple[CustomConfig, ...]]]] = []
+        # per platform: sorted distinct lengths of the device types, used for prefix lookups
+        self._platform_prefix_lengths: list[tuple[int, ...]] = []
+        self._blacklisted: frozenset[str] = frozenset()
+        self._blacklisted_prefix_lengths: tuple[int, ...] = ()
+        self._entity_configs: dict[str, tuple[CustomConfig | tuple[CustomConfig, ...], ...]] = {}
+        self._multi_channel: dict[str, bool] = {}
+
+    def build(self) -> None:
+        """Build the index from the registered platforms."""
+        self._platforms.clear()
+        self._platform_prefix_lengths.clear()
+        for platform_devices in ALL_DEVICES:
+            platform_index: dict[str, tuple[int, CustomConfig | tuple[CustomConfig, ...]]] = {}
+            for position, (d_type, custom_configs) in enumerate(platform_devices.items()):
+                platform_index.setdefault(d_type.lower(), (position, custom_configs))
+            self._platforms.append(platform_index)
+            self._platform_prefix_lengths.append(
+                tuple(sorted({len(d_type) for d_type in platform_index}))
+            )
+        self._blacklisted = frozenset(
+            d_type.lower()
+            for platform_blacklisted_devices in ALL_BLACKLISTED_DEVICES
+            for d_type in platform_blacklisted_devices
+        )
+        self._blacklisted_prefix_lengths = tuple(
+            sorted({len(d_type) for d_type in self._blacklisted})
+        )
+        self._entity_configs.clear()
+        self._multi_channel.clear()
+        self._indexed_sizes = (len(ALL_DEVICES), len(ALL_BLACKLISTED_DEVICES))
+
+    def get_entity_configs(
+        self, device_type: str
+    ) -> tuple[CustomConfig | tuple[CustomConfig, ...], ...]:
+        """Return the memoized entity configs for the device type."""
+        self._ensure_index()
+        device_type = _normalize_device_type(device_type=device_type)
+        if (entity_configs := self._entity_configs.get(device_type)) is None:
+            entity_configs = self._resolve_entity_configs(device_type=device_type)
+            self._entity_configs[device_type] = entity_configs
+        return entity_configs
+
+    def is_multi_channel_device(self, device_type: str) -> bool:
+        """Return the memoized multi channel flag for the device type."""
+        self._ensure_index()
+        device_type = _normalize_device_type(device_type=device_type)
+        if (is_multi_channel := self._multi_channel.get(device_type)) is None:
+            channels: list[int] = []
+            for entity_configs in self.get_entity_configs(device_type=device_type):
+                if isinstance(entity_configs, CustomConfig):
+                    channels.extend(entity_configs.channels)
+                else:
+                    for entity_config in entity_configs:
+                        channels.extend(entity_config.channels)
+            is_multi_channel = len(channels) > 1
+            self._multi_channel[device_type] = is_multi_channel
+        return is_multi_channel
+
+    def _ensure_index(self) -> None:
+        """Build the index, if platforms have been registered since the last build."""
+        if self._indexed_sizes != (len(ALL_DEVICES), len(ALL_BLACKLISTED_DEVICES)):
+            self.build()
+
+    def _resolve_entity_configs(
+        self, device_type: str
+    ) -> tuple[CustomConfig | tuple[CustomConfig, ...], ...]:
+        """Resolve the entity configs for the normalized device type."""
+        if self._is_blacklisted(device_type=device_type):
+            return ()
+
+        funcs: list[CustomConfig | tuple[CustomConfig, ...]] = []
+        for platform_index, prefix_lengths in zip(
+            self._platforms, self._platform_prefix_lengths, strict=True
+        ):
+            if func := _get_entity_config_by_platform(
+                platform_index=platform_index,
+                prefix_lengths=prefix_lengths,
+                device_type=device_type,
+            ):
+                funcs.append(func)
+        return tuple(funcs)
+
+    def _is_blacklisted(self, device_type: str) -> bool:
+        """Return if the normalized device type starts with a blacklisted device type."""
+        for length in self._blacklisted_prefix_lengths:
+            if length > len(device_type):
+                break
+            if device_type[:length] in self._blacklisted:
+                return True
+        return False
+
+
+_ENTITY_CONFIG_INDEX: Final = _EntityConfigIndex()
+
+
+def _normalize_device_type(device_type: str) -> str:
+    """Return the device type used for the custom entity config lookup."""
+    return device_type.lower().replace("hb-", "hm-")
+
+
+def build_entity_config_index() -> None:
+    """Build the index of the custom entity configs."""
+    _ENTITY_CONFIG_INDEX.build()
 
 
 def get_entity_configs(
     device_type: str,
-) -> list[CustomConfig | tuple[CustomConfig, ...]]:
+) -> tuple[CustomConfig | tuple[CustomConfig, ...], ...]:
     """Return the entity configs to create custom entities."""
-    device_type = device_type.lower().replace("hb-", "hm-")
-    funcs = []
-    for platform_blacklisted_devices in ALL_BLACKLISTED_DEVICES:
-        if hms.element_matches_key(
-            search_elements=platform_blacklisted_devices,
-            compare_with=device_type,
-        ):
-            return []
-
-    for platform_devices in ALL_DEVICES:
-        if func := _get_entity_config_by_platform(
-            platform_devices=platform_devices,
-            device_type=device_type,
-        ):
-            funcs.append(func)
-    return funcs
+    return _ENTITY_CONFIG_INDEX.get_entity_configs(device_type=device_type)
 
 
 def _get_entity_config_by_platform(
-    platform_devices: dict[str, CustomConfig | tuple[CustomConfig, ...]],
+    platform_index: dict[str, tuple[int, CustomConfig | tuple[CustomConfig, ...]]],
+    prefix_lengths: tuple[int, ...],
     device_type: str,
 ) -> CustomConfig | tuple[CustomConfig, ...] | None:
     """Return the entity configs to create custom entities."""
-    for d_type, custom_configs in platform_devices.items():
-        if device_type.lower() == d_type.lower():
-            return custom_configs
-
-    for d_type, custom_configs in platform_devices.items():
-        if device_type.lower().startswith(d_type.lower()):
-            return custom_configs
+    if exact_match := platform_index.get(device_type):
+        return exact_match[1]
+
+    # Use the first device type (by definition order) that is a prefix of the device type.
+    prefix_match: tuple[int, CustomConfig | tuple[CustomConfig, ...]] | None = None
+    for length in prefix_lengths:
+        if length > len(device_type):
+            break
+        if (match := platform_index.get(device_type[:length])) and (
+            prefix_match is None or match[0] < prefix_match[0]
+        ):
+            prefix_match = match
 
-    return None
+    return prefix_match[1] if prefix_match else None
 
 
 def is_multi_channel_device(device_type: str) -> bool:
     """Return true, if device has multiple channels."""
-    channels: list[int] = []
-    for entity_configs in get_entity_configs(device_type=device_type):
-        if isinstance(entity_configs, CustomConfig):
-            channels.extend(entity_configs.channels)
-        else:
-            for entity_config in entity_configs:
-                channels.extend(entity_config.channels)
-
-    return len(channels) > 1
+    return _ENTITY_CONFIG_INDEX.is_multi_channel_device(device_type=device_type)
 
 
 def entity_definition_exists(device_type: str) -> bool:
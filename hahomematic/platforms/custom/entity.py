@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from collections.abc import Mapping
 from datetime import datetime
 import logging
 from typing import Any, Final, TypeVar, cast
@@ -12,7 +13,12 @@ from hahomematic.platforms.custom import definition as hmed
 from hahomematic.platforms.custom.const import EntityDefinition
 from hahomematic.platforms.custom.support import ExtendedConfig
 from hahomematic.platforms.decorators import value_property
-from hahomematic.platforms.entity import BaseEntity, CallParameterCollector
+from hahomematic.platforms.entity import (
+    BaseEntity,
+    CallParameterCollector,
+    defer_entity_update,
+    entity_update_batch,
+)
 from hahomematic.platforms.generic import entity as hmge
 from hahomematic.platforms.support import (
     EntityNameData,
@@ -28,13 +34,22 @@ _EntityT = TypeVar("_EntityT", bound=hmge.GenericEntity)
 class CustomEntity(BaseEntity):
     """Base class for custom entities."""
 
+    __slots__ = (
+        "_device_enum",
+        "_device_desc",
+        "_entity_def",
+        "_extended",
+        "data_entities",
+        "_readable_entities",
+    )
+
     def __init__(
         self,
         device: hmd.HmDevice,
         unique_identifier: str,
         device_enum: EntityDefinition,
-        device_def: dict[str, Any],
-        entity_def: dict[int | tuple[int, ...], tuple[str, ...]],
+        device_def: Mapping[str, Any],
+        entity_def: Mapping[int | tuple[int, ...], tuple[str, ...]],
         channel_no: int,
         extended: ExtendedConfig | None = None,
     ) -> None:
@@ -52,6 +67,9 @@ class CustomEntity(BaseEntity):
         self._extended: Final = extended
         self.data_entities: Final[dict[str, hmge.GenericEntity]] = {}
         self._init_entities()
+        self._readable_entities: Final[tuple[hmge.GenericEntity, ...]] = tuple(
+            ge for ge in self.data_entities.values() if ge.is_readable
+        )
         self._init_entity_fields()
 
     @abstractmethod
@@ -77,11 +95,6 @@ class CustomEntity(BaseEntity):
         """Return, if the state is uncertain."""
         return any(entity.state_uncertain for entity in self._readable_entities)
 
-    @property
-    def _readable_entities(self) -> list[hmge.GenericEntity]:
-        """Returns the list of readable entities."""
-        return [ge for ge in self.data_entities.values() if ge.is_readable]
-
     def _get_entity_name(self) -> EntityNameData:
         """Create the name for the entity."""
         is_only_primary_channel = check_channel_is_the_only_primary_channel(
@@ -107,9 +120,15 @@ class CustomEntity(BaseEntity):
 
     async def load_entity_value(self, call_source: CallSource) -> None:
         """Init the entity values."""
-        for entity in self._readable_entities:
-            await entity.load_entity_value(call_source=call_source)
-        self.update_entity()
+        with entity_update_batch():
+            for entity in self._readable_entities:
+                await entity.load_entity_value(call_source=call_source)
+            self._data_entity_updated()
+
+    def _data_entity_updated(self, *args: Any, **kwargs: Any) -> None:
+        """Notify about an update of a data entity, or defer it within an update batch."""
+        if not defer_entity_update(self, *args, **kwargs):
+            self.update_entity(*args, **kwargs)
 
     def is_state_change(self, **kwargs: Any) -> bool:
         """
@@ -202,10 +221,10 @@ class CustomEntity(BaseEntity):
         if is_visible:
             entity.set_usage(EntityUsage.CE_VISIBLE)
 
-        entity.register_update_callback(self.update_entity)
+        entity.register_update_callback(self._data_entity_updated)
         self.data_entities[field_name] = entity
 
-    def _mark_entities(self, entity_def: dict[int | tuple[int, ...], tuple[str, ...]]) -> None:
+    def _mark_entities(self, entity_def: Mapping[int | tuple[int, ...], tuple[str, ...]]) -> None:
         """Mark entities to be created in HA."""
         if not entity_def:
             return
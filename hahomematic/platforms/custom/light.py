@@ -42,7 +42,7 @@ from hahomematic.platforms.generic.action import HmAction
 from hahomematic.platforms.generic.number import HmFloat, HmInteger
 from hahomematic.platforms.generic.select import HmSelect
 from hahomematic.platforms.generic.sensor import HmSensor
-from hahomematic.platforms.support import OnTimeMixin
+from hahomematic.platforms.support import OnTimeData, OnTimeMixin
 
 _DIMMER_OFF: Final = 0.0
 _EFFECT_OFF: Final = "Off"
@@ -155,11 +155,19 @@ class LightOffArgs(TypedDict, total=False):
 class CeDimmer(CustomEntity, OnTimeMixin):
     """Base class for HomeMatic light entities."""
 
+    __slots__ = (
+        "_e_level",
+        "_e_channel_level",
+        "_e_on_time_value",
+        "_e_ramp_time_value",
+        "_on_time_data",
+    )
+
     _platform = HmPlatform.LIGHT
 
     def _init_entity_fields(self) -> None:
         """Init the entity fields."""
-        OnTimeMixin.__init__(self)
+        self._on_time_data = OnTimeData()
         super()._init_entity_fields()
         self._e_level: HmFloat = self._get_entity(field_name=FIELD_LEVEL, entity_type=HmFloat)
         self._e_channel_level: HmSensor = self._get_entity(
@@ -332,6 +340,8 @@ class CeDimmer(CustomEntity, OnTimeMixin):
 class CeColorDimmer(CeDimmer):
     """Class for HomeMatic dimmer with color entities."""
 
+    __slots__ = ("_e_color",)
+
     def _init_entity_fields(self) -> None:
         """Init the entity fields."""
         super()._init_entity_fields()
@@ -370,6 +380,8 @@ class CeColorDimmer(CeDimmer):
 class CeColorDimmerEffect(CeColorDimmer):
     """Class for HomeMatic dimmer with color entities."""
 
+    __slots__ = ("_e_effect",)
+
     _effect_list: list[str] = [
         _EFFECT_OFF,
         "Slow color change",
@@ -420,6 +432,8 @@ class CeColorDimmerEffect(CeColorDimmer):
 class CeColorTempDimmer(CeDimmer):
     """Class for HomeMatic dimmer with color temperature entities."""
 
+    __slots__ = ("_e_color_level",)
+
     def _init_entity_fields(self) -> None:
         """Init the entity fields."""
         super()._init_entity_fields()
@@ -449,6 +463,18 @@ class CeColorTempDimmer(CeDimmer):
 class CeIpRGBWLight(CeDimmer):
     """Class for HomematicIP HmIP-RGBW light entities."""
 
+    __slots__ = (
+        "_e_activity_state",
+        "_e_color_temperature_kelvin",
+        "_e_device_operation_mode",
+        "_e_effect",
+        "_e_hue",
+        "_e_ramp_time_to_off_unit",
+        "_e_ramp_time_to_off_value",
+        "_e_ramp_time_unit",
+        "_e_saturation",
+    )
+
     def _init_entity_fields(self) -> None:
         """Init the entity fields."""
         super()._init_entity_fields()
@@ -575,6 +601,13 @@ class CeIpRGBWLight(CeDimmer):
 class CeIpFixedColorLight(CeDimmer):
     """Class for HomematicIP HmIP-BSL light entities."""
 
+    __slots__ = (
+        "_e_color",
+        "_e_channel_color",
+        "_e_on_time_unit",
+        "_e_ramp_time_unit",
+    )
+
     @value_property
     def color_name(self) -> str | None:
         """Return the name of the color."""
@@ -652,6 +685,11 @@ class CeIpFixedColorLight(CeDimmer):
 class CeIpFixedColorLightWired(CeIpFixedColorLight):
     """Class for HomematicIP HmIPW-WRC6 light entities."""
 
+    __slots__ = (
+        "_e_effect",
+        "_effect_list",
+    )
+
     def _init_entity_fields(self) -> None:
         """Init the entity fields."""
         super()._init_entity_fields()
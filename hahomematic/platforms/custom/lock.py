@@ -49,6 +49,8 @@ class LockState(StrEnum):
 class BaseLock(CustomEntity):
     """Class for HomematicIP lock entities."""
 
+    __slots__ = ()
+
     _platform = HmPlatform.LOCK
 
     @value_property
@@ -87,6 +89,12 @@ class BaseLock(CustomEntity):
 class CeIpLock(BaseLock):
     """Class for HomematicIP lock entities."""
 
+    __slots__ = (
+        "_e_lock_state",
+        "_e_lock_target_level",
+        "_e_direction",
+    )
+
     def _init_entity_fields(self) -> None:
         """Init the entity fields."""
         super()._init_entity_fields()
@@ -143,6 +151,13 @@ class CeIpLock(BaseLock):
 class CeRfLock(BaseLock):
     """Class for classic HomeMatic lock entities."""
 
+    __slots__ = (
+        "_e_state",
+        "_e_open",
+        "_e_direction",
+        "_e_error",
+    )
+
     def _init_entity_fields(self) -> None:
         """Init the entity fields."""
         super()._init_entity_fields()
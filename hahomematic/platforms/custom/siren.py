@@ -52,6 +52,8 @@ class SirenOnArgs(TypedDict, total=False):
 class BaseSiren(CustomEntity):
     """Class for HomeMatic siren entities."""
 
+    __slots__ = ()
+
     _platform = HmPlatform.SIREN
 
     @value_property
@@ -100,6 +102,15 @@ class BaseSiren(CustomEntity):
 class CeIpSiren(BaseSiren):
     """Class for HomematicIP siren entities."""
 
+    __slots__ = (
+        "_e_acoustic_alarm_active",
+        "_e_acoustic_alarm_selection",
+        "_e_optical_alarm_active",
+        "_e_optical_alarm_selection",
+        "_e_duration",
+        "_e_duration_unit",
+    )
+
     def _init_entity_fields(self) -> None:
         """Init the entity fields."""
         super()._init_entity_fields()
@@ -195,6 +206,11 @@ class CeIpSiren(BaseSiren):
 class CeIpSirenSmoke(BaseSiren):
     """Class for HomematicIP siren smoke entities."""
 
+    __slots__ = (
+        "_e_smoke_detector_alarm_status",
+        "_e_smoke_detector_command",
+    )
+
     def _init_entity_fields(self) -> None:
         """Init the entity fields."""
         super()._init_entity_fields()
@@ -25,7 +25,7 @@ from hahomematic.platforms.entity import CallParameterCollector, bind_collector
 from hahomematic.platforms.generic.action import HmAction
 from hahomematic.platforms.generic.binary_sensor import HmBinarySensor
 from hahomematic.platforms.generic.switch import HmSwitch
-from hahomematic.platforms.support import OnTimeMixin
+from hahomematic.platforms.support import OnTimeData, OnTimeMixin
 
 _LOGGER: Final = logging.getLogger(__name__)
 
@@ -41,11 +41,18 @@ class StateChangeArg(StrEnum):
 class CeSwitch(CustomEntity, OnTimeMixin):
     """Class for HomeMatic switch entities."""
 
+    __slots__ = (
+        "_e_state",
+        "_e_on_time_value",
+        "_e_channel_state",
+        "_on_time_data",
+    )
+
     _platform = HmPlatform.SWITCH
 
     def _init_entity_fields(self) -> None:
         """Init the entity fields."""
-        OnTimeMixin.__init__(self)
+        self._on_time_data = OnTimeData()
         super()._init_entity_fields()
         self._e_state: HmSwitch = self._get_entity(field_name=FIELD_STATE, entity_type=HmSwitch)
         self._e_on_time_value: HmAction = self._get_entity(
@@ -2,13 +2,14 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 from copy import copy
 from datetime import datetime
 import logging
 import os
 import random
 from typing import Any, Final
+import zipfile
 
 import orjson
 
@@ -35,6 +36,7 @@ from hahomematic.const import (
     ProductGroup,
 )
 from hahomematic.exceptions import BaseHomematicException
+from hahomematic.performance import CACHE_REQUESTS
 from hahomematic.platforms.custom import definition as hmed, entity as hmce
 from hahomematic.platforms.decorators import config_property, value_property
 from hahomematic.platforms.entity import BaseEntity, CallbackEntity
@@ -50,6 +52,36 @@ _LOGGER: Final = logging.getLogger(__name__)
 class HmDevice(PayloadMixin):
     """Object to hold information about a device and associated entities."""
 
+    __slots__ = (
+        "central",
+        "_interface_id",
+        "_interface",
+        "client",
+        "_device_address",
+        "channels",
+        "custom_entities",
+        "generic_entities",
+        "generic_events",
+        "wrapper_entities",
+        "_last_update",
+        "_forced_availability",
+        "_update_callbacks",
+        "_firmware_update_callbacks",
+        "_device_type",
+        "_sub_type",
+        "_manufacturer",
+        "_product_group",
+        "_has_custom_entity_definition",
+        "_name",
+        "value_cache",
+        "_room",
+        "_update_entity",
+        "_available_firmware",
+        "_firmware",
+        "_firmware_updatable",
+        "_firmware_update_state",
+    )
+
     def __init__(self, central: hmcu.CentralUnit, interface_id: str, device_address: str) -> None:
         """Initialize the device object."""
         PayloadMixin.__init__(self)
@@ -630,18 +662,17 @@ class ValueCache:
     ) -> Any:
         """Load data from caches."""
         # Try to get data from central cache
-        if (
-            paramset_key == ParamsetKey.VALUES
-            and (
+        if paramset_key == ParamsetKey.VALUES:
+            if (
                 global_value := self._device.central.data_cache.get_data(
                     interface=self._device.interface,
                     channel_address=channel_address,
                     parameter=parameter,
                 )
-            )
-            != NO_CACHE_ENTRY
-        ):
-            return global_value
+            ) != NO_CACHE_ENTRY:
+                CACHE_REQUESTS.inc("central_data", "hit")
+                return global_value
+            CACHE_REQUESTS.inc("central_data", "miss")
 
         # Try to get data from device cache
         key = self._get_key(
@@ -650,7 +681,9 @@ class ValueCache:
         if (
             cache_entry := self._device_cache.get(key, CacheEntry.empty())
         ) and cache_entry.is_valid:
+            CACHE_REQUESTS.inc("device_data", "hit")
             return cache_entry.value
+        CACHE_REQUESTS.inc("device_data", "miss")
         return NO_CACHE_ENTRY
 
 
@@ -668,6 +701,24 @@ class _DefinitionExporter:
 
     async def export_data(self) -> None:
         """Export data."""
+        filename, device_descriptions, paramset_descriptions = await self.get_data()
+
+        # Save device_descriptions for device to file.
+        await self._save(
+            file_dir=f"{self._storage_folder}/{DEFAULT_DEVICE_DESCRIPTIONS_DIR}",
+            filename=filename,
+            data=device_descriptions,
+        )
+
+        # Save device_descriptions for device to file.
+        await self._save(
+            file_dir=f"{self._storage_folder}/{DEFAULT_PARAMSET_DESCRIPTIONS_DIR}",
+            filename=filename,
+            data=paramset_descriptions,
+        )
+
+    async def get_data(self) -> tuple[str, list[Any], dict[str, Any]]:
+        """Return the filename, and the anonymized device and paramset descriptions."""
         device_descriptions: dict[
             str, Any
         ] = self._central.device_descriptions.get_device_with_channels(
@@ -706,19 +757,7 @@ class _DefinitionExporter:
                 self._anonymize_address(address=address)
             ] = paramset_description
 
-        # Save device_descriptions for device to file.
-        await self._save(
-            file_dir=f"{self._storage_folder}/{DEFAULT_DEVICE_DESCRIPTIONS_DIR}",
-            filename=filename,
-            data=anonymize_device_descriptions,
-        )
-
-        # Save device_descriptions for device to file.
-        await self._save(
-            file_dir=f"{self._storage_folder}/{DEFAULT_PARAMSET_DESCRIPTIONS_DIR}",
-            filename=filename,
-            data=anonymize_paramset_descriptions,
-        )
+        return filename, anonymize_device_descriptions, anonymize_paramset_descriptions
 
     def _anonymize_address(self, address: str) -> str:
         address_parts = address.split(":")
@@ -741,3 +780,55 @@ class _DefinitionExporter:
             return DataOperationResult.SAVE_SUCCESS
 
         return await self._central.async_add_executor_job(_save)
+
+
+async def export_device_definitions(
+    central: hmcu.CentralUnit, devices: Collection[HmDevice], archive_path: str
+) -> int:
+    """
+    Export the definitions of the devices into one zip archive.
+
+    The definitions are fetched concurrently, and each device type is exported once.
+    Returns the number of exported device types.
+    """
+    # {device_type, device}
+    devices_by_type: dict[str, HmDevice] = {}
+    for device in devices:
+        devices_by_type.setdefault(device.device_type, device)
+
+    def _open() -> zipfile.ZipFile:
+        check_or_create_directory(os.path.dirname(archive_path))
+        return zipfile.ZipFile(archive_path, mode="w", compression=zipfile.ZIP_DEFLATED)
+
+    def _write(archive: zipfile.ZipFile, name: str, data: Any) -> None:
+        archive.writestr(
+            name, orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+
+    archive = await central.async_add_executor_job(_open)
+    tasks = [
+        asyncio.create_task(_DefinitionExporter(device=device).get_data())
+        for device in devices_by_type.values()
+    ]
+    try:
+        for export in asyncio.as_completed(tasks):
+            filename, device_descriptions, paramset_descriptions = await export
+            await central.async_add_executor_job(
+                _write,
+                archive,
+                f"{DEFAULT_DEVICE_DESCRIPTIONS_DIR}/{filename}",
+                device_descriptions,
+            )
+            await central.async_add_executor_job(
+                _write,
+                archive,
+                f"{DEFAULT_PARAMSET_DESCRIPTIONS_DIR}/{filename}",
+                paramset_descriptions,
+            )
+    finally:
+        # Don't leave the remaining fetches running after a failed export.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await central.async_add_executor_job(archive.close)
+    return len(devices_by_type)
@@ -2,11 +2,17 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
+from enum import Enum
 from functools import wraps
 from inspect import getfullargspec
 import logging
+import sys
+import time
 from typing import Any, Final, Generic, TypeVar, cast
 
 import voluptuous as vol
@@ -32,13 +38,15 @@ from hahomematic.const import (
     ParameterType,
     ParamsetKey,
 )
+from hahomematic.exceptions import BaseHomematicException
+from hahomematic.performance import EVENT_TRACER, get_callback_name
 from hahomematic.platforms import device as hmd
 from hahomematic.platforms.decorators import config_property, value_property
 from hahomematic.platforms.support import (
     EntityNameData,
     PayloadMixin,
-    convert_value,
     generate_channel_unique_identifier,
+    get_value_converter,
 )
 
 _LOGGER: Final = logging.getLogger(__name__)
@@ -87,17 +95,65 @@ EVENT_DATA_SCHEMA = vol.Schema(
     }
 )
 
+# Entities with a deferred update notification of the current update batch.
+# {id(entity), (entity, args, kwargs)}
+_ENTITY_UPDATE_BATCH: Final[
+    ContextVar[dict[int, tuple[CallbackEntity, tuple[Any, ...], dict[str, Any]]] | None]
+] = ContextVar("entity_update_batch", default=None)
+
+
+@contextmanager
+def entity_update_batch() -> Iterator[None]:
+    """
+    Collapse deferred entity update notifications within the batch.
+
+    Entities, that defer their update notification within the batch,
+    are notified once when the outermost batch ends,
+    with the arguments of their last deferred notification.
+    """
+    if _ENTITY_UPDATE_BATCH.get() is not None:
+        yield
+        return
+    token = _ENTITY_UPDATE_BATCH.set({})
+    try:
+        yield
+    finally:
+        pending_entities = _ENTITY_UPDATE_BATCH.get() or {}
+        _ENTITY_UPDATE_BATCH.reset(token)
+        for entity, args, kwargs in pending_entities.values():
+            entity.update_entity(*args, **kwargs)
+
+
+def defer_entity_update(entity: CallbackEntity, *args: Any, **kwargs: Any) -> bool:
+    """Defer the update notification of the entity, if an update batch is active."""
+    if (pending_entities := _ENTITY_UPDATE_BATCH.get()) is None:
+        return False
+    pending_entities[id(entity)] = (entity, args, kwargs)
+    return True
+
+
+def _intern(value: str) -> str:
+    """Return the interned string. Enum members are already shared and are returned as is."""
+    return value if isinstance(value, Enum) else sys.intern(value)
+
 
 class CallbackEntity(ABC):
     """Base class for callback entities."""
 
+    __slots__ = (
+        "_unique_identifier",
+        "_update_callbacks",
+        "_remove_callbacks",
+    )
+
     _platform: HmPlatform
 
     def __init__(self, unique_identifier: str) -> None:
         """Init the callback entity."""
         self._unique_identifier: Final = unique_identifier
-        self._update_callbacks: list[Callable] = []
-        self._remove_callbacks: list[Callable] = []
+        # The callback lists are created on first registration.
+        self._update_callbacks: list[Callable] | None = None
+        self._remove_callbacks: list[Callable] | None = None
 
     @property
     @abstractmethod
@@ -141,37 +197,68 @@ class CallbackEntity(ABC):
     def register_update_callback(self, update_callback: Callable) -> None:
         """Register update callback."""
         if callable(update_callback):
+            if self._update_callbacks is None:
+                self._update_callbacks = []
             self._update_callbacks.append(update_callback)
 
     def unregister_update_callback(self, update_callback: Callable) -> None:
         """Unregister update callback."""
-        if update_callback in self._update_callbacks:
+        if self._update_callbacks and update_callback in self._update_callbacks:
             self._update_callbacks.remove(update_callback)
 
     def register_remove_callback(self, remove_callback: Callable) -> None:
         """Register the remove callback."""
-        if callable(remove_callback) and remove_callback not in self._remove_callbacks:
-            self._remove_callbacks.append(remove_callback)
+        if callable(remove_callback):
+            if self._remove_callbacks is None:
+                self._remove_callbacks = []
+            if remove_callback not in self._remove_callbacks:
+                self._remove_callbacks.append(remove_callback)
 
     def unregister_remove_callback(self, remove_callback: Callable) -> None:
         """Unregister the remove callback."""
-        if remove_callback in self._remove_callbacks:
+        if self._remove_callbacks and remove_callback in self._remove_callbacks:
             self._remove_callbacks.remove(remove_callback)
 
     def update_entity(self, *args: Any, **kwargs: Any) -> None:
         """Do what is needed when the value of the entity has been updated."""
-        for _callback in self._update_callbacks:
-            _callback(*args, **kwargs)
+        if self._update_callbacks:
+            if EVENT_TRACER.enabled:
+                for _callback in self._update_callbacks:
+                    started = time.perf_counter()
+                    _callback(*args, **kwargs)
+                    EVENT_TRACER.record(
+                        stage=f"callback:{get_callback_name(_callback)}", started=started
+                    )
+                return
+            for _callback in self._update_callbacks:
+                _callback(*args, **kwargs)
 
     def remove_entity(self, *args: Any) -> None:
         """Do what is needed when the entity has been removed."""
-        for _callback in self._remove_callbacks:
-            _callback(*args)
+        if self._remove_callbacks:
+            for _callback in self._remove_callbacks:
+                _callback(*args)
 
 
 class BaseEntity(CallbackEntity, PayloadMixin):
     """Base class for regular entities."""
 
+    __slots__ = (
+        "device",
+        "_channel_no",
+        "_channel_address",
+        "_channel_unique_identifier",
+        "_is_in_multiple_channels",
+        "_central",
+        "_channel_type",
+        "_function",
+        "_client",
+        "_usage",
+        "_channel_name",
+        "_full_name",
+        "_name",
+    )
+
     def __init__(
         self,
         device: hmd.HmDevice,
@@ -184,8 +271,8 @@ class BaseEntity(CallbackEntity, PayloadMixin):
         super().__init__(unique_identifier=unique_identifier)
         self.device: Final = device
         self._channel_no: Final = channel_no
-        self._channel_address: Final[str] = hms.get_channel_address(
-            device_address=device.device_address, channel_no=channel_no
+        self._channel_address: Final[str] = _intern(
+            hms.get_channel_address(device_address=device.device_address, channel_no=channel_no)
         )
         self._channel_unique_identifier: Final = generate_channel_unique_identifier(
             central=device.central, address=self._channel_address
@@ -299,6 +386,26 @@ ParameterT = TypeVar("ParameterT", bool, int, float, str, int | str, None)
 class BaseParameterEntity(Generic[ParameterT, InputParameterT], BaseEntity):
     """Base class for stateless entities."""
 
+    __slots__ = (
+        "_paramset_key",
+        "_parameter",
+        "_value",
+        "_last_update",
+        "_state_uncertain",
+        "_type",
+        "_value_list",
+        "_value_converter",
+        "_max",
+        "_min",
+        "_default",
+        "_visible",
+        "_service",
+        "_operations",
+        "_special",
+        "_raw_unit",
+        "_unit",
+    )
+
     def __init__(
         self,
         device: hmd.HmDevice,
@@ -309,9 +416,9 @@ class BaseParameterEntity(Generic[ParameterT, InputParameterT], BaseEntity):
         parameter_data: dict[str, Any],
     ) -> None:
         """Initialize the entity."""
-        self._paramset_key: Final[str] = paramset_key
+        self._paramset_key: Final[str] = _intern(paramset_key)
         # required for name in BaseEntity
-        self._parameter: Final[str] = parameter
+        self._parameter: Final[str] = _intern(parameter)
 
         super().__init__(
             device=device,
@@ -332,6 +439,10 @@ class BaseParameterEntity(Generic[ParameterT, InputParameterT], BaseEntity):
         self._value_list: tuple[str, ...] | None = None
         if Description.VALUE_LIST in parameter_data:
             self._value_list = tuple(parameter_data[Description.VALUE_LIST])
+        # The converter is chosen once per parameter, and used for every event.
+        self._value_converter: Callable[[Any], Any] = get_value_converter(
+            target_type=self._type, value_list=self._value_list
+        )
         self._max: ParameterT = self._convert_value(parameter_data[Description.MAX])
         self._min: ParameterT = self._convert_value(parameter_data[Description.MIN])
         self._default: ParameterT = self._convert_value(
@@ -519,23 +630,8 @@ class BaseParameterEntity(Generic[ParameterT, InputParameterT], BaseEntity):
 
     def _convert_value(self, value: Any) -> ParameterT:
         """Convert to value to ParameterT."""
-        if value is None:
-            return None  # type: ignore[return-value]
         try:
-            if (
-                self._type == ParameterType.BOOL
-                and self._value_list is not None
-                and value is not None
-                and isinstance(value, str)
-            ):
-                return convert_value(  # type: ignore[no-any-return]
-                    value=self._value_list.index(value),
-                    target_type=self._type,
-                    value_list=self.value_list,
-                )
-            return convert_value(  # type: ignore[no-any-return]
-                value=value, target_type=self._type, value_list=self.value_list
-            )
+            return self._value_converter(value)  # type: ignore[no-any-return]
         except ValueError:  # pragma: no cover
             _LOGGER.debug(
                 "CONVERT_VALUE: conversion failed for %s, %s, %s, value: [%s]",
@@ -565,12 +661,18 @@ class BaseParameterEntity(Generic[ParameterT, InputParameterT], BaseEntity):
 
 
 class CallParameterCollector:
-    """Create a Paramset based on given generic entities."""
+    """
+    Create a Paramset based on given generic entities.
 
-    def __init__(self, client: hmcl.Client) -> None:
+    The entities may belong to different devices and interfaces.
+    The values are grouped by the client and channel of the entities.
+    """
+
+    def __init__(self, client: hmcl.Client | None = None) -> None:
         """Init the generator."""
         self._client: Final = client
         self._use_put_paramset: bool = True
+        self._clients: Final[dict[str, hmcl.Client]] = {}
         self._paramsets: Final[dict[str, dict[str, Any]]] = {}
 
     def add_entity(
@@ -580,27 +682,165 @@ class CallParameterCollector:
         if use_put_paramset is False:
             self._use_put_paramset = False
         if entity.channel_address not in self._paramsets:
+            self._clients[entity.channel_address] = self._client or entity.device.client
             self._paramsets[entity.channel_address] = {}
         self._paramsets[entity.channel_address][entity.parameter] = value
 
     async def send_data(self) -> bool:
-        """Send data to backend."""
+        """Send data to backend channel by channel, and stop at the first failure."""
         for channel_address, paramset in self._paramsets.items():
-            if len(paramset.values()) == 1 or self._use_put_paramset is False:
+            client = self._clients[channel_address]
+            if self._use_set_value(paramset=paramset):
                 for parameter, value in paramset.items():
-                    if not await self._client.set_value(
+                    if not await client.set_value(
                         channel_address=channel_address,
                         paramset_key=ParamsetKey.VALUES,
                         parameter=parameter,
                         value=value,
                     ):
                         return False  # pragma: no cover
-            elif not await self._client.put_paramset(
+            elif not await client.put_paramset(
                 address=channel_address, paramset_key=ParamsetKey.VALUES, value=paramset
             ):
                 return False  # pragma: no cover
         return True
 
+    async def send_data_concurrently(self, max_concurrency: int) -> dict[tuple[str, str], bool]:
+        """
+        Send data to backend with concurrent channels.
+
+        A failed write doesn't stop the other writes.
+        Return the result per channel_address and parameter.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def send_channel_data(
+            channel_address: str, paramset: dict[str, Any]
+        ) -> dict[str, bool]:
+            async with semaphore:
+                return await self._send_channel_data(
+                    channel_address=channel_address, paramset=paramset
+                )
+
+        channel_results = await asyncio.gather(
+            *(
+                send_channel_data(channel_address=channel_address, paramset=paramset)
+                for channel_address, paramset in self._paramsets.items()
+            )
+        )
+        return {
+            (channel_address, parameter): result
+            for channel_address, parameter_results in zip(
+                self._paramsets, channel_results, strict=True
+            )
+            for parameter, result in parameter_results.items()
+        }
+
+    async def _send_channel_data(
+        self, channel_address: str, paramset: dict[str, Any]
+    ) -> dict[str, bool]:
+        """Send the data of a channel to backend, and return the result per parameter."""
+        client = self._clients[channel_address]
+        if self._use_set_value(paramset=paramset):
+            return {
+                parameter: await self._send_with_result(
+                    client.set_value(
+                        channel_address=channel_address,
+                        paramset_key=ParamsetKey.VALUES,
+                        parameter=parameter,
+                        value=value,
+                    ),
+                    address=f"{channel_address}/{parameter}",
+                )
+                for parameter, value in paramset.items()
+            }
+        result = await self._send_with_result(
+            client.put_paramset(
+                address=channel_address, paramset_key=ParamsetKey.VALUES, value=paramset
+            ),
+            address=channel_address,
+        )
+        return {parameter: result for parameter in paramset}
+
+    @staticmethod
+    async def _send_with_result(send: Awaitable[bool], address: str) -> bool:
+        """Await a write, and return False if it fails."""
+        try:
+            return await send
+        except BaseHomematicException as ex:
+            _LOGGER.warning(
+                "SEND_DATA_CONCURRENTLY failed: %s [%s] %s",
+                ex.name,
+                hms.reduce_args(args=ex.args),
+                address,
+            )
+            return False
+
+    def _use_set_value(self, paramset: dict[str, Any]) -> bool:
+        """Return, if the paramset is written with set_value."""
+        return len(paramset.values()) == 1 or self._use_put_paramset is False
+
+
+class WriteCoalescer:
+    """
+    Coalesce rapid successive writes of an entity.
+
+    A write is delayed by the coalescing delay. A newer value, that is written
+    while an older one is still queued, replaces the queued value.
+    All coalesced writes return the result of the write that is finally sent.
+    The write is sent by a task of the coalescer, so a cancelled writer
+    doesn't cancel the write of the other coalesced writers.
+    """
+
+    __slots__ = (
+        "_delay",
+        "_pending",
+        "_send",
+        "_send_lock",
+        "_value",
+    )
+
+    def __init__(self, delay: float, send: Callable[[Any], Awaitable[bool]]) -> None:
+        """Init the write coalescer."""
+        self._delay: Final = delay
+        self._send: Final = send
+        self._send_lock: Final = asyncio.Lock()
+        self._pending: asyncio.Task[bool] | None = None
+        self._value: Any = None
+
+    @property
+    def delay(self) -> float:
+        """Return the coalescing delay."""
+        return self._delay
+
+    @property
+    def has_pending_write(self) -> bool:
+        """Return if a write is queued."""
+        return self._pending is not None
+
+    async def write(self, value: Any) -> bool:
+        """Queue the value, or replace an already queued value."""
+        self._value = value
+        if (pending := self._pending) is None:
+            self._pending = pending = asyncio.create_task(self._send_latest_value())
+            # retrieve the exception, if no coalesced write is waiting for the result
+            pending.add_done_callback(lambda task: task.cancelled() or task.exception())
+        return await asyncio.shield(pending)
+
+    async def _send_latest_value(self) -> bool:
+        """Send the latest value after the coalescing delay."""
+        try:
+            await asyncio.sleep(self._delay)
+            # keep the order of writes, if the previous write is still in progress
+            async with self._send_lock:
+                # newer writes start a new cycle from here on
+                self._pending = None
+                return await self._send(self._value)
+        finally:
+            # don't reset the pending write of a newer cycle
+            if self._pending is asyncio.current_task():
+                self._pending = None
+
 
 def bind_collector(func: _CallableT) -> _CallableT:
     """Decorate function to automatically add collector if not set."""
@@ -32,6 +32,8 @@ _LOGGER: Final = logging.getLogger(__name__)
 class GenericEvent(BaseParameterEntity[Any, Any]):
     """Base class for events."""
 
+    __slots__ = ()
+
     _platform = HmPlatform.EVENT
     _event_type: EventType
 
@@ -94,12 +96,16 @@ class GenericEvent(BaseParameterEntity[Any, Any]):
 class ClickEvent(GenericEvent):
     """class for handling click events."""
 
+    __slots__ = ()
+
     _event_type = EventType.KEYPRESS
 
 
 class DeviceErrorEvent(GenericEvent):
     """class for handling device error events."""
 
+    __slots__ = ()
+
     _event_type = EventType.DEVICE_ERROR
 
     def event(self, value: Any) -> None:
@@ -129,6 +135,8 @@ class DeviceErrorEvent(GenericEvent):
 class ImpulseEvent(GenericEvent):
     """class for handling impulse events."""
 
+    __slots__ = ()
+
     _event_type = EventType.IMPULSE
 
 
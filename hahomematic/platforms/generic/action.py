@@ -19,6 +19,8 @@ class HmAction(GenericEntity[None, Any]):
     This is an internal default platform that gets automatically generated.
     """
 
+    __slots__ = ()
+
     _platform = HmPlatform.ACTION
     _validate_state_change = False
 
@@ -17,6 +17,8 @@ class HmBinarySensor(GenericEntity[bool, bool]):
     This is a default platform that gets automatically generated.
     """
 
+    __slots__ = ()
+
     _platform = HmPlatform.BINARY_SENSOR
 
     @value_property
@@ -16,6 +16,8 @@ class HmButton(GenericEntity[None, bool]):
     This is a default platform that gets automatically generated.
     """
 
+    __slots__ = ()
+
     _platform = HmPlatform.BUTTON
     _validate_state_change = False
 
@@ -2,10 +2,12 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any, Final
 
 from hahomematic.const import CallSource, EntityUsage, EventType, HmPlatform, Parameter
 from hahomematic.exceptions import HaHomematicException
+from hahomematic.performance import EVENT_TRACER
 from hahomematic.platforms import device as hmd, entity as hme
 from hahomematic.platforms.decorators import config_property
 from hahomematic.platforms.support import EntityNameData, get_entity_name
@@ -16,6 +18,11 @@ _LOGGER: Final = logging.getLogger(__name__)
 class GenericEntity(hme.BaseParameterEntity[hme.ParameterT, hme.InputParameterT]):
     """Base class for generic entities."""
 
+    __slots__ = (
+        "wrapped",
+        "_write_coalescer",
+    )
+
     _validate_state_change: bool = True
     is_hmtype: Final = True
 
@@ -38,6 +45,12 @@ class GenericEntity(hme.BaseParameterEntity[hme.ParameterT, hme.InputParameterT]
             parameter_data=parameter_data,
         )
         self.wrapped: bool = False
+        self._write_coalescer: hme.WriteCoalescer | None = None
+
+    @property
+    def write_coalescing_delay(self) -> float | None:
+        """Return the write coalescing delay in seconds, if enabled."""
+        return self._write_coalescer.delay if self._write_coalescer else None
 
     @config_property
     def usage(self) -> EntityUsage:
@@ -49,10 +62,20 @@ class GenericEntity(hme.BaseParameterEntity[hme.ParameterT, hme.InputParameterT]
     def event(self, value: Any) -> None:
         """Handle event for which this entity has subscribed."""
         old_value = self._value
-        new_value = self._convert_value(value)
-        if self._value == new_value:
-            return
-        self.update_value(value=new_value)
+        if EVENT_TRACER.enabled:
+            started = time.perf_counter()
+            new_value = self._convert_value(value)
+            EVENT_TRACER.record(stage="convert_value", started=started)
+            if self._value == new_value:
+                return
+            started = time.perf_counter()
+            self.update_value(value=new_value)
+            EVENT_TRACER.record(stage="entity_update", started=started)
+        else:
+            new_value = self._convert_value(value)
+            if self._value == new_value:
+                return
+            self.update_value(value=new_value)
 
         # reload paramset_descriptions, if value has changed
         if (
@@ -101,6 +124,12 @@ class GenericEntity(hme.BaseParameterEntity[hme.ParameterT, hme.InputParameterT]
         if self._validate_state_change and not self.is_state_change(value=converted_value):
             return
 
+        if self._write_coalescer:
+            # optimistic update of the state, the backend confirms it by event
+            self.update_value(value=converted_value)
+            await self._write_coalescer.write(value=converted_value)
+            return
+
         await self._client.set_value(
             channel_address=self._channel_address,
             paramset_key=self._paramset_key,
@@ -108,6 +137,38 @@ class GenericEntity(hme.BaseParameterEntity[hme.ParameterT, hme.InputParameterT]
             value=converted_value,
         )
 
+    def set_write_coalescing(self, delay: float | None) -> None:
+        """
+        Enable write coalescing with the given delay in seconds, or disable it with None.
+
+        Rapid successive writes within the delay are sent as one write with the latest value.
+        """
+        if delay is None:
+            self._write_coalescer = None
+            return
+        if delay <= 0:
+            raise HaHomematicException(
+                f"SET_WRITE_COALESCING: delay must be positive for {self.full_name}"
+            )
+        self._write_coalescer = hme.WriteCoalescer(delay=delay, send=self._send_coalesced_value)
+
+    async def _send_coalesced_value(self, value: Any) -> bool:
+        """Send the value of coalesced writes to the backend."""
+        result = False
+        try:
+            result = await self._client.set_value(
+                channel_address=self._channel_address,
+                paramset_key=self._paramset_key,
+                parameter=self._parameter,
+                value=value,
+            )
+        finally:
+            if not result:
+                # the optimistic state is not confirmed by the backend
+                self._state_uncertain = True
+                self.update_entity()
+        return result
+
     def _prepare_value_for_sending(
         self, value: hme.InputParameterT, do_validate: bool = True
     ) -> hme.ParameterT:
@@ -156,6 +217,11 @@ class GenericEntity(hme.BaseParameterEntity[hme.ParameterT, hme.InputParameterT]
 class WrapperEntity(hme.BaseEntity):
     """Base class for entities that switch type of generic entities."""
 
+    __slots__ = (
+        "_wrapped_entity",
+        "_platform",
+    )
+
     def __init__(self, wrapped_entity: GenericEntity, new_platform: HmPlatform) -> None:
         """Initialize the entity."""
         if wrapped_entity.platform == new_platform:
@@ -171,6 +237,10 @@ class WrapperEntity(hme.BaseEntity):
         )
         self._platform = new_platform
         # use callbacks from wrapped entity
+        if wrapped_entity._update_callbacks is None:
+            wrapped_entity._update_callbacks = []
+        if wrapped_entity._remove_callbacks is None:
+            wrapped_entity._remove_callbacks = []
         self._update_callbacks = wrapped_entity._update_callbacks
         self._remove_callbacks = wrapped_entity._remove_callbacks
         # hide wrapped entity from HA
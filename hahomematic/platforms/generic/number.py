@@ -17,6 +17,8 @@ class BaseNumber(GenericEntity[ParameterT, InputParameterT]):
     This is a default platform that gets automatically generated.
     """
 
+    __slots__ = ()
+
     _platform = HmPlatform.NUMBER
 
 
@@ -27,6 +29,8 @@ class HmFloat(BaseNumber[float, float | str]):
     This is a default platform that gets automatically generated.
     """
 
+    __slots__ = ()
+
     def _prepare_value_for_sending(self, value: float | str, do_validate: bool = True) -> float:
         """Prepare value before sending."""
         if not do_validate or (
@@ -50,6 +54,8 @@ class HmInteger(BaseNumber[int, int | str]):
     This is a default platform that gets automatically generated.
     """
 
+    __slots__ = ()
+
     def _prepare_value_for_sending(self, value: int | str, do_validate: bool = True) -> int:
         """Prepare value before sending."""
         if not do_validate or (
@@ -17,6 +17,8 @@ class HmSelect(GenericEntity[int | str, int | str]):
     This is a default platform that gets automatically generated.
     """
 
+    __slots__ = ()
+
     _platform = HmPlatform.SELECT
 
     @value_property
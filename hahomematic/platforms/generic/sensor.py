@@ -22,6 +22,8 @@ class HmSensor(GenericEntity[Any, None]):
     This is a default platform that gets automatically generated.
     """
 
+    __slots__ = ()
+
     _platform = HmPlatform.SENSOR
 
     @value_property
@@ -22,6 +22,8 @@ class HmSwitch(GenericEntity[bool, bool]):
     This is a default platform that gets automatically generated.
     """
 
+    __slots__ = ()
+
     _platform = HmPlatform.SWITCH
 
     @value_property
@@ -16,4 +16,6 @@ class HmText(GenericEntity[str, str]):
     This is a default platform that gets automatically generated.
     """
 
+    __slots__ = ()
+
     _platform = HmPlatform.TEXT
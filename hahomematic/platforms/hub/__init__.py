@@ -2,11 +2,19 @@
 from __future__ import annotations
 
 import asyncio
+from datetime import datetime
 import logging
-from typing import Final
+from typing import Any, Final
 
 from hahomematic import central as hmcu
-from hahomematic.const import Backend, ProgramData, SystemEvent, SystemVariableData, SysvarType
+from hahomematic.const import (
+    INIT_DATETIME,
+    Backend,
+    ProgramData,
+    SystemEvent,
+    SystemVariableData,
+    SysvarType,
+)
 from hahomematic.platforms.hub.binary_sensor import HmSysvarBinarySensor
 from hahomematic.platforms.hub.button import HmProgramButton
 from hahomematic.platforms.hub.entity import GenericSystemVariable
@@ -32,19 +40,89 @@ class Hub:
         self._sema_fetch_sysvars: Final = asyncio.Semaphore()
         self._sema_fetch_programs: Final = asyncio.Semaphore()
         self._central: Final = central
+        # include_internal of the last fetch by the application
+        self._include_internal_programs: bool = False
+        self._include_internal_sysvars: bool = True
+        # pushed sysvars, that are unknown and wait for a refresh
+        self._pushed_unknown_sysvar_names: Final[set[str]] = set()
+        # pushed sysvars, that are filtered by the sysvar refresh
+        self._filtered_sysvar_names: Final[set[str]] = set()
+        self.last_sysvar_event: datetime = INIT_DATETIME
 
     async def fetch_sysvar_data(self, include_internal: bool = True) -> None:
         """Fetch sysvar data for the hub."""
+        if include_internal != self._include_internal_sysvars:
+            self._include_internal_sysvars = include_internal
+            self._filtered_sysvar_names.clear()
         async with self._sema_fetch_sysvars:
             if self._central.available:
                 await self._update_sysvar_entities(include_internal=include_internal)
 
+    async def refresh_sysvar_data(self) -> None:
+        """Refresh sysvar data with the include_internal of the last fetch."""
+        await self.fetch_sysvar_data(include_internal=self._include_internal_sysvars)
+
+    def sysvar_event(self, name: str, value: Any) -> None:
+        """
+        Update a system variable, that has been pushed by the backend.
+
+        A pushed, but unknown system variable triggers a refresh of all system variables,
+        unless it has been filtered by a previous refresh.
+        """
+        self.last_sysvar_event = datetime.now()
+        if (entity := self._central.sysvar_entities.get(name)) is None:
+            if name in self._filtered_sysvar_names:
+                return
+            if not self._pushed_unknown_sysvar_names:
+                _LOGGER.debug(
+                    "SYSVAR_EVENT: Unknown system variable %s. Refreshing system variables of %s",
+                    name,
+                    self._central.name,
+                )
+                self._central.create_task(
+                    self._refresh_pushed_sysvars(), name="refreshPushedSysvars"
+                )
+            self._pushed_unknown_sysvar_names.add(name)
+            return
+        try:
+            entity.update_value(value)
+        except (TypeError, ValueError) as ex:
+            _LOGGER.warning(
+                "SYSVAR_EVENT failed: Unable to update system variable %s with %s: %s",
+                name,
+                value,
+                ex,
+            )
+
+    async def _refresh_pushed_sysvars(self) -> None:
+        """
+        Refresh all system variables after an unknown system variable has been pushed.
+
+        The refresh uses the include_internal of the last fetch. Pushed system variables,
+        that are still unknown after the refresh, are remembered as filtered.
+        """
+        pushed_names = tuple(self._pushed_unknown_sysvar_names)
+        self._pushed_unknown_sysvar_names.clear()
+        async with self._sema_fetch_sysvars:
+            if not self._central.available or not await self._update_sysvar_entities(
+                include_internal=self._include_internal_sysvars
+            ):
+                return
+        self._filtered_sysvar_names.update(
+            name for name in pushed_names if name not in self._central.sysvar_entities
+        )
+
     async def fetch_program_data(self, include_internal: bool = False) -> None:
         """Fetch program data for the hub."""
+        self._include_internal_programs = include_internal
         async with self._sema_fetch_programs:
             if self._central.available:
                 await self._update_program_entities(include_internal=include_internal)
 
+    async def refresh_program_data(self) -> None:
+        """Refresh program data with the include_internal of the last fetch."""
+        await self.fetch_program_data(include_internal=self._include_internal_programs)
+
     async def _update_program_entities(self, include_internal: bool) -> None:
         """Retrieve all program data and update program values."""
         programs: list[ProgramData] = []
@@ -78,8 +156,12 @@ class Hub:
                 system_event=SystemEvent.HUB_REFRESHED, new_hub_entities=new_programs
             )
 
-    async def _update_sysvar_entities(self, include_internal: bool = True) -> None:
-        """Retrieve all variable data and update hmvariable values."""
+    async def _update_sysvar_entities(self, include_internal: bool = True) -> bool:
+        """
+        Retrieve all variable data and update hmvariable values.
+
+        Return if sysvars have been received.
+        """
         variables: list[SystemVariableData] = []
         if client := self._central.primary_client:
             variables = await client.get_all_system_variables(include_internal=include_internal)
@@ -88,7 +170,7 @@ class Hub:
                 "UPDATE_SYSVAR_ENTITIES: No sysvars received for %s",
                 self._central.name,
             )
-            return
+            return False
         _LOGGER.debug(
             "UPDATE_SYSVAR_ENTITIES: %i sysvars received for %s",
             len(variables),
@@ -118,6 +200,7 @@ class Hub:
             self._central.fire_system_event_callback(
                 system_event=SystemEvent.HUB_REFRESHED, new_hub_entities=new_sysvars
             )
+        return True
 
     def _create_program(self, data: ProgramData) -> HmProgramButton:
         """Create program as entity."""
@@ -167,9 +250,7 @@ class Hub:
 
     def _identify_missing_program_ids(self, programs: list[ProgramData]) -> list[str]:
         """Identify missing programs."""
-        return [
-            pid for pid in self._central.program_entities if pid not in [x.pid for x in programs]
-        ]
+        return list(self._central.program_entities.keys() - {x.pid for x in programs})
 
     def _identify_missing_variable_names(self, variables: list[SystemVariableData]) -> set[str]:
         """Identify missing variables."""
@@ -1,7 +1,9 @@
 """Support for entities used within hahomematic."""
 from __future__ import annotations
 
+from collections.abc import Callable, Mapping
 from datetime import datetime
+from functools import partial
 import logging
 from typing import Any, Final
 
@@ -36,6 +38,8 @@ _BINARY_SENSOR_TRUE_VALUE_DICT_FOR_VALUE_LIST: Final[dict[tuple[str, ...], str]]
 class PayloadMixin:
     """Mixin to add payload methods to class."""
 
+    __slots__ = ()
+
     @property
     def config_payload(self) -> dict[str, Any]:
         """Return the config payload."""
@@ -47,22 +51,27 @@ class PayloadMixin:
         return get_public_attributes_for_value_property(data_object=self)
 
 
-class OnTimeMixin:
-    """Mixin to add on_time support."""
+class OnTimeData:
+    """The on_time of an entity, that is only used shortly after it has been set."""
+
+    __slots__ = (
+        "_on_time",
+        "_on_time_updated",
+    )
 
     def __init__(self) -> None:
-        """Init OnTimeMixin."""
+        """Init the on_time data."""
         self._on_time: float | None = None
         self._on_time_updated: datetime = INIT_DATETIME
 
-    def set_on_time(self, on_time: float) -> None:
+    def set(self, on_time: float) -> None:
         """Set the on_time."""
         self._on_time = on_time
         self._on_time_updated = datetime.now()
 
-    def get_on_time_and_cleanup(self) -> float | None:
+    def get_and_cleanup(self) -> float | None:
         """Return the on_time and cleanup afterwards."""
-        if not hasattr(self, "_on_time") or self._on_time is None:
+        if self._on_time is None:
             return None
         # save values
         on_time = self._on_time
@@ -75,6 +84,28 @@ class OnTimeMixin:
         return on_time
 
 
+class OnTimeMixin:
+    """
+    Mixin to add on_time support.
+
+    Slotted subclasses must provide the slot _on_time_data, and init it with OnTimeData.
+    """
+
+    __slots__ = ()
+
+    _on_time_data: OnTimeData
+
+    def set_on_time(self, on_time: float) -> None:
+        """Set the on_time."""
+        self._on_time_data.set(on_time=on_time)
+
+    def get_on_time_and_cleanup(self) -> float | None:
+        """Return the on_time and cleanup afterwards."""
+        if not hasattr(self, "_on_time_data"):
+            return None
+        return self._on_time_data.get_and_cleanup()
+
+
 class EntityNameData:
     """Dataclass for entity name parts."""
 
@@ -335,21 +366,62 @@ def convert_value(
     value: Any, target_type: ParameterType, value_list: tuple[str, ...] | None
 ) -> Any:
     """Convert a value to target_type."""
-    if value is None:
-        return None
+    return get_value_converter(target_type=target_type, value_list=value_list)(value)
+
+
+def get_value_converter(
+    target_type: ParameterType, value_list: tuple[str, ...] | None
+) -> Callable[[Any], Any]:
+    """Return the converter for target_type, so the type must only be checked once."""
     if target_type == ParameterType.BOOL:
         if value_list:
             # relevant for ENUMs retyped to a BOOL
-            return _get_binary_sensor_value(value=value, value_list=value_list)
-        if isinstance(value, str):
-            return to_bool(value)
-        return bool(value)
+            return partial(_convert_value_list_to_bool, value_list=value_list)
+        return _convert_to_bool
     if target_type == ParameterType.FLOAT:
-        return float(value)
+        return _convert_to_float
     if target_type == ParameterType.INTEGER:
-        return int(float(value))
+        return _convert_to_int
     if target_type == ParameterType.STRING:
-        return str(value)
+        return _convert_to_str
+    return _convert_to_same
+
+
+def _convert_value_list_to_bool(value: Any, value_list: tuple[str, ...]) -> bool | None:
+    """Convert an index or an element of value_list to bool."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value_list.index(value)
+    return _get_binary_sensor_value(value=value, value_list=value_list)
+
+
+def _convert_to_bool(value: Any) -> bool | None:
+    """Convert a value to bool."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return to_bool(value)
+    return bool(value)
+
+
+def _convert_to_float(value: Any) -> float | None:
+    """Convert a value to float."""
+    return None if value is None else float(value)
+
+
+def _convert_to_int(value: Any) -> int | None:
+    """Convert a value to int."""
+    return None if value is None else int(float(value))
+
+
+def _convert_to_str(value: Any) -> str | None:
+    """Convert a value to str."""
+    return None if value is None else str(value)
+
+
+def _convert_to_same(value: Any) -> Any:
+    """Return the value unchanged."""
     return value
 
 
@@ -374,7 +446,9 @@ def _get_binary_sensor_value(value: int, value_list: tuple[str, ...]) -> bool:
 
 
 def check_channel_is_the_only_primary_channel(
-    current_channel_no: int | None, device_def: dict[str, Any], device_has_multiple_channels: bool
+    current_channel_no: int | None,
+    device_def: Mapping[str, Any],
+    device_has_multiple_channels: bool,
 ) -> bool:
     """Check if this channel is the only primary channel."""
     primary_channel: int = device_def[hmed.ED_PRIMARY_CHANNEL]
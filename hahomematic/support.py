@@ -1,6 +1,7 @@
 """Helper functions used within hahomematic."""
 from __future__ import annotations
 
+import asyncio
 import base64
 from collections.abc import Callable, Collection
 import contextlib
@@ -163,6 +164,16 @@ def updated_within_seconds(last_update: datetime, max_age: int | float = MAX_CAC
     return False
 
 
+async def cancel_task(task: asyncio.Task[Any]) -> None:
+    """Cancel the task and wait for it, without suppressing a cancellation of the caller."""
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        if (current_task := asyncio.current_task()) is not None and current_task.cancelling():
+            raise
+
+
 def find_free_port() -> int:
     """Find a free port for XmlRpc server default port."""
     with contextlib.closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as sock:
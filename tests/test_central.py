@@ -1,23 +1,34 @@
 """Test the HaHomematic central."""
 from __future__ import annotations
 
+import asyncio
 from contextlib import suppress
+from datetime import datetime, timedelta
 from typing import cast
-from unittest.mock import call, patch
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, call, patch
+import zipfile
 
+import orjson
 import pytest
 
+from hahomematic.central import CentralUnit
+from hahomematic.central.refresh_scheduler import RefreshScheduler
 from hahomematic.config import PING_PONG_MISMATCH_COUNT
 from hahomematic.const import (
     EVENT_AVAILABLE,
+    DeviceFirmwareState,
     EntityUsage,
     EventType,
     HmPlatform,
     InterfaceEventType,
     Parameter,
     ParamsetKey,
+    RefreshJob,
 )
-from hahomematic.exceptions import HaHomematicException, NoClients
+from hahomematic.exceptions import HaHomematicException, NoClients, UnsupportedException
+from hahomematic.performance import REFRESH_JOB_RUNS
+from hahomematic.platforms.device import _DefinitionExporter
+from hahomematic.platforms.entity import BaseParameterEntity, CallParameterCollector
 from hahomematic.platforms.generic.number import HmFloat
 from hahomematic.platforms.generic.switch import HmSwitch
 
@@ -55,6 +66,51 @@ async def test_device_export(factory: helper.Factory) -> None:
     await device.export_device_definition()
 
 
+@pytest.mark.asyncio
+async def test_device_definitions_export(factory: helper.Factory) -> None:
+    """Test the bulk export of device definitions into one archive."""
+    central, _ = await factory.get_default_central(TEST_DEVICES)
+    archive_path = await central.export_device_definitions()
+    with zipfile.ZipFile(archive_path) as archive:
+        assert sorted(archive.namelist()) == [
+            "export_device_descriptions/HmIP-BSM.json",
+            "export_device_descriptions/HmIP-STHD.json",
+            "export_paramset_descriptions/HmIP-BSM.json",
+            "export_paramset_descriptions/HmIP-STHD.json",
+        ]
+        device_descriptions = orjson.loads(
+            archive.read("export_device_descriptions/HmIP-BSM.json")
+        )
+    assert not any("VCU2128127" in dd["ADDRESS"] for dd in device_descriptions)
+
+    archive_path = await central.export_device_definitions(device_addresses=["VCU6354483"])
+    with zipfile.ZipFile(archive_path) as archive:
+        assert len(archive.namelist()) == 2
+
+
+@pytest.mark.asyncio
+async def test_device_definitions_export_failure(factory: helper.Factory) -> None:
+    """Test that a failed bulk export cancels the remaining fetches."""
+    central, _ = await factory.get_default_central(TEST_DEVICES)
+    pending_cancelled = asyncio.Event()
+
+    async def get_data(self: _DefinitionExporter) -> tuple[str, list, dict]:
+        if self._device_address == "VCU2128127":
+            raise HaHomematicException("fetch failed")
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            pending_cancelled.set()
+            raise
+        return "", [], {}  # pragma: no cover
+
+    with patch.object(_DefinitionExporter, "get_data", get_data), pytest.raises(
+        HaHomematicException, match="fetch failed"
+    ):
+        await central.export_device_definitions()
+    assert pending_cancelled.is_set()
+
+
 @pytest.mark.asyncio
 async def test_identify_callback_ip(factory: helper.Factory) -> None:
     """Test identify_callback_ip."""
@@ -295,29 +351,29 @@ async def test_central_services(factory: helper.Factory) -> None:
     await central.fetch_sysvar_data()
     assert mock_client.method_calls[-1] == call.get_all_system_variables(include_internal=True)
 
-    assert len(mock_client.method_calls) == 37
+    assert len(mock_client.method_calls) == 38
     await central.load_and_refresh_entity_data(paramset_key=ParamsetKey.MASTER)
-    assert len(mock_client.method_calls) == 37
+    assert len(mock_client.method_calls) == 38
     await central.load_and_refresh_entity_data(paramset_key=ParamsetKey.VALUES)
-    assert len(mock_client.method_calls) == 70
+    assert len(mock_client.method_calls) == 71
 
     await central.get_system_variable(name="SysVar_Name")
     assert mock_client.method_calls[-1] == call.get_system_variable("SysVar_Name")
 
-    assert len(mock_client.method_calls) == 71
+    assert len(mock_client.method_calls) == 72
     await central.set_system_variable(name="sv_alarm", value=True)
     assert mock_client.method_calls[-1] == call.set_system_variable(name="sv_alarm", value=True)
-    assert len(mock_client.method_calls) == 72
+    assert len(mock_client.method_calls) == 73
     await central.set_system_variable(name="SysVar_Name", value=True)
-    assert len(mock_client.method_calls) == 72
+    assert len(mock_client.method_calls) == 73
 
     await central.set_install_mode(interface_id=const.INTERFACE_ID)
     assert mock_client.method_calls[-1] == call.set_install_mode(
         on=True, t=60, mode=1, device_address=None
     )
-    assert len(mock_client.method_calls) == 73
+    assert len(mock_client.method_calls) == 74
     await central.set_install_mode(interface_id="NOT_A_VALID_INTERFACE_ID")
-    assert len(mock_client.method_calls) == 73
+    assert len(mock_client.method_calls) == 74
 
     await central.get_client(interface_id=const.INTERFACE_ID).set_value(
         channel_address="123",
@@ -331,7 +387,7 @@ async def test_central_services(factory: helper.Factory) -> None:
         parameter="LEVEL",
         value=1.0,
     )
-    assert len(mock_client.method_calls) == 74
+    assert len(mock_client.method_calls) == 75
 
     with pytest.raises(HaHomematicException):
         await central.get_client(interface_id="NOT_A_VALID_INTERFACE_ID").set_value(
@@ -340,7 +396,7 @@ async def test_central_services(factory: helper.Factory) -> None:
             parameter="LEVEL",
             value=1.0,
         )
-    assert len(mock_client.method_calls) == 74
+    assert len(mock_client.method_calls) == 75
 
     await central.get_client(interface_id=const.INTERFACE_ID).put_paramset(
         address="123",
@@ -350,14 +406,14 @@ async def test_central_services(factory: helper.Factory) -> None:
     assert mock_client.method_calls[-1] == call.put_paramset(
         address="123", paramset_key="VALUES", value={"LEVEL": 1.0}
     )
-    assert len(mock_client.method_calls) == 75
+    assert len(mock_client.method_calls) == 76
     with pytest.raises(HaHomematicException):
         await central.get_client(interface_id="NOT_A_VALID_INTERFACE_ID").put_paramset(
             address="123",
             paramset_key=ParamsetKey.VALUES,
             value={"LEVEL": 1.0},
         )
-    assert len(mock_client.method_calls) == 75
+    assert len(mock_client.method_calls) == 76
 
     assert (
         central.get_generic_entity(
@@ -430,6 +486,92 @@ async def test_ping_pong(factory: helper.Factory) -> None:
     assert central._ping_count[interface_id] == 0
 
 
+@pytest.mark.asyncio
+async def test_connection_checker(factory: helper.Factory) -> None:
+    """Test the connection checker."""
+    central, client = await factory.get_default_central(TEST_DEVICES, do_mock_client=False)
+    interface_id = client.interface_id
+    connection_checker = central._connection_checker
+    assert connection_checker.is_running is False
+
+    with patch.object(client, "is_connected", AsyncMock(return_value=True)) as is_connected:
+        # first check always probes the interface
+        assert await connection_checker._check_client(client=client) is False
+        assert is_connected.await_count == 1
+        # interface without events is probed again
+        assert await connection_checker._check_client(client=client) is False
+        assert is_connected.await_count == 2
+        # interface with recent events is not probed
+        central.event(interface_id, "VCU2128127:4", "STATE", 1)
+        assert await connection_checker._check_client(client=client) is False
+        assert is_connected.await_count == 2
+
+    connection_checker.start()
+    assert connection_checker.is_running is True
+    await connection_checker.stop()
+    assert connection_checker.is_running is False
+
+
+@pytest.mark.asyncio
+async def test_refresh_reconnected_interfaces(factory: helper.Factory) -> None:
+    """Test the refresh of entity data after a reconnect."""
+    central, mock_client = await factory.get_default_central(TEST_DEVICES)
+    switch: HmSwitch = cast(HmSwitch, central.get_generic_entity("VCU2128127:4", "STATE"))
+    readable_entities = central.get_readable_generic_entities(paramset_key=ParamsetKey.VALUES)
+    mock_client.last_initialized = datetime.now()
+    # switch is updated after the reconnect
+    central.event(const.INTERFACE_ID, "VCU2128127:4", "STATE", 1)
+
+    with patch.object(BaseParameterEntity, "load_entity_value", autospec=True) as load_value:
+        await central.load_and_refresh_entity_data(
+            paramset_key=ParamsetKey.VALUES, interface_ids=("other_interface",)
+        )
+        assert load_value.call_count == 0
+        await central.load_and_refresh_entity_data(
+            paramset_key=ParamsetKey.VALUES, interface_ids=(const.INTERFACE_ID,)
+        )
+        refreshed_entities = [call_args.args[0] for call_args in load_value.call_args_list]
+        assert switch not in refreshed_entities
+        assert len(refreshed_entities) == len(readable_entities) - 1
+
+
+@pytest.mark.asyncio
+async def test_data_cache_load_by_interface(factory: helper.Factory) -> None:
+    """Test, that the data cache is loaded per interface."""
+    central, mock_client = await factory.get_default_central(TEST_DEVICES)
+    data_cache = central.data_cache
+    interface = mock_client.interface
+    data_cache.add_data(interface="other", all_device_data={"other.VCU0000001%3A1.STATE": True})
+
+    async def fetch_all_device_data() -> None:
+        data_cache.add_data(
+            interface=interface, all_device_data={f"{interface}.VCU2128127%3A4.STATE": True}
+        )
+
+    with patch.object(
+        mock_client, "fetch_all_device_data", AsyncMock(side_effect=fetch_all_device_data)
+    ) as fetch:
+        await data_cache.load(interface_ids=("other_interface",))
+        assert fetch.call_count == 0
+        await data_cache.load(interface_ids=(const.INTERFACE_ID,))
+        assert fetch.call_count == 1
+        # the data of the interface is still current
+        await data_cache.load(interface_ids=(const.INTERFACE_ID,))
+        assert fetch.call_count == 1
+
+    assert (
+        data_cache.get_data(interface=interface, channel_address="VCU2128127:4", parameter="STATE")
+        is True
+    )
+    assert (
+        data_cache.get_data(interface="other", channel_address="VCU0000001:1", parameter="STATE")
+        is True
+    )
+    assert data_cache.is_empty is False
+    data_cache.clear()
+    assert data_cache.is_empty is True
+
+
 @pytest.mark.asyncio
 async def test_ping_failure(factory: helper.Factory) -> None:
     """Test central other methods."""
@@ -507,3 +649,329 @@ async def test_central_getter(factory: helper.Factory) -> None:
     assert central.get_event("123", 1) is None
     assert central.get_program_button("123") is None
     assert central.get_sysvar_entity("123") is None
+
+
+@pytest.mark.asyncio
+async def test_central_send_values(factory: helper.Factory) -> None:
+    """Test batch write of central."""
+    central, mock_client = await factory.get_default_central(TEST_DEVICES)
+    switch: HmSwitch = cast(HmSwitch, central.get_generic_entity("VCU2128127:4", "STATE"))
+    set_point = cast(HmFloat, central.get_generic_entity("VCU6354483:1", "SET_POINT_TEMPERATURE"))
+    boost = cast(HmSwitch, central.get_generic_entity("VCU6354483:1", "BOOST_MODE"))
+    temperature = central.get_generic_entity("VCU6354483:1", "ACTUAL_TEMPERATURE")
+    assert temperature
+
+    results = await central.send_values(
+        entity_values=[
+            (switch, True),
+            (set_point, 19.5),
+            (boost, True),
+            (temperature, 20.0),
+        ]
+    )
+    assert results == {
+        switch.unique_identifier: True,
+        set_point.unique_identifier: True,
+        boost.unique_identifier: True,
+        temperature.unique_identifier: False,
+    }
+    assert (
+        call.set_value(
+            channel_address="VCU2128127:4", paramset_key="VALUES", parameter="STATE", value=True
+        )
+        in mock_client.method_calls
+    )
+    assert (
+        call.put_paramset(
+            address="VCU6354483:1",
+            paramset_key="VALUES",
+            value={"SET_POINT_TEMPERATURE": 19.5, "BOOST_MODE": True},
+        )
+        in mock_client.method_calls
+    )
+    assert switch.value is True
+    assert set_point.value == 19.5
+
+    collector = CallParameterCollector()
+    collector.add_entity(entity=set_point, value=20.5, use_put_paramset=False)
+    collector.add_entity(entity=boost, value=False, use_put_paramset=False)
+    with patch.object(
+        mock_client,
+        "set_value",
+        AsyncMock(side_effect=[HaHomematicException("failed"), True]),
+    ) as set_value:
+        results = await collector.send_data_concurrently(max_concurrency=2)
+    assert results == {
+        ("VCU6354483:1", "SET_POINT_TEMPERATURE"): False,
+        ("VCU6354483:1", "BOOST_MODE"): True,
+    }
+    assert set_value.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_device_descriptions_batch(factory: helper.Factory) -> None:
+    """Test the batch fetch of device descriptions with multicall and the fallback."""
+    central, client = await factory.get_default_central(TEST_DEVICES, do_mock_client=False)
+    device_description = central.device_descriptions.get_device(const.INTERFACE_ID, "VCU2128127")
+    proxy_read = MagicMock()
+    proxy_read.system.multicall = AsyncMock(
+        return_value=[
+            [device_description],
+            {"faultCode": -2, "faultString": "Unknown instance"},
+        ]
+    )
+    with patch.object(client, "_proxy_read", proxy_read, create=True):
+        assert await client.get_device_descriptions_batch(device_addresses=()) == []
+        assert await client.get_device_descriptions_batch(
+            device_addresses=("VCU2128127", "VCU0000000")
+        ) == [device_description]
+        assert proxy_read.system.multicall.await_count == 1
+
+        # backends without system.multicall are called concurrently per device
+        proxy_read.system.multicall.side_effect = UnsupportedException("multicall")
+        proxy_read.getDeviceDescription = AsyncMock(
+            side_effect=lambda address: device_description if address == "VCU2128127" else {}
+        )
+        assert await client.get_device_descriptions_batch(
+            device_addresses=("VCU2128127", "VCU0000000")
+        ) == [device_description]
+        assert proxy_read.getDeviceDescription.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_device_details_metadata(factory: helper.Factory) -> None:
+    """Test the loading of device details with one call and the fallback."""
+    central, client = await factory.get_default_central(TEST_DEVICES)
+    metadata = ({"VCU2128127:4": {"Kitchen"}}, {"VCU2128127:4": {"Light", "Security"}})
+    with patch.object(
+        client, "fetch_device_metadata", AsyncMock(return_value=metadata)
+    ), patch.object(client, "get_all_rooms", AsyncMock(return_value={})) as get_all_rooms:
+        central.device_details.clear()
+        await central.device_details.load()
+        assert get_all_rooms.call_count == 0
+    assert central.device_details.get_room(device_address="VCU2128127") == "Kitchen"
+    assert central.device_details.get_function_text(address="VCU2128127:4") in (
+        "Light,Security",
+        "Security,Light",
+    )
+
+    with patch.object(client, "fetch_device_metadata", AsyncMock(return_value=None)), patch.object(
+        client, "get_all_rooms", AsyncMock(return_value={"VCU2128127:4": {"Garden"}})
+    ) as get_all_rooms, patch.object(
+        client, "get_all_functions", AsyncMock(return_value={})
+    ) as get_all_functions:
+        central.device_details.clear()
+        await central.device_details.load()
+        assert get_all_rooms.call_count == 1
+        assert get_all_functions.call_count == 1
+    assert central.device_details.get_function_text(address="VCU2128127:4") is None
+
+
+@pytest.mark.asyncio
+async def test_hub_refresh_removed_programs(factory: helper.Factory) -> None:
+    """Test, that programs, that are no longer reported, are removed by a hub refresh."""
+    central, client = await factory.get_default_central({}, add_programs=True)
+    assert set(central.program_entities) == {"pid1", "pid2"}
+
+    with patch.object(client, "get_all_programs", AsyncMock(return_value=const.PROGRAM_DATA[1:])):
+        await central.fetch_program_data()
+    assert set(central.program_entities) == {"pid2"}
+
+
+@pytest.mark.asyncio
+async def test_sysvar_event(factory: helper.Factory) -> None:
+    """Test, that pushed sysvars are updated without polling."""
+    central, client = await factory.get_default_central({}, add_sysvars=True)
+    logic = central.get_sysvar_entity("sv_logic")
+    logic_callback = MagicMock()
+    logic.register_update_callback(logic_callback)
+
+    central.event(const.INTERFACE_ID, "sysvar", "sv_logic", True)
+    assert logic.value is True
+    assert logic_callback.call_count == 1
+    assert central.last_sysvar_event > datetime.now() - timedelta(seconds=10)
+
+    # an unknown sysvar triggers a refresh of all sysvars with the last include_internal
+    await central.fetch_sysvar_data(include_internal=False)
+    with patch.object(
+        client, "get_all_system_variables", AsyncMock(return_value=const.SYSVAR_DATA)
+    ) as get_all_system_variables:
+        central.event(const.INTERFACE_ID, "sysvar", "sv_unknown", 1.0)
+        central.event(const.INTERFACE_ID, "sysvar", "sv_unknown", 2.0)
+        await asyncio.sleep(0.1)
+        assert get_all_system_variables.await_count == 1
+        assert get_all_system_variables.call_args.kwargs == {"include_internal": False}
+
+        # a sysvar, that is filtered by the refresh, doesn't trigger another refresh
+        central.event(const.INTERFACE_ID, "sysvar", "sv_unknown", 3.0)
+        await asyncio.sleep(0.1)
+        assert get_all_system_variables.await_count == 1
+        assert "sv_unknown" not in central.sysvar_entities
+
+
+@pytest.mark.asyncio
+async def test_refresh_scheduler(factory: helper.Factory) -> None:
+    """Test the scheduled background refresh."""
+    central, _ = await factory.get_default_central({}, add_sysvars=True)
+    scheduler = RefreshScheduler(
+        central=central, intervals={RefreshJob.SYSVARS: 0.05, RefreshJob.MASTER: 0}
+    )
+    assert scheduler.jobs == (RefreshJob.SYSVARS,)
+    successful_runs = REFRESH_JOB_RUNS.get("sysvars", "success")
+
+    with patch.object(central, "refresh_sysvar_data", AsyncMock()) as fetch:
+        scheduler.start()
+        assert scheduler.is_running is True
+        await asyncio.sleep(0.3)
+        await scheduler.stop()
+        assert scheduler.is_running is False
+        assert fetch.await_count >= 2
+        assert REFRESH_JOB_RUNS.get("sysvars", "success") == successful_runs + fetch.await_count
+
+        # pushed system variables are only swept for consistency
+        central.event(const.INTERFACE_ID, "sysvar", "sv_logic", True)
+        assert scheduler._is_due(job=RefreshJob.SYSVARS, interval=30) is False
+
+        # a job is skipped, while its interface is unavailable
+        with patch.object(
+            CentralUnit, "primary_client", new_callable=PropertyMock, return_value=None
+        ):
+            assert await scheduler.run_job(job=RefreshJob.SYSVARS) is False
+        assert REFRESH_JOB_RUNS.get("sysvars", "skipped") >= 1
+
+        fetch.side_effect = HaHomematicException("failed")
+        assert await scheduler.run_job(job=RefreshJob.SYSVARS) is False
+        assert REFRESH_JOB_RUNS.get("sysvars", "failed") >= 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_scheduler_include_internal(factory: helper.Factory) -> None:
+    """Test, that the hub jobs keep the include_internal of the application."""
+    central, client = await factory.get_default_central({}, add_sysvars=True, add_programs=True)
+    scheduler = RefreshScheduler(
+        central=central, intervals={RefreshJob.SYSVARS: 3600, RefreshJob.PROGRAMS: 3600}
+    )
+    await central.fetch_sysvar_data(include_internal=False)
+    await central.fetch_program_data(include_internal=True)
+
+    with patch.object(
+        client, "get_all_system_variables", AsyncMock(return_value=const.SYSVAR_DATA)
+    ) as get_all_system_variables, patch.object(
+        client, "get_all_programs", AsyncMock(return_value=const.PROGRAM_DATA)
+    ) as get_all_programs:
+        assert await scheduler.run_job(job=RefreshJob.SYSVARS) is True
+        assert await scheduler.run_job(job=RefreshJob.PROGRAMS) is True
+    get_all_system_variables.assert_awaited_once_with(include_internal=False)
+    get_all_programs.assert_awaited_once_with(include_internal=True)
+
+
+@pytest.mark.asyncio
+async def test_refresh_scheduler_device_jobs(factory: helper.Factory) -> None:
+    """Test the firmware and MASTER jobs of the scheduled background refresh."""
+    central, _ = await factory.get_default_central(TEST_DEVICES)
+    scheduler = RefreshScheduler(
+        central=central, intervals={RefreshJob.FIRMWARE: 3600, RefreshJob.MASTER: 3600}
+    )
+    assert scheduler.jobs == (RefreshJob.FIRMWARE, RefreshJob.MASTER)
+
+    with patch.object(
+        central, "refresh_firmware_data_by_state", AsyncMock()
+    ) as refresh_firmware_data, patch.object(
+        central, "load_and_refresh_entity_data", AsyncMock()
+    ) as load_and_refresh_entity_data:
+        assert await scheduler.run_job(job=RefreshJob.FIRMWARE) is True
+        refresh_firmware_data.assert_awaited_once()
+        firmware_states = refresh_firmware_data.call_args.kwargs["device_firmware_states"]
+        assert DeviceFirmwareState.PERFORMING_UPDATE in firmware_states
+        assert DeviceFirmwareState.UP_TO_DATE not in firmware_states
+
+        assert await scheduler.run_job(job=RefreshJob.MASTER) is True
+        load_and_refresh_entity_data.assert_awaited_once_with(paramset_key=ParamsetKey.MASTER)
+
+        # device jobs are skipped, while an interface is unavailable
+        with patch.object(CentralUnit, "available", new_callable=PropertyMock, return_value=False):
+            assert await scheduler.run_job(job=RefreshJob.FIRMWARE) is False
+            assert await scheduler.run_job(job=RefreshJob.MASTER) is False
+        with patch.object(
+            CentralUnit, "has_clients", new_callable=PropertyMock, return_value=False
+        ):
+            assert await scheduler.run_job(job=RefreshJob.FIRMWARE) is False
+        assert refresh_firmware_data.await_count == 1
+        assert load_and_refresh_entity_data.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_firmware_data_by_state(factory: helper.Factory) -> None:
+    """Test, that the firmware data of devices is refreshed with one batch."""
+    central, client = await factory.get_default_central(TEST_DEVICES)
+    device = central.get_device("VCU2128127")
+    channel_addresses = central.device_descriptions.get_addresses(const.INTERFACE_ID)["VCU2128127"]
+    device_descriptions = [
+        central.device_descriptions.get_device(const.INTERFACE_ID, "VCU2128127")
+        | {"FIRMWARE": "9.9.9", "FIRMWARE_UPDATE_STATE": "PERFORMING_UPDATE"},
+        central.device_descriptions.get_device(const.INTERFACE_ID, "VCU6354483"),
+    ]
+    with patch.object(
+        client, "get_device_descriptions_batch", AsyncMock(return_value=device_descriptions)
+    ) as get_batch, patch.object(central.device_descriptions, "save", AsyncMock()) as save:
+        await central.refresh_firmware_data_by_state(
+            device_firmware_states=tuple(DeviceFirmwareState)
+        )
+    get_batch.assert_awaited_once()
+    assert sorted(get_batch.await_args.kwargs["device_addresses"]) == [
+        "VCU2128127",
+        "VCU6354483",
+    ]
+    save.assert_awaited_once()
+    assert device.firmware == "9.9.9"
+    assert device.firmware_update_state == DeviceFirmwareState.PERFORMING_UPDATE
+    assert (
+        central.device_descriptions.get_addresses(const.INTERFACE_ID)["VCU2128127"]
+        == channel_addresses
+    )
+
+
+@pytest.mark.asyncio
+async def test_add_new_devices_incremental(factory: helper.Factory) -> None:
+    """Test, that known device descriptions are updated without full re-discovery."""
+    central, client = await factory.get_default_central(TEST_DEVICES)
+    device = central.get_device("VCU2128127")
+    device_descriptions = [
+        central.device_descriptions.get_device(const.INTERFACE_ID, address)
+        for address in ("VCU2128127", "VCU2128127:1", "VCU6354483")
+    ]
+    with (
+        patch.object(central.device_descriptions, "save", AsyncMock()) as save_devices,
+        patch.object(central.paramset_descriptions, "save", AsyncMock()) as save_paramsets,
+        patch.object(client, "fetch_paramset_descriptions", AsyncMock()) as fetch_paramsets,
+        patch.object(central, "_create_devices", AsyncMock()) as create_devices,
+    ):
+        # unchanged descriptions are skipped
+        await central.add_new_devices(const.INTERFACE_ID, device_descriptions)
+        assert save_devices.await_count == 0
+
+        # changed firmware data updates the known device only
+        device_descriptions[0] = device_descriptions[0] | {"FIRMWARE": "9.9.9"}
+        await central.add_new_devices(const.INTERFACE_ID, device_descriptions)
+        assert save_devices.await_count == 1
+        assert save_paramsets.await_count == 0
+        assert fetch_paramsets.await_count == 0
+        assert create_devices.await_count == 0
+        assert device.firmware == "9.9.9"
+
+        # a changed channel version fetches the paramsets of the channel
+        device_descriptions[1] = device_descriptions[1] | {"VERSION": 99}
+        await central.add_new_devices(const.INTERFACE_ID, device_descriptions)
+        fetch_paramsets.assert_awaited_once_with(device_descriptions[1])
+        assert save_paramsets.await_count == 1
+        assert create_devices.await_count == 0
+
+        # only new devices are created
+        new_device_description = device_descriptions[2] | {
+            "ADDRESS": "VCU0000999",
+            "CHILDREN": [],
+        }
+        await central.add_new_devices(const.INTERFACE_ID, [new_device_description])
+        create_devices.assert_awaited_once_with(
+            new_device_addresses={const.INTERFACE_ID: {"VCU0000999"}}
+        )
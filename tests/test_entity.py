@@ -1,18 +1,30 @@
 """Tests for switch entities of hahomematic."""
 from __future__ import annotations
 
-from typing import cast
-from unittest.mock import MagicMock, call
+import asyncio
+from typing import Any, cast
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 
 from hahomematic.caches.visibility import check_ignore_parameters_is_clean
 from hahomematic.const import CallSource, EntityUsage
+from hahomematic.exceptions import HaHomematicException
+from hahomematic.platforms.custom.const import EntityDefinition
 from hahomematic.platforms.custom.definition import (
+    ALL_BLACKLISTED_DEVICES,
+    ALL_DEVICES,
+    ED_PRIMARY_CHANNEL,
+    ED_SECONDARY_CHANNELS,
+    ED_VISIBLE_FIELDS,
+    _get_device_group,
+    get_entity_configs,
     get_required_parameters,
+    is_multi_channel_device,
     validate_entity_definition,
 )
 from hahomematic.platforms.custom.switch import CeSwitch
+from hahomematic.platforms.entity import entity_update_batch
 from hahomematic.platforms.generic.sensor import HmSensor
 from hahomematic.platforms.generic.switch import HmSwitch
 
@@ -71,6 +83,37 @@ async def test_custom_entity_callback(factory: helper.Factory) -> None:
     device_removed_mock.assert_called_with()
 
 
+@pytest.mark.asyncio
+async def test_custom_entity_update_batch(factory: helper.Factory) -> None:
+    """Test the update batching of custom entities."""
+    central, _ = await factory.get_default_central(TEST_DEVICES)
+    switch: CeSwitch = cast(CeSwitch, helper.get_prepared_custom_entity(central, "VCU2128127", 4))
+    device_updated_mock = MagicMock()
+    switch.register_update_callback(device_updated_mock)
+
+    central.event(const.INTERFACE_ID, "VCU2128127:4", "STATE", 1)
+    central.event(const.INTERFACE_ID, "VCU2128127:4", "STATE", 0)
+    assert device_updated_mock.call_count == 2
+
+    device_updated_mock.reset_mock()
+    with entity_update_batch():
+        central.event(const.INTERFACE_ID, "VCU2128127:4", "STATE", 1)
+        with entity_update_batch():
+            central.event(const.INTERFACE_ID, "VCU2128127:4", "STATE", 1)
+        central.event(const.INTERFACE_ID, "VCU2128127:4", "STATE", 0)
+        assert device_updated_mock.call_count == 0
+    assert device_updated_mock.call_count == 1
+    assert switch.value is False
+
+    # the arguments of the last deferred notification are passed through
+    device_updated_mock.reset_mock()
+    with entity_update_batch():
+        switch._data_entity_updated("first")
+        switch._data_entity_updated("last", source="test")
+    device_updated_mock.assert_called_once_with("last", source="test")
+    switch.unregister_update_callback(device_updated_mock)
+
+
 @pytest.mark.asyncio
 async def test_generic_entity_callback(factory: helper.Factory) -> None:
     """Test CeSwitch."""
@@ -145,12 +188,125 @@ async def test_load_generic_entity(factory: helper.Factory) -> None:
     )
 
 
+@pytest.mark.asyncio
+async def test_generic_entity_write_coalescing(factory: helper.Factory) -> None:
+    """Test write coalescing of generic_entity."""
+    central, mock_client = await factory.get_default_central(TEST_DEVICES)
+    switch: HmSwitch = cast(HmSwitch, central.get_generic_entity("VCU2128127:4", "STATE"))
+    assert switch.write_coalescing_delay is None
+    switch.set_write_coalescing(delay=0.05)
+    assert switch.write_coalescing_delay == 0.05
+    call_count = len(mock_client.method_calls)
+
+    writes = asyncio.gather(switch.turn_on(), switch.turn_off(), switch.turn_on())
+    await asyncio.sleep(0)
+    # optimistic state is applied immediately
+    assert switch.value is True
+    assert len(mock_client.method_calls) == call_count
+    await writes
+    assert mock_client.method_calls[call_count:] == [
+        call.set_value(
+            channel_address="VCU2128127:4", paramset_key="VALUES", parameter="STATE", value=True
+        )
+    ]
+    assert switch.value is True
+
+    # a cancelled writer doesn't cancel the write of the other coalesced writers
+    first_write = asyncio.create_task(switch.turn_off())
+    await asyncio.sleep(0)
+    last_write = asyncio.create_task(switch.turn_on())
+    await asyncio.sleep(0)
+    first_write.cancel()
+    await last_write
+    assert first_write.cancelled() is True
+    assert mock_client.method_calls[-1] == call.set_value(
+        channel_address="VCU2128127:4", paramset_key="VALUES", parameter="STATE", value=True
+    )
+
+    # a failed write marks the optimistic state as uncertain
+    with patch.object(
+        mock_client, "set_value", AsyncMock(side_effect=HaHomematicException("failed"))
+    ), pytest.raises(HaHomematicException):
+        await switch.turn_off()
+    assert switch.state_uncertain is True
+
+    switch.set_write_coalescing(delay=None)
+    await switch.turn_off()
+    assert mock_client.method_calls[-1] == call.set_value(
+        channel_address="VCU2128127:4", paramset_key="VALUES", parameter="STATE", value=False
+    )
+
+
 @pytest.mark.asyncio
 async def test_generic_wrapped_entity(factory: helper.Factory) -> None:
     """Test wrapped entity."""
     central, _ = await factory.get_default_central(TEST_DEVICES)
     wrapped_entity: HmSensor = cast(HmSensor, central.get_wrapper_entity("VCU3609622:1", "LEVEL"))
     assert wrapped_entity.usage == EntityUsage.ENTITY
+    assert wrapped_entity.parameter == "LEVEL"
+
+
+@pytest.mark.asyncio
+async def test_entity_slots(factory: helper.Factory) -> None:
+    """Test that devices and entities have no instance dict."""
+    central, _ = await factory.get_default_central(TEST_DEVICES)
+    for device in central.devices:
+        assert not hasattr(device, "__dict__")
+        for entity in device.get_all_entities():
+            assert not hasattr(entity, "__dict__")
+        for event in device.generic_events.values():
+            assert not hasattr(event, "__dict__")
+
+
+def test_get_entity_configs() -> None:
+    """Test the indexed lookup of the entity configs."""
+    assert get_entity_configs("HmIP-STHO") == ()
+    assert get_entity_configs("HmIP-STHO-A") == ()
+    assert get_entity_configs("unknown-device") == ()
+    assert get_entity_configs("HmIP-BSM") == get_entity_configs("hmip-bsm")
+    assert get_entity_configs("HB-LC-Sw1PBU-FM") == get_entity_configs("HM-LC-Sw1PBU-FM")
+    assert is_multi_channel_device("HmIP-BSM") is False
+    assert is_multi_channel_device("HmIPW-DRS8") is True
+
+    def _scan_entity_configs(device_type: str) -> list[Any]:
+        """Return the entity configs by scanning all platforms."""
+        device_type = device_type.lower().replace("hb-", "hm-")
+        for platform_blacklisted_devices in ALL_BLACKLISTED_DEVICES:
+            for d_type in platform_blacklisted_devices:
+                if device_type.startswith(d_type.lower()):
+                    return []
+        funcs: list[Any] = []
+        for platform_devices in ALL_DEVICES:
+            for d_type, custom_configs in platform_devices.items():
+                if device_type == d_type.lower():
+                    funcs.append(custom_configs)
+                    break
+            else:
+                for d_type, custom_configs in platform_devices.items():
+                    if device_type.startswith(d_type.lower()):
+                        funcs.append(custom_configs)
+                        break
+        return funcs
+
+    for platform_devices in ALL_DEVICES:
+        for d_type in platform_devices:
+            for device_type in (d_type, d_type.upper(), f"{d_type}-X", d_type[:-1]):
+                assert list(get_entity_configs(device_type)) == _scan_entity_configs(device_type)
+
+
+def test_get_device_group() -> None:
+    """Test the rebased and cached device groups."""
+    group = _get_device_group(EntityDefinition.IP_SWITCH, 4)
+    assert group is _get_device_group(EntityDefinition.IP_SWITCH, 4)
+    assert group[ED_PRIMARY_CHANNEL] == 5
+    assert group[ED_SECONDARY_CHANNELS] == (6, 7)
+    assert list(group[ED_VISIBLE_FIELDS]) == [4]
+    with pytest.raises(TypeError):
+        group[ED_PRIMARY_CHANNEL] = 1  # type: ignore[index]
+
+    base_group = _get_device_group(EntityDefinition.IP_SWITCH, 0)
+    assert base_group[ED_PRIMARY_CHANNEL] == 1
+    assert list(base_group[ED_VISIBLE_FIELDS]) == [0]
 
 
 def test_custom_required_entities() -> None:
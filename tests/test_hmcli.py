@@ -0,0 +1,202 @@
+"""Tests for the hmcli batch mode."""
+from __future__ import annotations
+
+from collections.abc import Generator
+import io
+import socket
+import threading
+from typing import Any
+from xmlrpc.client import ServerProxy
+from xmlrpc.server import SimpleXMLRPCServer
+
+import orjson
+import pytest
+
+from hahomematic.hmcli import parse_operation, run_batch
+
+
+class _Backend:
+    """Backend with values and paramsets."""
+
+    def __init__(self) -> None:
+        """Init the backend."""
+        self.values: dict[tuple[str, str], Any] = {("VCU0000001:0", "RSSI_DEVICE"): -65}
+        self.paramsets: dict[tuple[str, str], dict[str, Any]] = {
+            ("VCU0000001:1", "MASTER"): {"LOCAL_RESET_DISABLED": False}
+        }
+
+    def getValue(self, address: str, parameter: str) -> Any:
+        """Return a value."""
+        return self.values[(address, parameter)]
+
+    def setValue(self, address: str, parameter: str, value: Any) -> str:
+        """Set a value."""
+        self.values[(address, parameter)] = value
+        return ""
+
+    def getParamset(self, address: str, paramset_key: str) -> dict[str, Any]:
+        """Return a paramset."""
+        return self.paramsets[(address, paramset_key)]
+
+    def putParamset(self, address: str, paramset_key: str, paramset: dict[str, Any]) -> str:
+        """Put a paramset."""
+        self.paramsets[(address, paramset_key)].update(paramset)
+        return ""
+
+
+@pytest.fixture
+def backend() -> Generator[tuple[_Backend, str], None, None]:
+    """Return the backend and the url of a local xml rpc server."""
+    server = SimpleXMLRPCServer(("127.0.0.1", 0), logRequests=False, allow_none=True)
+    server.register_multicall_functions()
+    instance = _Backend()
+    server.register_instance(instance)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield instance, f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_parse_operation() -> None:
+    """Test the parsing of batch operations."""
+    assert parse_operation(line="# comment", paramset_key="VALUES", value_type=None) is None
+    assert parse_operation(
+        line="VCU0000001:1 LEVEL 0.5", paramset_key="VALUES", value_type="float"
+    ) == {
+        "address": "VCU0000001:1",
+        "parameter": "LEVEL",
+        "paramset_key": "VALUES",
+        "value": 0.5,
+        "method": "setValue",
+    }
+    assert (
+        parse_operation(
+            line='{"address": "VCU0000001:1", "parameter": "X", "paramset_key": "MASTER"}',
+            paramset_key="VALUES",
+            value_type=None,
+        )["method"]
+        == "getParamset"
+    )
+    with pytest.raises(ValueError):
+        parse_operation(line='{"method": "deleteDevice"}', paramset_key="VALUES", value_type=None)
+    with pytest.raises(ValueError, match="Missing parameter, value for setValue"):
+        parse_operation(
+            line='{"method": "setValue", "address": "VCU0000001:1"}',
+            paramset_key="VALUES",
+            value_type=None,
+        )
+
+
+@pytest.mark.parametrize("concurrency", [1, 2])
+def test_run_batch(backend: tuple[_Backend, str], concurrency: int) -> None:
+    """Test, that the batch operations run with multicalls and stream json lines."""
+    instance, url = backend
+    proxies: list[ServerProxy] = []
+
+    def create_proxy() -> ServerProxy:
+        proxies.append(proxy := ServerProxy(url, allow_none=True))
+        return proxy
+
+    lines = [
+        "VCU0000001:0 RSSI_DEVICE",
+        "VCU0000001:0 UNKNOWN",
+        '{"address": "VCU0000001:1", "parameter": "LOCAL_RESET_DISABLED", '
+        '"paramset_key": "MASTER", "value": true}',
+        '{"address": "VCU0000001:1", "parameter": "LOCAL_RESET_DISABLED", '
+        '"paramset_key": "MASTER"}',
+        '{"address": "VCU0000001:1", "parameter": "LEVEL", "value": 1.0}',
+    ]
+    output = io.StringIO()
+    failed = run_batch(
+        lines=lines,
+        create_proxy=create_proxy,
+        output=output,
+        multicall_size=2,
+        concurrency=concurrency,
+    )
+    results = [orjson.loads(line) for line in output.getvalue().splitlines()]
+    assert failed == 1
+    assert len(proxies) <= concurrency
+    assert results[0] == {
+        "method": "getValue",
+        "address": "VCU0000001:0",
+        "parameter": "RSSI_DEVICE",
+        "result": -65,
+    }
+    assert "error" in results[1]
+    assert instance.values[("VCU0000001:1", "LEVEL")] == 1.0
+    assert instance.paramsets[("VCU0000001:1", "MASTER")]["LOCAL_RESET_DISABLED"] is True
+    # the calls of a multicall run in order
+    assert results[3]["result"] is True
+
+
+def test_run_batch_streams_outputs(backend: tuple[_Backend, str]) -> None:
+    """Test, that outputs are streamed before the end of the input and invalid lines fail."""
+    _, url = backend
+    output = io.StringIO()
+    outputs_before_end: list[str] = []
+
+    def get_lines() -> Generator[str, None, None]:
+        yield "VCU0000001:0"
+        for _ in range(4):
+            yield "VCU0000001:0 RSSI_DEVICE"
+        outputs_before_end.extend(output.getvalue().splitlines())
+        yield "VCU0000001:0 RSSI_DEVICE"
+
+    failed = run_batch(
+        lines=get_lines(),
+        create_proxy=lambda: ServerProxy(url, allow_none=True),
+        output=output,
+        multicall_size=1,
+    )
+    results = [orjson.loads(line) for line in output.getvalue().splitlines()]
+    assert failed == 1
+    assert len(results) == 6
+    assert results[0]["line"] == "VCU0000001:0"
+    assert results[0]["error"].startswith("ValueError")
+    assert all(result["result"] == -65 for result in results[1:])
+    assert 0 < len(outputs_before_end) < len(results)
+
+
+def test_run_batch_missing_keys(backend: tuple[_Backend, str]) -> None:
+    """Test, that only the json lines with missing keys fail."""
+    _, url = backend
+    lines = [
+        "VCU0000001:0 RSSI_DEVICE",
+        '{"address": "VCU0000001:0"}',
+        '{"method": "putParamset", "address": "VCU0000001:1", "paramset_key": "MASTER"}',
+        "VCU0000001:0 RSSI_DEVICE",
+    ]
+    output = io.StringIO()
+    failed = run_batch(
+        lines=lines,
+        create_proxy=lambda: ServerProxy(url, allow_none=True),
+        output=output,
+        multicall_size=4,
+    )
+    results = [orjson.loads(line) for line in output.getvalue().splitlines()]
+    assert failed == 2
+    assert results[1] == {
+        "line": '{"address": "VCU0000001:0"}',
+        "error": "ValueError: Missing parameter for getValue",
+    }
+    assert results[2]["error"] == "ValueError: Missing parameter, value for putParamset"
+    assert results[0]["result"] == results[3]["result"] == -65
+
+
+def test_run_batch_unreachable_backend() -> None:
+    """Test, that all operations fail, if the backend can't be reached."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    output = io.StringIO()
+    failed = run_batch(
+        lines=["VCU0000001:0 RSSI_DEVICE", "VCU0000001:1 LEVEL"],
+        create_proxy=lambda: ServerProxy(f"http://127.0.0.1:{port}", allow_none=True),
+        output=output,
+    )
+    results = [orjson.loads(line) for line in output.getvalue().splitlines()]
+    assert failed == 2
+    assert [result["address"] for result in results] == ["VCU0000001:0", "VCU0000001:1"]
+    assert all(result["error"].startswith("ConnectionRefusedError") for result in results)
@@ -1,11 +1,17 @@
 """Tests for json rpc client of hahomematic."""
 from __future__ import annotations
 
+import asyncio
 import json
+from typing import Any
 
 import orjson
 import pytest
 
+from hahomematic.central import CentralConnectionState
+from hahomematic.client.json_rpc import JsonRpcAioHttpClient, JsonRpcMethod
+from hahomematic.exceptions import InternalBackendException
+
 SUCCESS = '{"HmIP-RF.0001D3C99C3C93%3A0.CONFIG_PENDING":false,\r\n"VirtualDevices.INT0000001%3A1.SET_POINT_TEMPERATURE":4.500000,\r\n"VirtualDevices.INT0000001%3A1.SWITCH_POINT_OCCURED":false,\r\n"VirtualDevices.INT0000001%3A1.VALVE_STATE":4,\r\n"VirtualDevices.INT0000001%3A1.WINDOW_STATE":0,\r\n"HmIP-RF.001F9A49942EC2%3A0.CARRIER_SENSE_LEVEL":10.000000,\r\n"HmIP-RF.0003D7098F5176%3A0.UNREACH":false,\r\n"BidCos-RF.OEQ1860891%3A0.UNREACH":true,\r\n"BidCos-RF.OEQ1860891%3A0.STICKY_UNREACH":true,\r\n"BidCos-RF.OEQ1860891%3A1.INHIBIT":false,\r\n"HmIP-RF.000A570998B3FB%3A0.CONFIG_PENDING":false,\r\n"HmIP-RF.000A570998B3FB%3A0.UPDATE_PENDING":false,\r\n"HmIP-RF.000A5A4991BDDC%3A0.CONFIG_PENDING":false,\r\n"HmIP-RF.000A5A4991BDDC%3A0.UPDATE_PENDING":false,\r\n"BidCos-RF.NEQ1636407%3A1.STATE":0,\r\n"BidCos-RF.NEQ1636407%3A2.STATE":false,\r\n"BidCos-RF.NEQ1636407%3A2.INHIBIT":false,\r\n"CUxD.CUX2800001%3A12.TS":"0"}'
 FAILURE = '{"HmIP-RF.0001D3C99C3C93%3A0.CONFIG_PENDING":false,\r\n"VirtualDevices.INT0000001%3A1.SET_POINT_TEMPERATURE":4.500000,\r\n"VirtualDevices.INT0000001%3A1.SWITCH_POINT_OCCURED":false,\r\n"VirtualDevices.INT0000001%3A1.VALVE_STATE":4,\r\n"VirtualDevices.INT0000001%3A1.WINDOW_STATE":0,\r\n"HmIP-RF.001F9A49942EC2%3A0.CARRIER_SENSE_LEVEL":10.000000,\r\n"HmIP-RF.0003D7098F5176%3A0.UNREACH":false,\r\n,\r\n,\r\n"BidCos-RF.OEQ1860891%3A0.UNREACH":true,\r\n"BidCos-RF.OEQ1860891%3A0.STICKY_UNREACH":true,\r\n"BidCos-RF.OEQ1860891%3A1.INHIBIT":false,\r\n"HmIP-RF.000A570998B3FB%3A0.CONFIG_PENDING":false,\r\n"HmIP-RF.000A570998B3FB%3A0.UPDATE_PENDING":false,\r\n"HmIP-RF.000A5A4991BDDC%3A0.CONFIG_PENDING":false,\r\n"HmIP-RF.000A5A4991BDDC%3A0.UPDATE_PENDING":false,\r\n"BidCos-RF.NEQ1636407%3A1.STATE":0,\r\n"BidCos-RF.NEQ1636407%3A2.STATE":false,\r\n"BidCos-RF.NEQ1636407%3A2.INHIBIT":false,\r\n"CUxD.CUX2800001%3A12.TS":"0"}'
 
@@ -19,3 +25,174 @@ def test_convert_to_json_fails() -> None:
     """Test if convert to json is successful."""
     with pytest.raises(json.JSONDecodeError):
         orjson.loads(FAILURE)
+
+
+# pylint: disable=protected-access
+
+
+class _FakeResponse:
+    """Fake response of the json-rpc api."""
+
+    def __init__(self, result: Any = None, error: str | None = None) -> None:
+        """Init the fake response."""
+        self.status = 200
+        self._json = {"result": result, "error": {"message": error} if error else None}
+
+    async def json(self, encoding: str) -> dict[str, Any]:
+        """Return the json of the response."""
+        return self._json
+
+
+class _FakeBackend:
+    """Fake json-rpc api, that tracks logins and in-flight requests."""
+
+    def __init__(self) -> None:
+        """Init the fake backend."""
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.sessions: list[str] = []
+        self.fail_with: str | None = None
+        self.results: dict[str, Any] = {}
+
+    async def post(self, url: str, data: bytes, **kwargs: Any) -> _FakeResponse:
+        """Handle a request."""
+        request = orjson.loads(data)
+        method = request["method"]
+        self.calls.append(method)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        if method == JsonRpcMethod.SESSION_LOGIN:
+            self.sessions.append(f"session{len(self.sessions)}")
+            return _FakeResponse(result=self.sessions[-1])
+        if method == JsonRpcMethod.SYSTEM_LIST_METHODS:
+            return _FakeResponse(result=[{"name": str(method)} for method in JsonRpcMethod])
+        if request["params"].get("_session_id_") != self.sessions[-1]:
+            return _FakeResponse(error="access denied")
+        if self.fail_with:
+            return _FakeResponse(error=self.fail_with)
+        return _FakeResponse(result=self.results.get(method, True))
+
+
+@pytest.mark.asyncio
+async def test_json_rpc_single_flight_session() -> None:
+    """Test, that concurrent requests share a single session."""
+    backend = _FakeBackend()
+    client = JsonRpcAioHttpClient(
+        username="user",
+        password="pass",
+        device_url="http://127.0.0.1",
+        connection_state=CentralConnectionState(),
+        client_session=backend,  # type: ignore[arg-type]
+        max_concurrent_requests=2,
+    )
+
+    await asyncio.gather(*(client._post(method=JsonRpcMethod.PROGRAM_EXECUTE) for _ in range(6)))
+    assert backend.calls.count(JsonRpcMethod.SESSION_LOGIN) == 1
+    assert backend.calls.count(JsonRpcMethod.PROGRAM_EXECUTE) == 6
+    assert backend.max_in_flight == 2
+
+    # a non auth related failure keeps the session
+    backend.fail_with = "internal error"
+    with pytest.raises(InternalBackendException):
+        await client._post(method=JsonRpcMethod.PROGRAM_EXECUTE)
+    assert client._session_id == "session0"
+    backend.fail_with = None
+
+    # an expired session is replaced, and the request is retried once
+    backend.sessions.append("session1")
+    backend.calls.clear()
+    await client._post(method=JsonRpcMethod.PROGRAM_EXECUTE)
+    assert backend.calls == [
+        JsonRpcMethod.PROGRAM_EXECUTE,
+        JsonRpcMethod.SESSION_LOGIN,
+        JsonRpcMethod.PROGRAM_EXECUTE,
+    ]
+    assert client._session_id == "session2"
+
+
+@pytest.mark.asyncio
+async def test_json_rpc_device_metadata() -> None:
+    """Test the device metadata fetched with one script."""
+    backend = _FakeBackend()
+    client = JsonRpcAioHttpClient(
+        username="user",
+        password="pass",
+        device_url="http://127.0.0.1",
+        connection_state=CentralConnectionState(),
+        client_session=backend,  # type: ignore[arg-type]
+    )
+    backend.results[JsonRpcMethod.REGA_RUN_SCRIPT] = (
+        '[{"id":"1234","address":"VCU0000001","interface":"HmIP-RF","name":"Bad%20Licht",'
+        '"channels":[{"id":"1235","address":"VCU0000001:1","name":"Licht%22oben%22",'
+        '"rooms":["Bad"],"functions":["Licht","Sicherheit"]}]}]'
+    )
+    assert await client.get_device_metadata() == [
+        {
+            "id": "1234",
+            "address": "VCU0000001",
+            "interface": "HmIP-RF",
+            "name": "Bad Licht",
+            "channels": [
+                {
+                    "id": "1235",
+                    "address": "VCU0000001:1",
+                    "name": 'Licht"oben"',
+                    "rooms": ["Bad"],
+                    "functions": ["Licht", "Sicherheit"],
+                }
+            ],
+        }
+    ]
+
+    backend.results[JsonRpcMethod.REGA_RUN_SCRIPT] = "[{"
+    assert await client.get_device_metadata() is None
+
+
+@pytest.mark.asyncio
+async def test_json_rpc_system_variables_delta() -> None:
+    """Test, that unchanged system variables are not parsed again."""
+    backend = _FakeBackend()
+    client = JsonRpcAioHttpClient(
+        username="user",
+        password="pass",
+        device_url="http://127.0.0.1",
+        connection_state=CentralConnectionState(),
+        client_session=backend,  # type: ignore[arg-type]
+    )
+    ext_markers = '[{"id": "1", "hasExtMarker": false}, {"id": "2", "hasExtMarker": true}]'
+    backend.results[JsonRpcMethod.REGA_RUN_SCRIPT] = ext_markers
+
+    def _sysvar(vid: str, name: str, value: str) -> dict[str, Any]:
+        return {
+            "id": vid,
+            "name": name,
+            "type": "NUMBER",
+            "value": value,
+            "unit": "",
+            "isInternal": False,
+        }
+
+    backend.results[JsonRpcMethod.SYSVAR_GET_ALL] = [
+        _sysvar(vid="1", name="sv_a", value="1"),
+        _sysvar(vid="2", name="sv_b", value="2.5"),
+    ]
+    sv_a, sv_b = await client.get_all_system_variables(include_internal=True)
+    assert (sv_a.value, sv_b.value, sv_b.extended_sysvar) == (1, 2.5, True)
+
+    backend.results[JsonRpcMethod.SYSVAR_GET_ALL] = [
+        _sysvar(vid="1", name="sv_a", value="1"),
+        _sysvar(vid="2", name="sv_b", value="3.5"),
+    ]
+    new_sv_a, new_sv_b = await client.get_all_system_variables(include_internal=True)
+    assert new_sv_a is sv_a
+    assert new_sv_b is not sv_b
+    assert new_sv_b.value == 3.5
+
+    backend.results[JsonRpcMethod.SYSVAR_GET_ALL] = [_sysvar(vid="2", name="sv_b", value="3.5")]
+    assert await client.get_all_system_variables(include_internal=True) == [new_sv_b]
+    assert set(client._sysvar_cache) == {"2"}
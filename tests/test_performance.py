@@ -0,0 +1,256 @@
+"""Tests for metrics of hahomematic."""
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+from pathlib import Path
+import time
+from typing import Any
+from unittest.mock import MagicMock
+from xmlrpc.client import DateTime
+
+import pytest
+
+from hahomematic.central.xml_rpc_server import RPCFunctions
+from hahomematic.const import FILE_DEVICES, SystemEvent
+from hahomematic.exceptions import HaHomematicException
+from hahomematic.performance import (
+    CACHE_FILE_BYTES_LOADED,
+    CACHE_REQUESTS,
+    EVENT_DISPATCH_SECONDS,
+    EVENT_RECORDER,
+    EVENT_TRACER,
+    EVENTS_RECEIVED,
+    JSON_RPC_CALL_SECONDS,
+    XML_RPC_CALL_SECONDS,
+    LoopLagMonitor,
+    MetricsRegistry,
+    StartupTimeline,
+    read_event_trace,
+)
+
+from tests import const, helper
+
+TEST_DEVICES: dict[str, str] = {
+    "VCU2128127": "HmIP-BSM.json",
+}
+
+# pylint: disable=protected-access
+
+
+def test_metrics_registry() -> None:
+    """Test the metrics registry."""
+    registry = MetricsRegistry()
+    counter = registry.counter("test_total", "Test counter.", ("interface_id",))
+    assert registry.counter("test_total", "Test counter.", ("interface_id",)) is counter
+    with pytest.raises(HaHomematicException):
+        registry.gauge("test_total", "Test gauge.", ("interface_id",))
+    gauge = registry.gauge("test_depth", "Test gauge.")
+    histogram = registry.histogram("test_seconds", "Test histogram.", ("method",))
+
+    counter.inc('if"1')
+    counter.inc('if"1', amount=2)
+    gauge.set(value=5)
+    histogram.observe("getValue", value=0.001)
+    histogram.observe("getValue", value=0.2)
+    histogram.observe("getValue", value=20)
+    assert counter.get('if"1') == 3.0
+    assert gauge.get() == 5.0
+
+    snapshot = registry.snapshot()
+    assert snapshot["test_total"] == {
+        "type": "counter",
+        "help": "Test counter.",
+        "samples": [{"labels": {"interface_id": 'if"1'}, "value": 3.0}],
+    }
+    histogram_sample = snapshot["test_seconds"]["samples"][0]
+    assert histogram_sample["count"] == 3
+    assert histogram_sample["sum"] == 20.201
+    assert histogram_sample["buckets"]["0.001"] == 1
+    assert histogram_sample["buckets"]["0.25"] == 2
+    assert histogram_sample["buckets"]["+Inf"] == 3
+
+    text = registry.render_prometheus()
+    assert "# TYPE test_total counter\n" in text
+    assert 'test_total{interface_id="if\\"1"} 3.0\n' in text
+    assert "test_depth 5.0\n" in text
+    assert 'test_seconds_bucket{method="getValue",le="0.25"} 2\n' in text
+    assert 'test_seconds_bucket{method="getValue",le="+Inf"} 3\n' in text
+    assert 'test_seconds_count{method="getValue"} 3\n' in text
+
+    registry.clear()
+    assert registry.snapshot()["test_total"]["samples"] == []
+
+
+@pytest.mark.asyncio
+async def test_central_metrics(factory: helper.Factory) -> None:
+    """Test the metrics recorded by the central."""
+    central, _ = await factory.get_default_central(TEST_DEVICES)
+    events_received = EVENTS_RECEIVED.get(const.INTERFACE_ID)
+    dispatch_samples = [
+        sample
+        for sample in EVENT_DISPATCH_SECONDS.get_samples()
+        if sample["labels"]["interface_id"] == const.INTERFACE_ID
+    ]
+    dispatch_count = dispatch_samples[0]["count"] if dispatch_samples else 0
+
+    central.event(const.INTERFACE_ID, "VCU2128127:4", "STATE", 1)
+    assert EVENTS_RECEIVED.get(const.INTERFACE_ID) == events_received + 1
+    dispatch_samples = [
+        sample
+        for sample in EVENT_DISPATCH_SECONDS.get_samples()
+        if sample["labels"]["interface_id"] == const.INTERFACE_ID
+    ]
+    assert dispatch_samples[0]["count"] == dispatch_count + 1
+    assert CACHE_REQUESTS.get("device_data", "miss") > 0
+
+
+@pytest.mark.asyncio
+async def test_event_tracer(factory: helper.Factory) -> None:
+    """Test the tracing of events."""
+    central, _ = await factory.get_default_central(TEST_DEVICES)
+    central.event(const.INTERFACE_ID, "VCU2128127:4", "STATE", 0)
+    assert EVENT_TRACER.get_statistics() == {}
+
+    EVENT_TRACER.enable(max_samples=10)
+    try:
+        for value in (1, 0, 1):
+            token = EVENT_TRACER.start_trace()
+            central.event(const.INTERFACE_ID, "VCU2128127:4", "STATE", value)
+            EVENT_TRACER.end_trace(token=token)
+        statistics = EVENT_TRACER.get_statistics()
+    finally:
+        EVENT_TRACER.disable()
+        EVENT_TRACER.clear()
+
+    assert set(statistics) == {
+        "receive",
+        "routing",
+        "convert_value",
+        "entity_update",
+        "entity_event:HmSwitch.event",
+        "callback:CeSwitch._data_entity_updated",
+        "total",
+    }
+    total = statistics["total"]
+    assert total["count"] == 3
+    assert total["p50"] <= total["p90"] <= total["p99"] <= total["max"]
+
+
+@pytest.mark.asyncio
+async def test_loop_lag_monitor(factory: helper.Factory) -> None:
+    """Test the detection of blocking calls on the event loop."""
+    central, _ = await factory.get_default_central(TEST_DEVICES)
+    monitor = LoopLagMonitor(name="test", interval=0.01, blocking_threshold=0.05)
+    block_loop = partial(_block_loop, monitor)
+    central.register_system_event_callback(block_loop)
+    monitor.start()
+    assert monitor.is_running is True
+    await asyncio.sleep(0.05)
+    central.fire_system_event_callback(system_event=SystemEvent.HUB_REFRESHED)
+    await asyncio.sleep(0.05)
+    await monitor.stop()
+    assert monitor.is_running is False
+    central.unregister_system_event_callback(block_loop)
+
+    assert monitor.max_lag >= 0.05
+    assert len(monitor.reports) == 1
+    report = monitor.reports[0]
+    assert report.blocked_seconds >= 0.05
+    assert report.call_site.startswith("hahomematic/central/__init__.py:")
+    assert report.call_site.endswith("in fire_system_event_callback")
+    assert any("_block_loop" in frame for frame in report.stack)
+
+
+@pytest.mark.asyncio
+async def test_event_recorder(factory: helper.Factory, tmp_path: Path) -> None:
+    """Test the recording of events into a trace file."""
+    central, _ = await factory.get_default_central(TEST_DEVICES)
+    rpc_functions = RPCFunctions(xml_rpc_server=MagicMock(get_central=lambda _: central))
+    rpc_functions.event(const.INTERFACE_ID, "VCU2128127:4", "STATE", 1)
+
+    trace_path = str(tmp_path / "events.trace")
+    EVENT_RECORDER.start(path=trace_path)
+    assert EVENT_RECORDER.enabled is True
+    with pytest.raises(HaHomematicException):
+        EVENT_RECORDER.start(path=trace_path)
+    rpc_functions.event(const.INTERFACE_ID, "VCU2128127:4", "STATE", 0)
+    rpc_functions.event(const.INTERFACE_ID, "VCU2128127:0", "RSSI_DEVICE", -61.5)
+    rpc_functions.event(
+        const.INTERFACE_ID, "VCU2128127:0", "TIMESTAMP", DateTime("20261019T08:00:00")
+    )
+    assert EVENT_RECORDER.stop() == 3
+    assert EVENT_RECORDER.enabled is False
+    rpc_functions.event(const.INTERFACE_ID, "VCU2128127:4", "STATE", 1)
+
+    events = read_event_trace(trace_path)
+    assert [event[1:] for event in events] == [
+        (const.INTERFACE_ID, "VCU2128127:4", "STATE", 0),
+        (const.INTERFACE_ID, "VCU2128127:0", "RSSI_DEVICE", -61.5),
+        (const.INTERFACE_ID, "VCU2128127:0", "TIMESTAMP", "20261019T08:00:00"),
+    ]
+    assert 0 <= events[0][0] <= events[1][0]
+
+
+def test_startup_timeline() -> None:
+    """Test the phases of the startup timeline."""
+    created = [0, 0]
+    timeline = StartupTimeline(
+        name="timeline",
+        interface_ids=("timeline-BidCos-RF",),
+        get_created_counts=lambda: tuple(created),
+    )
+    XML_RPC_CALL_SECONDS.observe("other-BidCos-RF", "listDevices", value=0.01)
+    with timeline.phase("create_clients"):
+        XML_RPC_CALL_SECONDS.observe("timeline-BidCos-RF", "init", value=0.01)
+        XML_RPC_CALL_SECONDS.observe("other-BidCos-RF", "init", value=0.01)
+        # centrals with the name as prefix are not counted
+        XML_RPC_CALL_SECONDS.observe("timeline-test-BidCos-RF", "init", value=0.01)
+        JSON_RPC_CALL_SECONDS.observe("Session.login", value=0.01)
+    with timeline.phase("load_caches"):
+        CACHE_FILE_BYTES_LOADED.inc(f"timeline_{FILE_DEVICES}", amount=100)
+        CACHE_FILE_BYTES_LOADED.inc(f"other_{FILE_DEVICES}", amount=50)
+        CACHE_FILE_BYTES_LOADED.inc(f"timeline_2_{FILE_DEVICES}", amount=25)
+    with timeline.phase("create_devices"):
+        created[:] = [2, 10]
+
+    create_clients, load_caches, create_devices = timeline.phases
+    assert create_clients.xml_rpc_calls == {"init": 1}
+    assert create_clients.json_rpc_calls == {"Session.login": 1}
+    assert load_caches.xml_rpc_calls == {}
+    assert load_caches.cache_bytes_loaded == 100
+    assert create_devices.devices_created == 2
+    assert create_devices.entities_created == 10
+    assert create_devices.entities_per_second > 0
+
+    report = timeline.get_report()
+    assert report["name"] == "timeline"
+    assert report["devices"] == 2
+    assert report["entities"] == 10
+    assert [phase["name"] for phase in report["phases"]] == [
+        "create_clients",
+        "load_caches",
+        "create_devices",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_central_startup_report(factory: helper.Factory) -> None:
+    """Test the startup report of the central."""
+    central, _ = await factory.get_default_central(TEST_DEVICES)
+    report = central.startup_report
+    assert report is not None
+    assert [phase["name"] for phase in report["phases"]] == [
+        "load_parameter_visibility",
+        "create_clients",
+        "refresh_device_descriptions",
+    ]
+    assert report["seconds"] >= sum(phase["seconds"] for phase in report["phases"])
+    factory.system_event_mock.assert_any_call(SystemEvent.STARTUP_REPORT, report=report)
+
+
+def _block_loop(monitor: LoopLagMonitor, *args: Any, **kwargs: Any) -> None:
+    """Block the event loop, until the monitor has reported the blocking."""
+    deadline = time.monotonic() + 10
+    while not monitor.reports and time.monotonic() < deadline:
+        time.sleep(0.01)
@@ -0,0 +1,87 @@
+"""Tests for the command scheduler of hahomematic."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from hahomematic.client.scheduler import CommandScheduler
+from hahomematic.const import CommandPriority
+
+# pylint: disable=protected-access
+
+
+@pytest.mark.asyncio
+async def test_command_priority() -> None:
+    """Test that interactive commands are not blocked by background commands."""
+    scheduler = CommandScheduler(interface_id="test", max_concurrency=2)
+    executed: list[str] = []
+    release_background = asyncio.Event()
+
+    async def command(name: str, wait: bool = False) -> str:
+        executed.append(name)
+        if wait:
+            await release_background.wait()
+        return name
+
+    background = [
+        asyncio.create_task(
+            scheduler.run(CommandPriority.BACKGROUND, command, f"background_{no}", True)
+        )
+        for no in range(3)
+    ]
+    await asyncio.sleep(0)
+    # one slot is reserved for interactive commands
+    assert executed == ["background_0"]
+    assert scheduler.running_commands == 1
+    assert scheduler.pending_commands == 2
+
+    event = asyncio.create_task(scheduler.run(CommandPriority.EVENT, command, "event"))
+    assert await scheduler.run(CommandPriority.INTERACTIVE, command, "interactive") == (
+        "interactive"
+    )
+    assert executed == ["background_0", "interactive"]
+
+    release_background.set()
+    await asyncio.gather(event, *background)
+    assert executed == ["background_0", "interactive", "event", "background_1", "background_2"]
+    assert scheduler.running_commands == 0
+    assert scheduler.pending_commands == 0
+
+
+@pytest.mark.asyncio
+async def test_command_cancel() -> None:
+    """Test that cancelled commands release their slot."""
+    scheduler = CommandScheduler(interface_id="test", max_concurrency=1)
+    release = asyncio.Event()
+
+    async def command() -> None:
+        await release.wait()
+
+    first = asyncio.create_task(scheduler.run(CommandPriority.BACKGROUND, command))
+    second = asyncio.create_task(scheduler.run(CommandPriority.BACKGROUND, command))
+    await asyncio.sleep(0)
+    second.cancel()
+    release.set()
+    await first
+    with pytest.raises(asyncio.CancelledError):
+        await second
+    assert scheduler.running_commands == 0
+    assert await scheduler.run(CommandPriority.INTERACTIVE, asyncio.sleep, 0, "done") == "done"
+
+
+def test_duty_cycle_level() -> None:
+    """Test the throttling of background commands by the duty cycle level."""
+    scheduler = CommandScheduler(interface_id="test", max_concurrency=2)
+    assert scheduler.duty_cycle_level is None
+    assert scheduler.is_throttled is False
+    scheduler.set_duty_cycle_level(level=30.0)
+    assert scheduler.is_throttled is False
+    scheduler.set_duty_cycle_level(level=80.0)
+    assert scheduler.is_throttled is True
+    assert scheduler._token_bucket._rate == 5.0
+    scheduler.set_duty_cycle_level(level=100.0)
+    assert scheduler._token_bucket._rate == 0.5
+    scheduler.set_duty_cycle_level(level=10.0)
+    assert scheduler.duty_cycle_level == 10.0
+    assert scheduler.is_throttled is False
@@ -1,6 +1,7 @@
 """Tests for switch entities of hahomematic."""
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
@@ -17,10 +18,12 @@ from hahomematic.platforms.support import (
     get_device_name,
     get_entity_name,
     get_event_name,
+    get_value_converter,
 )
 from hahomematic.support import (
     build_headers,
     build_xml_rpc_uri,
+    cancel_task,
     check_or_create_directory,
     check_password,
     element_matches_key,
@@ -314,6 +317,30 @@ async def test_convert_value() -> None:
     assert convert_value(value="test", target_type=ParameterType.STRING, value_list=None) == "test"
     assert convert_value(value="1", target_type=ParameterType.STRING, value_list=None) == "1"
     assert convert_value(value=True, target_type=ParameterType.ACTION, value_list=None) is True
+    assert (
+        convert_value(value="OPEN", target_type=ParameterType.BOOL, value_list=("CLOSED", "OPEN"))
+        is True
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_value_converter() -> None:
+    """Test get_value_converter."""
+    bool_converter = get_value_converter(target_type=ParameterType.BOOL, value_list=None)
+    assert bool_converter(None) is None
+    assert bool_converter(1) is True
+    assert bool_converter("off") is False
+    enum_bool_converter = get_value_converter(
+        target_type=ParameterType.BOOL, value_list=("CLOSED", "OPEN")
+    )
+    assert enum_bool_converter(0) is False
+    assert enum_bool_converter("OPEN") is True
+    with pytest.raises(ValueError):
+        enum_bool_converter("UNKNOWN")
+    assert get_value_converter(target_type=ParameterType.FLOAT, value_list=None)("1") == 1.0
+    assert get_value_converter(target_type=ParameterType.INTEGER, value_list=None)("1.7") == 1
+    assert get_value_converter(target_type=ParameterType.STRING, value_list=None)(1) == "1"
+    assert get_value_converter(target_type=ParameterType.ENUM, value_list=("A", "B"))(1) == 1
 
 
 @pytest.mark.asyncio
@@ -414,3 +441,34 @@ def test_password() -> None:
     assert check_password("test123TEST") is True
     assert check_password("test.!$():;#-") is True
     assert check_password("test%") is False
+
+
+@pytest.mark.asyncio
+async def test_cancel_task() -> None:
+    """Test, that cancel_task doesn't suppress the cancellation of the caller."""
+    task = asyncio.create_task(asyncio.sleep(10))
+    await cancel_task(task)
+    assert task.cancelled() is True
+
+    cleanup_started = asyncio.Event()
+
+    async def slow_cleanup() -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cleanup_started.set()
+            await asyncio.sleep(10)
+            raise
+
+    async def stop() -> None:
+        task = asyncio.create_task(slow_cleanup())
+        await asyncio.sleep(0)
+        await cancel_task(task)
+
+    # the caller of cancel_task is cancelled, while the task cleans up
+    stopper = asyncio.create_task(stop())
+    await cleanup_started.wait()
+    stopper.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await stopper
+    assert stopper.cancelled() is True